@@ -8,19 +8,29 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 
-from src.data_loader import load_data
-from src.returns import compute_log_returns
-from src.volatility import rolling_annualized_vol
+from src.cache import (
+    cached_panel,
+    cached_returns,
+    cached_vol,
+    cached_signal,
+    cached_portfolio_momentum,
+    cached_vol_grid
+)
 from src.vol_targeting import compute_vol_target_exposure
-from src.momentum import compute_momentum_signal
 from src.metrics import compute_cagr, compute_sharpe, compute_max_drawdown
-from src.grid import run_vol_grid
-from src.portfolio_momentum import run_portfolio_momentum
+from src.analytics import rolling_performance, subperiod_metrics
+
 
+START = "2018-01-01"
+END = "2025-01-01"
+PORTFOLIO_ASSETS = (("BTC", "BTC-USD"), ("SPY", "SPY"), ("GLD", "GLD"))
 
 st.set_page_config(layout="wide")
 st.title("Alpha-Risk Portfolio Dashboard")
 
+# Download every ticker concurrently up front; later loads read the store
+cached_panel(tuple(ticker for _, ticker in PORTFOLIO_ASSETS), START, END)
+
 # =============================
 # Sidebar
 # =============================
@@ -40,11 +50,10 @@ target_vol = st.sidebar.slider("Target Vol", 0.1, 0.7, 0.3, step=0.05)
 
 if asset != "Portfolio":
 
-    prices = load_data(asset, "2018-01-01", "2025-01-01")
-    returns = compute_log_returns(prices)
+    returns = cached_returns(asset, START, END)
 
-    signal = compute_momentum_signal(prices, lookback=lookback).shift(1)
-    vol = rolling_annualized_vol(returns, window=vol_window)
+    signal = cached_signal(asset, START, END, lookback).shift(1)
+    vol = cached_vol(asset, START, END, vol_window)
     exposure = compute_vol_target_exposure(vol, target_vol=target_vol).shift(1)
 
     combined_exposure = signal * exposure
@@ -57,27 +66,20 @@ if asset != "Portfolio":
 
 else:
 
-    price_dict = {
-        "BTC": load_data("BTC-USD", "2018-01-01", "2025-01-01"),
-        "SPY": load_data("SPY", "2018-01-01", "2025-01-01"),
-        "GLD": load_data("GLD", "2018-01-01", "2025-01-01"),
-    }
-
-    returns_dict = {
-        a: compute_log_returns(price_dict[a])
-        for a in price_dict
-    }
-
-    strategy_returns, equity, _, exposures = run_portfolio_momentum(
-        price_dict,
-        returns_dict,
+    strategy_returns, equity, _, exposures = cached_portfolio_momentum(
+        PORTFOLIO_ASSETS,
+        START,
+        END,
         vol_window=vol_window,
         target_vol=target_vol,
         lookback=lookback
     )
 
     # Portfolio Buy & Hold
-    bh_returns = pd.concat(returns_dict.values(), axis=1).mean(axis=1)
+    bh_returns = pd.concat(
+        [cached_returns(ticker, START, END) for _, ticker in PORTFOLIO_ASSETS],
+        axis=1
+    ).mean(axis=1)
     bh_equity = (1 + bh_returns).cumprod()
 
     combined_exposure = None  # not single series
@@ -149,18 +151,8 @@ if asset != "Portfolio":
 st.subheader("Rolling 12M Sharpe")
 rolling_window = 252
 
-rolling_mean = strategy_returns.rolling(
-    window=rolling_window,
-    min_periods=200
-).mean()
-
-rolling_std = strategy_returns.rolling(
-    window=rolling_window,
-    min_periods=200
-).std()
-
-rolling_sharpe = (rolling_mean / rolling_std) * (252 ** 0.5)
-
+rolling = rolling_performance(strategy_returns, window=rolling_window, min_periods=200)
+rolling_sharpe = rolling["sharpe"]
 
 fig_rs = go.Figure()
 fig_rs.add_trace(go.Scatter(
@@ -174,47 +166,21 @@ st.plotly_chart(fig_rs, width='stretch')
 
 st.subheader("Subperiod Performance")
 
-def compute_subperiod_metrics(returns, equity, start, end):
-    mask = (returns.index >= start) & (returns.index < end)
-
-    sub_returns = returns.loc[mask]
-    sub_equity = equity.loc[mask]
-
-    if len(sub_returns) < 50:
-        return None
-
-    return {
-        "CAGR": compute_cagr(sub_equity),
-        "Sharpe": compute_sharpe(sub_returns),
-        "MaxDD": compute_max_drawdown(sub_equity)
-    }
-
-
 periods = [
-    ("2018-01-01", "2020-01-01"),
-    ("2020-01-01", "2022-01-01"),
-    ("2022-01-01", "2025-01-01"),
+    ("2018–2020", "2018-01-01", "2020-01-01"),
+    ("2020–2022", "2020-01-01", "2022-01-01"),
+    ("2022–2025", "2022-01-01", "2025-01-01"),
 ]
 
-rows = []
+# Every period from one set of prefix sums, CAGR on the rebased equity
+subperiods = subperiod_metrics(strategy_returns, periods, min_periods=50).dropna(subset=["sharpe"])
 
-for start, end in periods:
-    metrics = compute_subperiod_metrics(
-        strategy_returns,
-        equity,
-        pd.to_datetime(start),
-        pd.to_datetime(end)
-    )
-
-    if metrics:
-        rows.append({
-            "Period": f"{start[:4]}–{end[:4]}",
-            "CAGR": f"{metrics['CAGR']:.2%}",
-            "Sharpe": f"{metrics['Sharpe']:.2f}",
-            "MaxDD": f"{metrics['MaxDD']:.2%}"
-        })
-
-df_sub = pd.DataFrame(rows)
+df_sub = pd.DataFrame({
+    "Period": subperiods["period"],
+    "CAGR": subperiods["cagr"].map("{:.2%}".format),
+    "Sharpe": subperiods["sharpe"].map("{:.2f}".format),
+    "MaxDD": subperiods["max_dd"].map("{:.2%}".format)
+})
 
 st.dataframe(df_sub, width='stretch')
 
@@ -225,16 +191,12 @@ st.dataframe(df_sub, width='stretch')
 
 st.subheader("Vol Target Grid Sharpe Heatmap")
 
-assets = {
-    "BTC": compute_log_returns(load_data("BTC-USD", "2018-01-01", "2025-01-01")),
-    "SPY": compute_log_returns(load_data("SPY", "2018-01-01", "2025-01-01")),
-    "GLD": compute_log_returns(load_data("GLD", "2018-01-01", "2025-01-01")),
-}
-
-grid_results = run_vol_grid(
-    returns_dict=assets,
-    vol_windows=[20, 30, 60],
-    target_vols=[0.3, 0.5, 0.7]
+grid_results = cached_vol_grid(
+    PORTFOLIO_ASSETS,
+    START,
+    END,
+    vol_windows=(20, 30, 60),
+    target_vols=(0.3, 0.5, 0.7)
 )
 
 pivot = grid_results.pivot(
@@ -0,0 +1,63 @@
+"""
+EWMA volatility benchmark: vectorized kernel vs the per-row .iloc loop.
+
+python benchmarks/bench_ewma.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+
+from src.ewma import compute_ewma_vol
+
+
+N_ROWS = 1_000_000
+LOOP_ROWS = 20_000
+
+
+def legacy_ewma_vol(returns, lambda_=0.94, trading_days=252):
+    var = pd.Series(index=returns.index, dtype=float)
+    var.iloc[0] = returns.iloc[0] ** 2
+
+    for t in range(1, len(returns)):
+        var.iloc[t] = (
+            lambda_ * var.iloc[t-1]
+            + (1 - lambda_) * returns.iloc[t] ** 2
+        )
+
+    return np.sqrt(var) * np.sqrt(trading_days)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("1900-01-01", periods=N_ROWS, freq="h")
+    returns = pd.Series(rng.normal(0, 0.01, N_ROWS), index=index)
+
+    # The loop is too slow for 1M rows; time a prefix and scale linearly
+    legacy, loop_time = timed(legacy_ewma_vol, returns.iloc[:LOOP_ROWS])
+    loop_estimate = loop_time * N_ROWS / LOOP_ROWS
+
+    vol, kernel_time = timed(compute_ewma_vol, returns)
+    max_rel_err = np.max(np.abs(vol.iloc[:LOOP_ROWS] - legacy) / legacy)
+
+    lambdas = [0.90, 0.94, 0.97, 0.99]
+    _, multi_time = timed(compute_ewma_vol, returns, lambdas)
+
+    print(f"rows:                      {N_ROWS:,}")
+    print(f"legacy loop (estimated):   {loop_estimate:10.3f} s")
+    print(f"vectorized kernel:         {kernel_time:10.3f} s")
+    print(f"speedup:                   {loop_estimate / kernel_time:10.0f}x")
+    print(f"{len(lambdas)} lambdas in one call:    {multi_time:10.3f} s")
+    print(f"max relative error:        {max_rel_err:10.2e}")
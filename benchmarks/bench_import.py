@@ -0,0 +1,57 @@
+"""
+Import-time benchmark: fresh-interpreter startup cost of the package.
+
+python benchmarks/bench_import.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPEATS = 5
+
+STATEMENTS = {
+    "baseline (pandas)": "import pandas",
+    "import src": "import src",
+    "src.data_loader": "import src.data_loader",
+    "src.sweep": "import src.sweep",
+    "from src import load_data, run_vol_grid": "from src import load_data, run_vol_grid",
+}
+
+HEAVY = ["yfinance", "pyarrow", "plotly", "streamlit"]
+
+
+def time_statement(statement):
+    # Report which heavy modules the statement pulled in
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings), result.stdout.strip()
+
+
+if __name__ == "__main__":
+
+    print(f"{'statement':45s} {'median s':>9s}  heavy modules loaded")
+
+    for label, statement in STATEMENTS.items():
+        elapsed, heavy = time_statement(statement)
+        print(f"{label:45s} {elapsed:9.3f}  {heavy or '-'}")
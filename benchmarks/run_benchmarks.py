@@ -0,0 +1,308 @@
+"""
+Benchmark suite for the src hot paths, on synthetic data (offline).
+
+python benchmarks/run_benchmarks.py                  # default sizes
+python benchmarks/run_benchmarks.py --size full      # up to 10M rows / 5k assets
+python benchmarks/run_benchmarks.py --filter grid --baseline 1a268ba
+
+Every run is appended to benchmarks/results/history.jsonl with the current
+commit. Timings are compared against the run of the nearest earlier
+commit in git history on the same machine (or ``--baseline``) and
+slowdowns beyond ``--threshold`` are flagged as regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from synthetic import synthetic_returns, synthetic_universe
+
+
+HISTORY = os.path.join(ROOT, "benchmarks", "results", "history.jsonl")
+
+SIZES = {
+    "quick": {"rows": [1_000], "assets": [1, 100]},
+    "default": {"rows": [1_000, 100_000], "assets": [1, 100]},
+    "full": {"rows": [1_000, 100_000, 10_000_000], "assets": [1, 100, 5_000]},
+}
+
+# Multi-asset cases run on ten years of daily bars
+PANEL_ROWS = 2_520
+
+VOL_WINDOWS = [20, 30, 60]
+TARGET_VOLS = [0.2, 0.3, 0.5]
+
+BOOTSTRAP_PATHS = 1_000
+
+
+# =========================
+# Cases
+# =========================
+
+def case_ewma_vol(rows):
+    from src.ewma import compute_ewma_vol
+
+    returns = synthetic_returns(rows)
+    return lambda: compute_ewma_vol(returns)
+
+
+def case_rolling_vol(rows):
+    from src.volatility import rolling_annualized_vol
+
+    returns = synthetic_returns(rows)
+    return lambda: rolling_annualized_vol(returns, window=30)
+
+
+def case_multi_window_vol(rows):
+    from src.volatility import multi_window_vol
+
+    returns = synthetic_returns(rows)
+    return lambda: multi_window_vol(returns, VOL_WINDOWS)
+
+
+def case_resample_bars(rows):
+    from src.bars import resample_bars
+
+    prices = np.exp(synthetic_returns(rows).cumsum()).to_frame("close")
+    return lambda: resample_bars(prices, "1h", chunk_rows=100_000)
+
+
+def case_metrics(rows):
+    from src.metrics import compute_all_metrics
+
+    returns = synthetic_returns(rows).to_numpy()
+    return lambda: compute_all_metrics(returns)
+
+
+def case_bootstrap(rows):
+    from src.bootstrap import bootstrap_metrics
+
+    returns = synthetic_returns(rows).to_numpy()
+    return lambda: bootstrap_metrics(returns, n_paths=BOOTSTRAP_PATHS)
+
+
+def case_metrics_panel(assets):
+    from src.metrics import compute_all_metrics
+
+    returns = np.asarray(synthetic_returns(PANEL_ROWS, assets)).reshape(PANEL_ROWS, -1)
+    return lambda: compute_all_metrics(returns)
+
+
+def case_equal_weight_portfolio(assets):
+    from src.portfolio import equal_weight_portfolio
+
+    _, returns = synthetic_universe(PANEL_ROWS, assets)
+    return lambda: equal_weight_portfolio(returns)
+
+
+def case_run_portfolio_momentum(assets):
+    from src.portfolio_momentum import run_portfolio_momentum
+
+    prices, returns = synthetic_universe(PANEL_ROWS, assets)
+    return lambda: run_portfolio_momentum(prices, returns)
+
+
+def case_run_vol_grid(assets):
+    from src.grid import run_vol_grid
+
+    _, returns = synthetic_universe(PANEL_ROWS, assets)
+    return lambda: run_vol_grid(returns, VOL_WINDOWS, TARGET_VOLS)
+
+
+def case_run_vol_grid_compact(assets):
+    from src.grid import run_vol_grid
+
+    _, returns = synthetic_universe(PANEL_ROWS, assets)
+    return lambda: run_vol_grid(returns, VOL_WINDOWS, TARGET_VOLS, dtype="float32")
+
+
+# (name, size axis, setup)
+CASES = [
+    ("ewma_vol", "rows", case_ewma_vol),
+    ("rolling_vol", "rows", case_rolling_vol),
+    ("multi_window_vol", "rows", case_multi_window_vol),
+    ("resample_bars", "rows", case_resample_bars),
+    ("metrics", "rows", case_metrics),
+    ("bootstrap", "rows", case_bootstrap),
+    ("metrics_panel", "assets", case_metrics_panel),
+    ("equal_weight_portfolio", "assets", case_equal_weight_portfolio),
+    ("run_portfolio_momentum", "assets", case_run_portfolio_momentum),
+    ("run_vol_grid", "assets", case_run_vol_grid),
+    ("run_vol_grid_compact", "assets", case_run_vol_grid_compact),
+]
+
+
+# =========================
+# Timing and history
+# =========================
+
+def measure(func, min_time=0.2, max_repeats=10):
+    """
+    Best-of-N wall time, repeating until ``min_time`` has been spent.
+    """
+    timings = []
+
+    while len(timings) < max_repeats and sum(timings) < min_time:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), len(timings)
+
+
+def git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def git_revision():
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+
+    return commit, dirty
+
+
+def git_ancestors():
+    """
+    Full hashes of the commits before HEAD, nearest first.
+    """
+    return git("rev-list", "HEAD").split()[1:]
+
+
+def load_history():
+    if not os.path.exists(HISTORY):
+        return []
+
+    with open(HISTORY, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_history(records):
+    os.makedirs(os.path.dirname(HISTORY), exist_ok=True)
+
+    with open(HISTORY, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def baseline_timings(history, commit, machine, baseline=None, ancestors=()):
+    """
+    ``{case: seconds}`` of the runs to compare against.
+
+    By default every case takes its run from the nearest commit before
+    ``commit`` in git history (``ancestors``, nearest first); runs of
+    later or unrelated commits, e.g. a branch benchmarked earlier, are
+    ignored. ``baseline`` picks a commit (prefix) instead. The latest run
+    of the chosen commit wins.
+    """
+    def distance(record_commit):
+        for k, full in enumerate(ancestors):
+            if full.startswith(record_commit):
+                return k
+        return None
+
+    distances = {}
+    chosen = {}
+
+    for record in history:
+        if record["machine"] != machine:
+            continue
+
+        if baseline is not None:
+            if not record["commit"].startswith(baseline):
+                continue
+            rank = 0
+        else:
+            if record["commit"] not in distances:
+                distances[record["commit"]] = distance(record["commit"])
+            rank = distances[record["commit"]]
+            if rank is None:
+                continue
+
+        case = record["case"]
+        if case not in chosen or rank <= chosen[case][0]:
+            chosen[case] = (rank, record["seconds"])
+
+    return {case: seconds for case, (_, seconds) in chosen.items()}
+
+
+# =========================
+# Main
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the src hot paths on synthetic data.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="default")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--baseline", help="commit to compare against (default: nearest ancestor with a run)")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio flagged as a regression (default 1.25)")
+    parser.add_argument("--no-save", action="store_true", help="don't append to the history")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if any case regressed")
+    args = parser.parse_args(argv)
+
+    commit, dirty = git_revision()
+    machine = platform.node()
+    baseline = baseline_timings(
+        load_history(), commit, machine, args.baseline, ancestors=git_ancestors()
+    )
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    print(f"commit {commit}{' (dirty)' if dirty else ''}, size '{args.size}'\n")
+    print(f"{'case':40s} {'best s':>10s} {'runs':>5s} {'vs base':>8s}")
+
+    records = []
+    regressions = []
+
+    for name, axis, setup in CASES:
+        for size in SIZES[args.size][axis]:
+            case = f"{name}[{axis}={size}]"
+            if args.filter not in case:
+                continue
+
+            seconds, repeats = measure(setup(size))
+
+            ratio = seconds / baseline[case] if case in baseline else None
+            flag = ""
+            if ratio is not None and ratio > args.threshold:
+                flag = "  REGRESSION"
+                regressions.append(case)
+
+            ratio_text = f"{ratio:7.2f}x" if ratio is not None else f"{'-':>8s}"
+            print(f"{case:40s} {seconds:10.4f} {repeats:5d} {ratio_text}{flag}")
+
+            records.append({
+                "commit": commit,
+                "dirty": dirty,
+                "timestamp": timestamp,
+                "machine": machine,
+                "case": case,
+                "seconds": seconds,
+                "repeats": repeats
+            })
+
+    if not args.no_save:
+        save_history(records)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}x: "
+              + ", ".join(regressions))
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Vol-regime research engine.
+
+The public API is importable from the package top level, e.g.
+``from src import load_data, run_vol_grid``. Each name is resolved on
+first access, so importing ``src`` only loads the modules actually used
+and heavy optional dependencies (yfinance, pyarrow) are deferred until a
+function needs them.
+"""
+
+import importlib
+
+
+_EXPORTS = {
+    "load_data": "src.data_loader",
+    "load_many": "src.data_loader",
+    "get_default_store": "src.data_loader",
+    "set_default_store": "src.data_loader",
+    "YFinanceProvider": "src.data_loader",
+    "PriceStore": "src.price_store",
+    "LocalFileProvider": "src.price_store",
+    "HTTPProvider": "src.price_store",
+    "compute_log_returns": "src.returns",
+    "rolling_annualized_vol": "src.volatility",
+    "multi_window_vol": "src.volatility",
+    "rolling_stats": "src.rolling",
+    "rolling_sharpe": "src.rolling",
+    "subperiod_metrics": "src.analytics",
+    "rolling_performance": "src.analytics",
+    "bootstrap_indices": "src.bootstrap",
+    "bootstrap_metrics": "src.bootstrap",
+    "confidence_intervals": "src.bootstrap",
+    "compact_panel": "src.compact",
+    "sweep_tolerance": "src.compact",
+    "ResultStore": "src.result_store",
+    "fingerprint": "src.result_store",
+    "iter_window_paths": "src.sweep",
+    "periods_per_year": "src.frequency",
+    "resample_bars": "src.bars",
+    "iter_resample": "src.bars",
+    "realized_vol": "src.bars",
+    "daily_realized_vol": "src.bars",
+    "compute_ewma_vol": "src.ewma",
+    "ewma_variance": "src.ewma",
+    "compute_z_score": "src.regime",
+    "classify_regime": "src.regime",
+    "map_exposure": "src.strategy",
+    "compute_vol_target_exposure": "src.vol_targeting",
+    "compute_momentum_signal": "src.momentum",
+    "compute_equity_curve": "src.backtest",
+    "equal_weight_portfolio": "src.portfolio",
+    "run_portfolio_momentum": "src.portfolio_momentum",
+    "run_panel_momentum": "src.portfolio_momentum",
+    "run_vol_grid": "src.grid",
+    "run_sweep": "src.sweep",
+    "iter_sweep": "src.sweep",
+    "Panel": "src.panel",
+    "Calendar": "src.alignment",
+    "align_series": "src.alignment",
+    "create_panel": "src.panel_store",
+    "open_panel": "src.panel_store",
+    "save_panel": "src.panel_store",
+    "iter_blocks": "src.panel_store",
+    "map_blocks": "src.panel_store",
+    "run_blocked_momentum": "src.portfolio_momentum",
+    "compute_cagr": "src.metrics",
+    "compute_annualized_vol": "src.metrics",
+    "compute_sharpe": "src.metrics",
+    "compute_max_drawdown": "src.metrics",
+    "compute_calmar": "src.metrics",
+    "compute_all_metrics": "src.metrics",
+    "compute_turnover": "src.turnover",
+    "annualized_turnover": "src.turnover",
+    "CostModel": "src.turnover",
+    "turnover_matrix": "src.turnover",
+    "apply_costs": "src.turnover",
+    "cost_sensitivity": "src.turnover",
+    "profile": "src.profiling",
+    "instrument": "src.profiling",
+    "Profiler": "src.profiling",
+    "RollingVol": "src.streaming",
+    "EWMAVol": "src.streaming",
+    "MomentumSignal": "src.streaming",
+    "RunningZScore": "src.streaming",
+    "RollingZScore": "src.streaming",
+    "LiveMomentumVolTarget": "src.streaming",
+    "LiveRegimeVolTarget": "src.streaming",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,210 @@
+# src/alignment.py
+
+from dataclasses import dataclass
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from src.panel import Panel
+
+
+POLICIES = ("union", "intersection", "trading")
+
+
+@dataclass
+class Calendar:
+    """
+    Master calendar plus every asset's row positions on it.
+
+    Built once from the asset date indexes; placing data on the calendar
+    afterwards is integer scatter/gather instead of re-hashing
+    DatetimeIndexes at every step.
+
+    ``positions[asset][k]`` is the master row of the asset's k-th date,
+    or -1 if that date is not on the calendar.
+    """
+
+    index: pd.DatetimeIndex
+    positions: dict
+    policy: str = "union"
+
+    @classmethod
+    def build(cls, indexes: dict, policy: str = "union", trading_calendar=None) -> "Calendar":
+        """
+        Master calendar of ``{asset: DatetimeIndex}`` under a policy.
+
+        Policies:
+        union        → every date any asset trades on
+        intersection → dates all assets trade on
+        trading      → ``trading_calendar``: a DatetimeIndex (e.g.
+                       ``pd.bdate_range``) or the name of the asset whose
+                       dates to use (e.g. "SPY")
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}.")
+
+        indexes = {asset: pd.DatetimeIndex(index) for asset, index in indexes.items()}
+
+        if policy == "trading":
+            if trading_calendar is None:
+                raise ValueError("The trading policy needs a trading_calendar.")
+            if isinstance(trading_calendar, str):
+                trading_calendar = indexes[trading_calendar]
+            master = pd.DatetimeIndex(trading_calendar)
+        elif _sorted_naive(indexes.values()):
+            stamps = [_stamps(index) for index in indexes.values()]
+            if policy == "union":
+                values = np.unique(np.concatenate(stamps))
+            else:
+                values = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), stamps)
+            master = pd.DatetimeIndex(values.view("M8[ns]"), name=_common_name(indexes.values()))
+        else:
+            combine = "union" if policy == "union" else "intersection"
+            master = reduce(lambda a, b: getattr(a, combine)(b), indexes.values())
+
+        return cls(
+            master,
+            {asset: _positions(master, index) for asset, index in indexes.items()},
+            policy
+        )
+
+    def panel(self, series_dict: dict, fill: str | None = None, keep_nan: bool = False) -> Panel:
+        """
+        Place ``{asset: pd.Series}`` on the calendar as one Panel.
+
+        ``fill="ffill"`` carries each asset's last value over the calendar
+        dates it does not trade on (masked as entries too). ``keep_nan``
+        masks every date a series lists, NaN values included, so they stay
+        on the asset's calendar (as ``shift`` / ``rolling`` on the Series
+        would count them).
+        """
+        columns = list(series_dict)
+        values = np.full((len(self.index), len(columns)), np.nan)
+        mask = np.zeros(values.shape, dtype=bool)
+
+        for j, asset in enumerate(columns):
+            data = series_dict[asset].to_numpy(dtype=float)
+            positions = self.positions[asset]
+            on_calendar = positions >= 0
+
+            if fill == "ffill":
+                # Master row -> position of the asset's latest date so far
+                latest = np.full(len(self.index), -1)
+                latest[positions[on_calendar]] = np.flatnonzero(on_calendar)
+                latest = np.maximum.accumulate(latest)
+
+                found = latest >= 0
+                values[found, j] = data[latest[found]]
+                mask[:, j] = found
+            else:
+                values[positions[on_calendar], j] = data[on_calendar]
+                mask[positions[on_calendar], j] = True
+
+        if not keep_nan:
+            mask &= ~np.isnan(values)
+
+        return Panel(values, self.index, columns, mask)
+
+
+def align_series(
+    series_dict: dict,
+    policy: str = "union",
+    fill=None,
+    trading_calendar=None,
+    keep_nan: bool = False
+) -> Panel:
+    """
+    Build the calendar of ``series_dict`` and place it on it in one go.
+    """
+    calendar = Calendar.build(
+        {asset: series.index for asset, series in series_dict.items()},
+        policy=policy,
+        trading_calendar=trading_calendar
+    )
+
+    return calendar.panel(series_dict, fill=fill, keep_nan=keep_nan)
+
+
+def inner_join(left: pd.Series, right: pd.Series):
+    """
+    Values of two series on their common dates (``align(join="inner")``).
+
+    Returns
+    -------
+    left_values, right_values : np.ndarray
+    index : pd.DatetimeIndex
+    """
+    if left.index.equals(right.index):
+        return left.to_numpy(), right.to_numpy(), left.index
+
+    if not _sorted_naive([left.index, right.index]):
+        left, right = left.align(right, join="inner")
+        return left.to_numpy(), right.to_numpy(), left.index
+
+    _, left_pos, right_pos = np.intersect1d(
+        _stamps(left.index), _stamps(right.index), assume_unique=True, return_indices=True
+    )
+
+    return left.to_numpy()[left_pos], right.to_numpy()[right_pos], left.index[left_pos]
+
+
+def multiply(left: pd.Series, right: pd.Series, dropna: bool = False) -> pd.Series:
+    """
+    ``left * right`` on the common dates, optionally without NaN products.
+    """
+    left_values, right_values, index = inner_join(left, right)
+    product = left_values * right_values
+
+    if dropna:
+        keep = ~np.isnan(product)
+        product, index = product[keep], index[keep]
+
+    return pd.Series(product, index=index, name=_common_name([left, right]))
+
+
+def lag(series: pd.Series, periods: int = 1) -> pd.Series:
+    """
+    ``series.shift(periods).dropna()`` as one slice on the series' dates.
+    """
+    values = series.to_numpy()[:len(series) - periods]
+    if values.dtype.kind in "iub":
+        # shift() turns integer / bool data into float to hold its NaNs
+        values = values.astype(float)
+
+    index = series.index[periods:]
+    keep = ~pd.isna(values)
+
+    return pd.Series(values[keep], index=index[keep], name=series.name)
+
+
+def _stamps(index: pd.DatetimeIndex) -> np.ndarray:
+    return index.as_unit("ns").asi8
+
+
+def _sorted_naive(indexes) -> bool:
+    return all(
+        index.tz is None and index.is_monotonic_increasing and index.is_unique
+        for index in indexes
+    )
+
+
+def _positions(master: pd.DatetimeIndex, index: pd.DatetimeIndex) -> np.ndarray:
+    if not _sorted_naive([master, index]):
+        return master.get_indexer(index)
+
+    stamps = _stamps(master)
+    if len(stamps) == 0:
+        return np.full(len(index), -1)
+
+    # Dates past the end land on the last row, which cannot match them
+    positions = np.minimum(np.searchsorted(stamps, _stamps(index)), len(stamps) - 1)
+    found = stamps[positions] == _stamps(index)
+
+    return np.where(found, positions, -1)
+
+
+def _common_name(objects):
+    names = {obj.name for obj in objects}
+
+    return names.pop() if len(names) == 1 else None
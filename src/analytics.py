@@ -0,0 +1,241 @@
+# src/analytics.py
+
+import numpy as np
+import pandas as pd
+
+from src.rolling import prefix_sums, range_sums
+
+
+# Drawdowns of many periods are computed on a (periods x longest period)
+# matrix, built in chunks of at most this many cells
+MAX_CELLS = 2 ** 22
+
+COLUMNS = ["rows", "total_return", "cagr", "vol", "sharpe", "max_dd", "hit_rate"]
+
+
+def performance_prefix(returns: pd.Series) -> dict:
+    """
+    Prefix arrays from which any period's performance follows.
+
+    NaN returns are skipped by the moments and leave the equity flat, like
+    ``returns.mean()`` / ``(1 + returns).cumprod()``. Counts, moments, log
+    growth and wins are blocked prefix sums (see
+    ``src.rolling.prefix_sums``), so period sums stay accurate on long
+    series.
+
+    Returns
+    -------
+    dict
+        ``prefix_sums`` of the returns (with log_growth and wins), plus
+        index, valid and log_equity (T,) after each row
+    """
+    r = returns.to_numpy(dtype=float)
+    valid = ~np.isnan(r)
+    log_growth = np.log1p(np.where(valid, r, 0.0))
+
+    prefix = prefix_sums(r, extra={"log_growth": log_growth, "wins": r > 0})
+    prefix.update({
+        "index": returns.index,
+        "valid": valid,
+        "log_equity": np.cumsum(log_growth)
+    })
+
+    return prefix
+
+
+def period_metrics(
+    prefix: dict,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    trading_days: int = 252,
+    min_periods: int = 2
+) -> pd.DataFrame:
+    """
+    Metrics of the row ranges ``[starts[k], ends[k])``, all at once.
+
+    Sums and log growth come from blocked range sums; CAGR and total
+    return use the equity rebased to 1 at the start of each range. Ranges
+    with fewer than ``min_periods`` valid returns are NaN.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+
+    def window(name):
+        return range_sums(prefix, name, starts, ends)[:, 0]
+
+    rows = ends - starts
+    n = window("count")
+
+    total = window("sum")
+    squares = window("sum_sq")
+    growth = window("log_growth")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / n
+        std = np.sqrt(np.maximum(squares - total * mean, 0.0) / (n - 1))
+
+        metrics = pd.DataFrame({
+            "rows": rows,
+            "total_return": np.expm1(growth),
+            "cagr": np.expm1(growth * trading_days / rows),
+            "vol": std * np.sqrt(trading_days),
+            "sharpe": (mean + prefix["shift"][0]) / std * np.sqrt(trading_days),
+            "max_dd": _max_drawdowns(prefix, starts, ends),
+            "hit_rate": window("wins") / n
+        })
+
+    metrics.loc[n < max(min_periods, 2), COLUMNS[1:]] = np.nan
+
+    return metrics
+
+
+def _max_drawdowns(prefix, starts, ends):
+    # Worst fall of log equity below its running peak inside each range
+    log_equity = np.where(prefix["valid"], prefix["log_equity"], -np.inf)
+    drawdowns = np.zeros(len(starts))
+
+    if len(log_equity) == 0 or len(starts) == 0:
+        return drawdowns
+
+    longest = max(int((ends - starts).max()), 1)
+    chunk = max(MAX_CELLS // longest, 1)
+    offsets = np.arange(longest)
+
+    for lo in range(0, len(starts), chunk):
+        block = slice(lo, lo + chunk)
+        rows = starts[block, None] + offsets
+        inside = rows < ends[block, None]
+
+        values = np.where(inside, log_equity[np.minimum(rows, len(log_equity) - 1)], -np.inf)
+        peaks = np.maximum.accumulate(values, axis=1)
+
+        with np.errstate(invalid="ignore"):
+            falls = np.where(np.isfinite(values), values - peaks, 0.0)
+
+        drawdowns[block] = falls.min(axis=1)
+
+    return np.expm1(drawdowns)
+
+
+def period_rows(index: pd.DatetimeIndex, periods):
+    """
+    Row ranges of ``periods`` on ``index``.
+
+    ``periods`` is one of:
+    "Y" / "Q" / "M" (any pandas period alias) → calendar periods
+    pd.Series of labels on ``index``           → spells of equal labels,
+                                                 e.g. regime spells
+    list of (start, end) or (label, start, end) → custom date ranges,
+                                                 ``[start, end)``, None
+                                                 for an open end
+
+    Returns
+    -------
+    labels : list
+    starts, ends : np.ndarray
+        Row ranges ``[start, end)``
+    """
+    if isinstance(periods, str):
+        periods = pd.Series(index.to_period(periods).astype(str), index=index)
+
+    if isinstance(periods, pd.Series):
+        labels = periods.reindex(index).to_numpy()
+        codes = pd.factorize(labels)[0]
+        changes = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        starts = np.concatenate([[0], changes]) if len(labels) else np.array([], dtype=np.int64)
+        ends = np.concatenate([changes, [len(labels)]]) if len(labels) else starts
+
+        return list(labels[starts]), starts, ends
+
+    labels, bounds = [], []
+    for period in periods:
+        label, start, end = period if len(period) == 3 else (f"{period[0]} – {period[1]}", *period)
+        labels.append(label)
+        bounds.append((start, end))
+
+    def rows(dates, default):
+        known = [date is not None for date in dates]
+        positions = np.full(len(dates), default, dtype=np.int64)
+        if any(known):
+            stamps = pd.DatetimeIndex([date for date in dates if date is not None])
+            positions[known] = index.searchsorted(stamps, side="left")
+
+        return positions
+
+    starts = rows([start for start, _ in bounds], 0)
+    ends = rows([end for _, end in bounds], len(index))
+
+    return labels, starts, np.maximum(ends, starts)
+
+
+def subperiod_metrics(
+    returns: pd.Series,
+    periods,
+    trading_days: int = 252,
+    min_periods: int = 2
+) -> pd.DataFrame:
+    """
+    Performance of many subperiods from one set of prefix arrays.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Strategy returns on a sorted DatetimeIndex
+    periods : str, pd.Series or list
+        See ``period_rows`` (calendar periods, label spells, date ranges)
+    trading_days : int
+        Annualization factor (default 252)
+    min_periods : int
+        Minimum valid returns for a period's metrics
+
+    Returns
+    -------
+    pd.DataFrame
+        period, start, end (first / last date) and rows, total_return,
+        cagr, vol, sharpe, max_dd, hit_rate per period
+    """
+    labels, starts, ends = period_rows(returns.index, periods)
+    prefix = performance_prefix(returns)
+
+    metrics = period_metrics(prefix, starts, ends, trading_days, min_periods)
+
+    dates = returns.index
+    nonempty = ends > starts
+    first = pd.Series(pd.NaT, index=metrics.index, dtype=object)
+    last = first.copy()
+    first[nonempty] = dates[starts[nonempty]]
+    last[nonempty] = dates[ends[nonempty] - 1]
+
+    metrics.insert(0, "end", pd.to_datetime(last))
+    metrics.insert(0, "start", pd.to_datetime(first))
+    metrics.insert(0, "period", labels)
+
+    return metrics
+
+
+def rolling_performance(
+    returns: pd.Series,
+    window: int = 252,
+    min_periods: int | None = None,
+    trading_days: int = 252
+) -> pd.DataFrame:
+    """
+    Rolling Sharpe, vol, CAGR, drawdown and hit rate over the trailing
+    ``window`` rows, in one pass over the prefix arrays.
+
+    Each row covers ``[t + 1 - window, t + 1)`` like ``returns.rolling``;
+    rows with fewer than ``min_periods`` (default ``window``) valid
+    returns are NaN.
+    """
+    prefix = performance_prefix(returns)
+
+    ends = np.arange(1, len(returns) + 1)
+    starts = np.maximum(ends - window, 0)
+
+    metrics = period_metrics(
+        prefix, starts, ends, trading_days,
+        min_periods=window if min_periods is None else min_periods
+    )
+    metrics.index = returns.index
+
+    return metrics.drop(columns="total_return")
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from src.alignment import multiply
+
 
 def compute_equity_curve(
     returns: pd.Series,
@@ -10,9 +12,7 @@ def compute_equity_curve(
     Compute equity curve from returns and exposure.
     """
 
-    aligned_returns, aligned_exposure = returns.align(exposure, join="inner")
-
-    strategy_returns = aligned_returns * aligned_exposure
+    strategy_returns = multiply(returns, exposure)
 
     equity = (1 + strategy_returns).cumprod()
     equity.name = "equity_curve"
@@ -0,0 +1,234 @@
+# src/bars.py
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.frequency import annualization
+from src.profiling import instrument
+
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume", "count", "rv"]
+
+ESTIMATORS = ("rv", "parkinson", "garman_klass")
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def iter_chunks(path, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """
+    Read a time-sorted CSV or Parquet file of ticks / bars in chunks.
+
+    The first column (or the Parquet index) holds the timestamps; prices
+    are in ``close`` / ``price`` (plus optional ``open``, ``high``, ``low``,
+    ``volume``). Only one chunk is in memory at a time.
+    """
+    path = Path(path)
+
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            chunk = batch.to_pandas()
+            if not isinstance(chunk.index, pd.DatetimeIndex):
+                chunk = chunk.set_index(chunk.columns[0])
+            chunk.index = pd.DatetimeIndex(chunk.index)
+            yield chunk
+        return
+
+    for chunk in pd.read_csv(path, index_col=0, parse_dates=True, chunksize=chunk_rows):
+        chunk.index = pd.DatetimeIndex(chunk.index)
+        yield chunk
+
+
+def _columns(chunk: pd.DataFrame):
+    columns = {name.lower(): name for name in chunk.columns}
+    price_name = columns.get("close", columns.get("price", chunk.columns[0]))
+    close = chunk[price_name].to_numpy(dtype=float)
+
+    def column(name, default):
+        return chunk[columns[name]].to_numpy(dtype=float) if name in columns else default
+
+    return (
+        column("open", close),
+        column("high", close),
+        column("low", close),
+        close,
+        column("volume", np.zeros(len(close)))
+    )
+
+
+def _aggregate(chunk: pd.DataFrame, rule: str, previous):
+    # Bars of one chunk. ``previous`` = (bar label, close, timestamp) of
+    # the row before the chunk, so the return across the chunk boundary
+    # counts towards the realized variance of a bar spanning both chunks
+    stamps = chunk.index.asi8
+    previous_label, previous_close, previous_stamp = previous
+
+    if np.any(np.diff(stamps) < 0) or (previous_stamp is not None and stamps[0] < previous_stamp):
+        raise ValueError("Ticks / bars must be sorted by time.")
+
+    opens, highs, lows, closes, volumes = _columns(chunk)
+    # Floored in local time for tz-aware input, as int64 UTC nanoseconds
+    labels = chunk.index.floor(rule).asi8
+
+    log_close = np.log(closes)
+    returns = np.empty(len(closes))
+    returns[1:] = np.diff(log_close)
+    same_bar = np.empty(len(closes), dtype=bool)
+    same_bar[1:] = labels[1:] == labels[:-1]
+
+    same_bar[0] = previous_label == labels[0]
+    returns[0] = log_close[0] - np.log(previous_close) if same_bar[0] else 0.0
+
+    squared = np.where(same_bar, returns, 0.0) ** 2
+
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)]
+
+    bars = pd.DataFrame({
+        "open": opens[starts],
+        "high": np.maximum.reduceat(highs, starts),
+        "low": np.minimum.reduceat(lows, starts),
+        "close": closes[ends - 1],
+        "volume": np.add.reduceat(volumes, starts),
+        "count": ends - starts,
+        "rv": np.add.reduceat(squared, starts)
+    }, index=_label_index(labels[starts], chunk.index.tz))
+
+    return bars, (labels[-1], closes[-1], stamps[-1])
+
+
+def _label_index(labels: np.ndarray, tz) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(labels.view("M8[ns]"))
+    if tz is None:
+        return index
+
+    return index.tz_localize("UTC").tz_convert(tz)
+
+
+def _combine(carry: pd.DataFrame, first: pd.DataFrame) -> pd.DataFrame:
+    # One bar split across two chunks
+    return pd.DataFrame({
+        "open": carry["open"].to_numpy(),
+        "high": np.maximum(carry["high"].to_numpy(), first["high"].to_numpy()),
+        "low": np.minimum(carry["low"].to_numpy(), first["low"].to_numpy()),
+        "close": first["close"].to_numpy(),
+        "volume": carry["volume"].to_numpy() + first["volume"].to_numpy(),
+        "count": carry["count"].to_numpy() + first["count"].to_numpy(),
+        "rv": carry["rv"].to_numpy() + first["rv"].to_numpy()
+    }, index=carry.index)
+
+
+def iter_resample(chunks, rule: str = "1h"):
+    """
+    Stream OHLC bars of ``rule`` (e.g. "5min", "1h", "1D") from
+    time-sorted chunks of ticks or finer bars.
+
+    Each finished bar is yielded once; only the bar still open at the end
+    of a chunk is carried over, so memory is bounded by one chunk.
+
+    Yields
+    ------
+    pd.DataFrame
+        open, high, low, close, volume, count (source rows) and rv (sum
+        of squared log returns between consecutive source closes inside
+        the bar), indexed by bar start (in the timezone of the chunks)
+    """
+    carry = None
+    previous = (None, np.nan, None)
+
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+
+        bars, previous_next = _aggregate(chunk, rule, previous)
+        previous = previous_next
+
+        if carry is not None:
+            if bars.index[0] == carry.index[0]:
+                bars = pd.concat([_combine(carry, bars.iloc[:1]), bars.iloc[1:]])
+            else:
+                bars = pd.concat([carry, bars])
+
+        carry = bars.iloc[-1:]
+        if len(bars) > 1:
+            yield bars.iloc[:-1]
+
+    if carry is not None:
+        yield carry
+
+
+@instrument
+def resample_bars(source, rule: str = "1h", chunk_rows: int = DEFAULT_CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Resample ticks / bars to ``rule`` bars, streaming from disk.
+
+    ``source`` is a CSV / Parquet path (read ``chunk_rows`` at a time), a
+    DataFrame or an iterable of DataFrame chunks. See ``iter_resample``.
+    """
+    if isinstance(source, (str, Path)):
+        chunks = iter_chunks(source, chunk_rows)
+    elif isinstance(source, pd.DataFrame):
+        chunks = (source.iloc[a:a + chunk_rows] for a in range(0, len(source), chunk_rows))
+    else:
+        chunks = source
+
+    parts = list(iter_resample(chunks, rule))
+    if not parts:
+        return pd.DataFrame(columns=BAR_COLUMNS, index=pd.DatetimeIndex([]))
+
+    return pd.concat(parts)
+
+
+def realized_vol(bars: pd.DataFrame, estimator: str = "rv", periods_per_year=None) -> pd.Series:
+    """
+    Annualized realized volatility of every bar (e.g. every day).
+
+    Estimators (per bar variance):
+    rv           → sum of squared intraday returns (``rv`` column of
+                   ``resample_bars``)
+    parkinson    → ln(H/L)² / (4 ln 2)
+    garman_klass → ½ ln(H/L)² − (2 ln 2 − 1) ln(C/O)²
+
+    ``periods_per_year`` defaults to the bar frequency (252 or 365 for
+    daily bars).
+    """
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"estimator must be one of {ESTIMATORS}.")
+
+    if estimator == "rv":
+        var = bars["rv"].to_numpy(dtype=float)
+    else:
+        high_low = np.log(bars["high"].to_numpy(dtype=float) / bars["low"].to_numpy(dtype=float)) ** 2
+
+        if estimator == "parkinson":
+            var = high_low / (4 * np.log(2))
+        else:
+            close_open = np.log(bars["close"].to_numpy(dtype=float) / bars["open"].to_numpy(dtype=float)) ** 2
+            var = 0.5 * high_low - (2 * np.log(2) - 1) * close_open
+
+    factor = annualization(periods_per_year, bars.index)
+
+    return pd.Series(np.sqrt(np.maximum(var, 0.0) * factor), index=bars.index, name=f"{estimator}_vol")
+
+
+@instrument
+def daily_realized_vol(
+    source,
+    estimators=ESTIMATORS,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    days_per_year=None
+) -> pd.DataFrame:
+    """
+    Daily annualized realized vol of intraday data, one column per
+    estimator, in one streaming pass over ``source`` (see
+    ``resample_bars``).
+    """
+    days = resample_bars(source, "1D", chunk_rows)
+
+    return pd.DataFrame({
+        estimator: realized_vol(days, estimator, days_per_year)
+        for estimator in estimators
+    })
@@ -0,0 +1,183 @@
+# src/bootstrap.py
+
+import numpy as np
+import pandas as pd
+
+from src.frequency import annualization
+from src.metrics import compute_all_metrics
+from src.parallel import imap_shared
+from src.profiling import instrument
+
+
+METHODS = ("stationary", "block", "iid")
+
+
+def bootstrap_indices(
+    n_rows: int,
+    n_paths: int,
+    method: str = "stationary",
+    block_size: float = 20,
+    rng=None
+) -> np.ndarray:
+    """
+    Row indices of ``n_paths`` resampled paths, shape (paths x T).
+
+    Methods (blocks wrap around the end of the sample):
+    stationary → blocks of geometric length with mean ``block_size``
+                 (Politis-Romano), so paths stay stationary
+    block      → moving blocks of exactly ``block_size`` rows
+    iid        → independent rows, no serial dependence kept
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}.")
+
+    if method != "iid" and block_size < 1:
+        raise ValueError("block_size must be at least 1.")
+
+    rng = np.random.default_rng(rng)
+
+    if method == "iid":
+        return rng.integers(0, n_rows, (n_paths, n_rows))
+
+    if method == "block":
+        size = int(block_size)
+        n_blocks = -(-n_rows // size)
+        starts = rng.integers(0, n_rows, (n_paths, n_blocks, 1))
+        rows = (starts + np.arange(size)).reshape(n_paths, -1)[:, :n_rows]
+        return rows % n_rows
+
+    # A new block starts with probability 1 / block_size at every row;
+    # other rows continue the block of the latest start
+    new_block = rng.random((n_paths, n_rows)) < 1.0 / block_size
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_rows, (n_paths, n_rows))
+
+    steps = np.arange(n_rows)
+    latest = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    rows = np.take_along_axis(starts, latest, axis=1) + (steps - latest)
+
+    return rows % n_rows
+
+
+def _bootstrap_chunk(arrays, task):
+    returns = arrays["returns"]
+
+    rows = bootstrap_indices(
+        len(returns),
+        task["paths"],
+        method=task["method"],
+        block_size=task["block_size"],
+        rng=task["seed"]
+    )
+
+    # (T x paths), one strategy per column for the batched metrics
+    metrics = compute_all_metrics(returns[rows.T], trading_days=task["trading_days"])
+
+    return pd.DataFrame(metrics)
+
+
+@instrument
+def bootstrap_metrics(
+    returns,
+    n_paths: int = 10_000,
+    method: str = "stationary",
+    block_size: float = 20,
+    seed: int | None = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = 1,
+    trading_days: int = 252
+) -> pd.DataFrame:
+    """
+    Metrics of ``n_paths`` bootstrap resamples of a return series.
+
+    Paths are drawn ``chunk_size`` at a time (one (paths x T) index array
+    per chunk) and scored with ``compute_all_metrics`` as one batch, so
+    memory stays bounded by the chunk. Every chunk gets its own seed
+    spawned from ``seed``: for a given ``chunk_size`` the draws are the
+    same with any number of ``workers``.
+
+    Parameters
+    ----------
+    returns : pd.Series or np.ndarray
+        Strategy returns (NaNs are dropped)
+    n_paths : int
+        Number of resampled paths
+    method : str
+        "stationary", "block" or "iid", see ``bootstrap_indices``
+    block_size : float
+        (Mean) block length in rows
+    seed : int, optional
+        Seed of the random draws
+    chunk_size : int
+        Paths per batch
+    workers : int, optional
+        Processes (default 1, ``None`` uses every core)
+    trading_days : int, optional
+        Annualization factor (default 252, ``None`` infers it from the
+        index of ``returns``, see ``src.frequency``)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per path: cagr, vol, sharpe, max_dd, calmar, sortino,
+        hit_rate
+    """
+    trading_days = annualization(trading_days, getattr(returns, "index", None))
+
+    r = np.asarray(returns, dtype=float)
+    r = r[~np.isnan(r)]
+
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    tasks = [
+        {
+            "paths": size,
+            "seed": chunk_seed,
+            "method": method,
+            "block_size": block_size,
+            "trading_days": trading_days
+        }
+        for size, chunk_seed in zip(sizes, seeds)
+    ]
+
+    chunks = list(imap_shared(_bootstrap_chunk, tasks, {"returns": r}, workers=workers))
+    if not chunks:
+        return pd.DataFrame()
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def confidence_intervals(samples: pd.DataFrame, point=None, level: float = 0.9) -> pd.DataFrame:
+    """
+    Percentile intervals of bootstrap metric samples.
+
+    Parameters
+    ----------
+    samples : pd.DataFrame
+        Output of ``bootstrap_metrics``
+    point : dict, optional
+        Point estimates (e.g. ``compute_all_metrics(returns)``) to show
+        alongside
+    level : float
+        Two-sided coverage (default 0.9 → 5th / 95th percentiles)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per metric: point, mean, std, lower, upper
+    """
+    tail = (1 - level) / 2
+    values = samples.to_numpy(dtype=float)
+
+    intervals = pd.DataFrame({
+        "mean": np.nanmean(values, axis=0),
+        "std": np.nanstd(values, axis=0, ddof=1),
+        "lower": np.nanquantile(values, tail, axis=0),
+        "upper": np.nanquantile(values, 1 - tail, axis=0)
+    }, index=samples.columns)
+
+    if point is not None:
+        intervals.insert(0, "point", [point.get(name, np.nan) for name in samples.columns])
+
+    return intervals
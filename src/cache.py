@@ -0,0 +1,103 @@
+from functools import lru_cache
+
+from src.data_loader import load_data, load_many
+from src.returns import compute_log_returns
+from src.volatility import rolling_annualized_vol
+from src.momentum import compute_momentum_signal
+from src.grid import run_vol_grid
+from src.portfolio_momentum import run_portfolio_momentum
+
+
+# Memoized building blocks keyed on (ticker, date range, parameters).
+# Entries live for the whole process, so Streamlit reruns reuse them;
+# each function evicts its least recently used results beyond maxsize.
+# Returned objects are shared between callers and must not be mutated.
+
+
+@lru_cache(maxsize=32)
+def cached_prices(ticker: str, start: str, end: str):
+    return load_data(ticker, start, end)
+
+
+@lru_cache(maxsize=8)
+def cached_panel(tickers: tuple, start: str, end: str):
+    """
+    ``load_many`` over ``tickers``: downloads them concurrently and warms
+    the price store for ``cached_prices``.
+    """
+    return load_many(list(tickers), start, end)
+
+
+@lru_cache(maxsize=32)
+def cached_returns(ticker: str, start: str, end: str):
+    return compute_log_returns(cached_prices(ticker, start, end))
+
+
+@lru_cache(maxsize=256)
+def cached_vol(ticker: str, start: str, end: str, window: int):
+    return rolling_annualized_vol(cached_returns(ticker, start, end), window=window)
+
+
+@lru_cache(maxsize=256)
+def cached_signal(ticker: str, start: str, end: str, lookback: int):
+    return compute_momentum_signal(cached_prices(ticker, start, end), lookback=lookback)
+
+
+@lru_cache(maxsize=64)
+def cached_portfolio_momentum(
+    assets: tuple,
+    start: str,
+    end: str,
+    vol_window: int,
+    target_vol: float,
+    lookback: int
+):
+    """
+    ``run_portfolio_momentum`` over ``assets = ((name, ticker), ...)``.
+    """
+    price_dict = {name: cached_prices(ticker, start, end) for name, ticker in assets}
+    returns_dict = {name: cached_returns(ticker, start, end) for name, ticker in assets}
+
+    return run_portfolio_momentum(
+        price_dict,
+        returns_dict,
+        vol_window=vol_window,
+        target_vol=target_vol,
+        lookback=lookback
+    )
+
+
+@lru_cache(maxsize=16)
+def cached_vol_grid(
+    assets: tuple,
+    start: str,
+    end: str,
+    vol_windows: tuple,
+    target_vols: tuple
+):
+    """
+    ``run_vol_grid`` over ``assets = ((name, ticker), ...)``.
+    """
+    returns_dict = {name: cached_returns(ticker, start, end) for name, ticker in assets}
+
+    return run_vol_grid(
+        returns_dict=returns_dict,
+        vol_windows=list(vol_windows),
+        target_vols=list(target_vols)
+    )
+
+
+def clear_cache() -> None:
+    """
+    Drop every memoized result (e.g. after the price store was refreshed).
+    """
+    for func in (
+        cached_prices,
+        cached_panel,
+        cached_returns,
+        cached_vol,
+        cached_signal,
+        cached_portfolio_momentum,
+        cached_vol_grid
+    ):
+        func.cache_clear()
@@ -0,0 +1,56 @@
+# src/compact.py
+
+import numpy as np
+import pandas as pd
+
+from src.panel import Panel
+from src.sweep import run_sweep
+
+
+COMPACT_DTYPE = np.float32
+
+METRICS = ["cagr", "sharpe", "max_dd"]
+
+
+def compact_panel(panel: Panel, dtype=COMPACT_DTYPE) -> Panel:
+    """
+    The panel with ``dtype`` values, sharing its index, columns and mask.
+    """
+    return Panel(panel.values.astype(dtype, copy=False), panel.index, panel.columns, panel.mask)
+
+
+def sweep_tolerance(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    dtype=COMPACT_DTYPE,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    Error of a compact ``run_sweep`` against the float64 one.
+
+    Runs the grid twice (float64 and ``dtype``, same parameters) and
+    compares every grid point.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per metric: max_abs_error, max_rel_error
+    """
+    exact = run_sweep(returns, vol_windows, target_vols, **kwargs)
+    compact = run_sweep(returns, vol_windows, target_vols, dtype=dtype, **kwargs)
+
+    errors = {}
+    for metric in METRICS:
+        reference = exact[metric].to_numpy()
+        error = np.abs(compact[metric].to_numpy() - reference)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = error / np.abs(reference)
+
+        errors[metric] = {
+            "max_abs_error": np.nanmax(error, initial=0.0),
+            "max_rel_error": np.nanmax(relative[np.isfinite(relative)], initial=0.0)
+        }
+
+    return pd.DataFrame(errors).T
@@ -1,13 +1,155 @@
 # src/data_loader.py
 
-import yfinance as yf
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pandas as pd
 
+from src.alignment import align_series
+from src.panel import Panel
+from src.price_store import PriceStore, LocalFileProvider, HTTPProvider
+from src.profiling import instrument
+
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parents[1] / "data" / "prices"
+
+_default_store = None
+
+# yf.download resets and reads module globals on every call, so
+# concurrent calls can drop or swap tickers: one download at a time
+_yfinance_lock = threading.Lock()
+
+
+class YFinanceProvider:
+    """
+    Download daily close prices from Yahoo Finance.
+    """
+
+    def fetch(self, ticker: str, start: str, end: str) -> pd.Series:
+        # yfinance (and its requests/curl_cffi stack) is only needed here
+        import yfinance as yf
+
+        with _yfinance_lock:
+            data = yf.download(ticker, start=start, end=end, progress=False)
+
+        if data.empty:
+            return pd.Series(dtype=float, name=ticker)
+
+        if isinstance(data.columns, pd.MultiIndex):
+            close = data["Close"][ticker]
+        else:
+            close = data["Close"]
+
+        close = close.dropna()
+        close.name = ticker
+
+        return close
+
+    def fetch_many(self, tickers: list, start: str, end: str) -> dict:
+        """
+        Download several tickers in one request: ``{ticker: pd.Series}``.
+
+        yfinance fetches the tickers of the batch on its own threads.
+        Tickers whose download failed are left out (so ``load_many``
+        requests them again); a range without prices gives empty series.
+        """
+        import yfinance as yf
+
+        with _yfinance_lock:
+            data = yf.download(
+                tickers, start=start, end=end, progress=False, threads=True
+            )
+            failed = set(getattr(yf.shared, "_ERRORS", {}))
+
+        if data.empty:
+            return {ticker: pd.Series(dtype=float, name=ticker) for ticker in tickers}
+
+        close = data["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(tickers[0])
+
+        return {
+            ticker: close[ticker].dropna().rename(ticker)
+            for ticker in tickers
+            if ticker in close.columns and ticker not in failed
+        }
+
+
+class RateLimiter:
+    """
+    Thread-safe limit of ``per_second`` request starts (None = unlimited).
+    """
+
+    def __init__(self, per_second: float | None = None):
+        self.interval = 1 / per_second if per_second else 0.0
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+
+        time.sleep(start - now)
+
+
+def get_default_store() -> PriceStore:
+    """
+    Return the price store used by ``load_data``.
+
+    The store lives in ``VOL_REGIME_DATA_DIR`` (default ``data/prices``).
+    If ``VOL_REGIME_OFFLINE_DIR`` is set, prices are served from the
+    CSV/Parquet fixtures in that directory and no network call is made;
+    ``VOL_REGIME_PRICE_URL`` fetches CSVs from an HTTP server instead of
+    Yahoo Finance.
+    """
+    global _default_store
+
+    if _default_store is None:
+        root = os.environ.get("VOL_REGIME_DATA_DIR", DEFAULT_STORE_DIR)
+        offline_dir = os.environ.get("VOL_REGIME_OFFLINE_DIR")
+        price_url = os.environ.get("VOL_REGIME_PRICE_URL")
+
+        if offline_dir:
+            provider = LocalFileProvider(offline_dir)
+        elif price_url:
+            provider = HTTPProvider(price_url)
+        else:
+            provider = YFinanceProvider()
+
+        _default_store = PriceStore(root, provider)
+
+    return _default_store
+
 
-def load_data(ticker: str, start: str, end: str) -> pd.Series:
+def set_default_store(store: PriceStore | None) -> None:
+    """
+    Replace the store used by ``load_data`` (``None`` resets it).
+    """
+    global _default_store
+    _default_store = store
+
+
+@instrument
+def load_data(
+    ticker: str,
+    start: str,
+    end: str,
+    store: PriceStore | None = None
+) -> pd.Series:
     """
     Load daily close prices for a given ticker.
-    
+
+    Prices are served from the local price store; only the date ranges
+    not stored yet are fetched from the store's provider.
+
     Parameters
     ----------
     ticker : str
@@ -16,23 +158,165 @@ def load_data(ticker: str, start: str, end: str) -> pd.Series:
         Start date in format 'YYYY-MM-DD'
     end : str
         End date in format 'YYYY-MM-DD'
-        
+    store : PriceStore, optional
+        Store to read from (default ``get_default_store()``)
+
     Returns
     -------
     pd.Series
         Cleaned daily close price series
     """
-    data = yf.download(ticker, start=start, end=end, progress=False)
+    if store is None:
+        store = get_default_store()
+
+    close = store.get(ticker, start, end)
 
-    if data.empty:
+    if close.empty:
         raise ValueError("No data downloaded. Check ticker or date range.")
 
-    if isinstance(data.columns, pd.MultiIndex):
-        close = data["Close"][ticker]
-    else:
-        close = data["Close"]
+    return close
 
-    close = close.dropna()
-    close.name = ticker
 
-    return close
+@instrument
+def load_many(
+    tickers,
+    start: str,
+    end: str,
+    store: PriceStore | None = None,
+    max_workers: int = 8,
+    batch_size: int = 50,
+    rate_limit: float | None = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+    policy: str = "union",
+    fill: str | None = None,
+    trading_calendar=None
+) -> Panel:
+    """
+    Load close prices for many tickers concurrently, as one panel.
+
+    Only the ranges the store is missing are requested. Tickers missing
+    the same range are batched into one request when the provider has a
+    ``fetch_many`` method; requests run on a bounded thread pool, at most
+    ``rate_limit`` per second, and failed requests (errors, or tickers
+    missing from a batch answer) are retried with exponential backoff.
+    An empty answer is a valid one (e.g. a range without trading days)
+    and is not retried. With thread-safe providers wall time is then
+    close to the slowest request instead of the sum of all of them; the
+    Yahoo Finance provider runs one download at a time, each fetching
+    its batch on yfinance's own threads.
+
+    Parameters
+    ----------
+    tickers : list of str
+        Asset tickers
+    start, end : str
+        Date range in format 'YYYY-MM-DD'
+    store : PriceStore, optional
+        Store to read from (default ``get_default_store()``)
+    max_workers : int
+        Concurrent requests
+    batch_size : int
+        Tickers per batched request
+    rate_limit : float, optional
+        Maximum requests started per second
+    retries : int
+        Attempts after the first failure (only the failed tickers of a
+        batch are requested again)
+    backoff : float
+        Seconds before the first retry, doubled on each further one
+    policy, fill, trading_calendar
+        Calendar alignment, see ``src.alignment.Calendar.build``
+        (default: union calendar, no fill)
+
+    Returns
+    -------
+    Panel
+        Close prices on the master calendar (columns in ``tickers`` order)
+    """
+    if store is None:
+        store = get_default_store()
+
+    tickers = list(dict.fromkeys(tickers))
+    provider = store.provider
+    batched = hasattr(provider, "fetch_many")
+
+    # Group by missing range so one request can serve many tickers
+    by_range = {}
+    for ticker in tickers:
+        for lo, hi in store.missing_ranges(ticker, start, end):
+            by_range.setdefault((lo, hi), []).append(ticker)
+
+    size = batch_size if batched else 1
+    tasks = [
+        (names[i:i + size], lo, hi)
+        for (lo, hi), names in by_range.items()
+        for i in range(0, len(names), size)
+    ]
+
+    limiter = RateLimiter(rate_limit)
+
+    def fetch(task):
+        # A batch can leave out tickers whose download failed instead of
+        # raising, so missing tickers count as failures too and only
+        # those are requested again
+        names, lo, hi = task
+        result = {}
+        pending = list(names)
+
+        for attempt in range(retries + 1):
+            limiter.wait()
+            try:
+                if batched:
+                    served = provider.fetch_many(pending, lo, hi)
+                else:
+                    served = {pending[0]: provider.fetch(pending[0], lo, hi)}
+            except Exception:
+                if attempt == retries:
+                    raise
+                served = {}
+
+            result.update(served)
+            pending = [name for name in pending if name not in result]
+
+            if not pending or attempt == retries:
+                return result
+
+            time.sleep(backoff * 2 ** attempt)
+
+    fetched = {}
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for (names, lo, hi), result in zip(tasks, pool.map(fetch, tasks)):
+                for name in names:
+                    # Still missing after the retries: a failed download
+                    # (None) the store leaves uncovered, not fetched again live
+                    fetched[(name, lo, hi)] = result.get(name)
+
+    prefetched = _Prefetched(fetched, provider)
+    prices = {}
+
+    for ticker in tickers:
+        close = store.get(ticker, start, end, provider=prefetched)
+
+        if close.empty:
+            raise ValueError(f"No data downloaded for {ticker}. Check ticker or date range.")
+
+        prices[ticker] = close
+
+    return align_series(
+        prices, policy=policy, fill=fill, trading_calendar=trading_calendar
+    )
+
+
+class _Prefetched:
+    # Serves the downloaded ranges to PriceStore.get, anything else live
+    def __init__(self, fetched: dict, provider):
+        self.fetched = fetched
+        self.provider = provider
+
+    def fetch(self, ticker: str, start: str, end: str) -> pd.Series:
+        if (ticker, start, end) in self.fetched:
+            return self.fetched[(ticker, start, end)]
+
+        return self.provider.fetch(ticker, start, end)
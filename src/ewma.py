@@ -1,26 +1,134 @@
 import numpy as np
 import pandas as pd
 
+from src.frequency import annualization
+from src.profiling import instrument
 
+
+def ewma_variance(
+    squared: np.ndarray,
+    lambdas,
+    block_size: int = 1024
+) -> np.ndarray:
+    """
+    RiskMetrics EWMA variance recursion over a whole array at once.
+
+    var_0 = x_0
+    var_t = lambda * var_{t-1} + (1 - lambda) * x_t
+
+    The recursion is solved block by block in closed form,
+
+    var_{a+k} = lambda^k * (var_{a-1} + sum_{j<=k} lambda^-j * w_j * x_{a+j})
+
+    so each block is a single cumulative sum over all columns and lambdas.
+    The block length is kept short enough for lambda^-k to stay finite.
+
+    Parameters
+    ----------
+    squared : np.ndarray
+        Squared returns, shape (T,) or (T, N). Leading NaNs are skipped
+        per column; the recursion is seeded at the first valid value.
+    lambdas : float or sequence of float
+        Decay factor(s) in (0, 1]
+    block_size : int
+        Maximum rows solved per cumulative sum
+
+    Returns
+    -------
+    np.ndarray
+        Variance with shape ``squared.shape`` for a scalar lambda, or
+        ``squared.shape + (len(lambdas),)`` for a sequence of lambdas.
+    """
+    x = np.asarray(squared, dtype=float)
+    lam = np.atleast_1d(np.asarray(lambdas, dtype=float))
+
+    if np.any((lam <= 0) | (lam > 1)):
+        raise ValueError("EWMA lambdas must lie in (0, 1].")
+
+    n_rows = x.shape[0]
+    out_shape = x.shape if np.ndim(lambdas) == 0 else x.shape + (lam.size,)
+
+    if n_rows == 0:
+        return np.empty(out_shape)
+
+    cols = x.reshape(n_rows, int(np.prod(x.shape[1:])))
+    n_cols = cols.shape[1]
+
+    valid = ~np.isnan(cols)
+    first = np.where(valid.any(axis=0), valid.argmax(axis=0), n_rows)
+    started = np.arange(n_rows)[:, None] >= first
+
+    inputs = np.where(started, cols, 0.0)[:, :, None]
+
+    weights = np.broadcast_to(1 - lam, (n_rows, n_cols, lam.size)).copy()
+    seeded = first < n_rows
+    weights[first[seeded], np.flatnonzero(seeded)] = 1.0
+
+    weighted = weights * inputs
+
+    # Longest block for which lambda^-k cannot overflow
+    log_decay = -np.log(lam.min())
+    if log_decay > 0:
+        block_size = min(block_size, int(600.0 / log_decay))
+    block_size = max(min(block_size, n_rows), 1)
+
+    var = np.empty_like(weighted)
+    state = np.zeros((n_cols, lam.size))
+
+    steps = np.arange(1, block_size + 1, dtype=float)[:, None, None]
+    decay = lam ** steps
+    growth = 1.0 / decay
+
+    for a in range(0, n_rows, block_size):
+        b = min(a + block_size, n_rows)
+        k = b - a
+
+        scan = np.cumsum(weighted[a:b] * growth[:k], axis=0)
+        var[a:b] = decay[:k] * (scan + state)
+        state = var[b - 1]
+
+    var[~started] = np.nan
+
+    if np.ndim(lambdas) == 0:
+        return var[:, :, 0].reshape(out_shape)
+
+    return var.reshape(out_shape)
+
+
+@instrument
 def compute_ewma_vol(
     returns: pd.Series,
     lambda_: float = 0.94,
     trading_days: int = 252
-) -> pd.Series:
+):
     """
     Compute EWMA annualized volatility (RiskMetrics style).
+
+    Accepts a return Series or a (T x N) DataFrame. Passing a sequence of
+    lambdas returns one column per lambda (a DataFrame with
+    (lambda, asset) columns for DataFrame input). ``trading_days=None``
+    infers the annualization from the bar frequency.
     """
+    trading_days = annualization(trading_days, returns.index)
+
+    var = ewma_variance(returns.to_numpy() ** 2, lambda_)
+    vol = np.sqrt(var) * np.sqrt(trading_days)
+
+    if np.ndim(lambda_) == 0:
+        if isinstance(returns, pd.DataFrame):
+            return pd.DataFrame(vol, index=returns.index, columns=returns.columns)
 
-    var = pd.Series(index=returns.index, dtype=float)
-    var.iloc[0] = returns.iloc[0] ** 2
+        return pd.Series(vol, index=returns.index, name="ewma_vol")
 
-    for t in range(1, len(returns)):
-        var.iloc[t] = (
-            lambda_ * var.iloc[t-1]
-            + (1 - lambda_) * returns.iloc[t] ** 2
+    if isinstance(returns, pd.DataFrame):
+        columns = pd.MultiIndex.from_product(
+            [list(lambda_), returns.columns],
+            names=["lambda", "asset"]
         )
+        vol = vol.transpose(0, 2, 1).reshape(len(returns), -1)
 
-    vol = np.sqrt(var) * np.sqrt(trading_days)
-    vol.name = "ewma_vol"
+        return pd.DataFrame(vol, index=returns.index, columns=columns)
+
+    columns = pd.Index(list(lambda_), name="lambda")
 
-    return vol
+    return pd.DataFrame(vol, index=returns.index, columns=columns)
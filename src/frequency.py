@@ -0,0 +1,69 @@
+# src/frequency.py
+
+import numpy as np
+import pandas as pd
+
+
+# Day counts of the usual calendars: exchange trading days and 24/7
+# markets (crypto). Observed counts within 5% snap to these.
+STANDARD_DAYS = (252, 365)
+SNAP_TOLERANCE = 0.05
+
+DAYS_PER_YEAR = 365.25
+
+
+def days_per_year(index: pd.DatetimeIndex) -> float:
+    """
+    Trading days per year of a date or bar index.
+
+    Counts the distinct days with data over the covered span, snapped to
+    252 (exchange calendar) or 365 (trades every day) when close.
+    """
+    days = pd.DatetimeIndex(index).normalize().unique()
+    if len(days) < 2:
+        return float(STANDARD_DAYS[0])
+
+    span = (days[-1] - days[0]) / pd.Timedelta(days=1) + 1
+    observed = len(days) / span * DAYS_PER_YEAR
+
+    nearest = min(STANDARD_DAYS, key=lambda standard: abs(observed - standard))
+    if abs(observed / nearest - 1) <= SNAP_TOLERANCE:
+        return float(nearest)
+
+    return observed
+
+
+def bars_per_day(index: pd.DatetimeIndex) -> float:
+    """
+    Median number of bars per day with data (1 for daily bars).
+    """
+    days = pd.DatetimeIndex(index).normalize()
+    if len(days) == 0:
+        return 1.0
+
+    _, counts = np.unique(days.asi8, return_counts=True)
+
+    return float(np.median(counts))
+
+
+def periods_per_year(index: pd.DatetimeIndex) -> float:
+    """
+    Annualization factor of a bar index: bars per day x days per year.
+
+    252 for daily stock bars, 365 for daily crypto bars, 252 x 390 for
+    one-minute bars of a 6.5-hour session, 365 x 1440 for 24/7 minutes.
+    """
+    return bars_per_day(index) * days_per_year(index)
+
+
+def annualization(trading_days, index) -> float:
+    """
+    ``trading_days`` if given, else inferred from the bar ``index``.
+    """
+    if trading_days is not None:
+        return trading_days
+
+    if index is None:
+        raise ValueError("trading_days=None needs a date index to infer the bar frequency.")
+
+    return periods_per_year(index)
@@ -3,8 +3,12 @@
 import numpy as np
 import pandas as pd
 
+from src.frequency import annualization
+from src.profiling import instrument
+
 
 def compute_cagr(equity: pd.Series, trading_days: int = 252) -> float:
+    trading_days = annualization(trading_days, equity.index)
     total_return = equity.iloc[-1]
     n_periods = len(equity)
     years = n_periods / trading_days
@@ -13,10 +17,12 @@ def compute_cagr(equity: pd.Series, trading_days: int = 252) -> float:
 
 
 def compute_annualized_vol(returns: pd.Series, trading_days: int = 252) -> float:
+    trading_days = annualization(trading_days, returns.index)
     return returns.std() * np.sqrt(trading_days)
 
 
 def compute_sharpe(returns: pd.Series, trading_days: int = 252) -> float:
+    trading_days = annualization(trading_days, returns.index)
     mean_return = returns.mean()
     std_return = returns.std()
 
@@ -32,3 +38,88 @@ def compute_max_drawdown(equity: pd.Series) -> float:
 
 def compute_calmar(cagr: float, max_dd: float) -> float:
     return cagr / abs(max_dd)
+
+
+@instrument
+def compute_all_metrics(
+    returns,
+    exposure=None,
+    trading_days: int = 252,
+    index=None
+) -> dict:
+    """
+    Compute every performance statistic of one or many strategies at once.
+
+    Works on plain arrays: the equity curve, drawdown and moments are
+    built once and shared, instead of one pandas pass per statistic.
+
+    Parameters
+    ----------
+    returns : array-like
+        Strategy returns, shape (T,) or (T, K) for K strategies. NaNs
+        are skipped per column (a NaN row leaves the equity flat)
+    exposure : array-like, optional
+        Exposures with the same shape, used for turnover
+    trading_days : int, optional
+        Annualization factor (default 252, ``None`` infers it from the
+        bar frequency of ``index``, see ``src.frequency``)
+    index : pd.DatetimeIndex, optional
+        Dates of the rows (default: the index of pandas ``returns``)
+
+    Returns
+    -------
+    dict
+        cagr, vol, sharpe, max_dd, calmar, sortino, hit_rate and, with
+        ``exposure``, turnover (annualized). Floats for 1-D input, arrays
+        of length K for 2-D input.
+    """
+    if index is None:
+        index = getattr(returns, "index", None)
+    trading_days = annualization(trading_days, index)
+
+    r = np.asarray(returns, dtype=float)
+    single = r.ndim == 1
+    if single:
+        r = r[:, None]
+
+    n_periods = r.shape[0]
+    annualize = np.sqrt(trading_days)
+
+    # NaNs are skipped per column like the pandas ``compute_*`` functions:
+    # moments over the valid rows, flat equity on NaN rows
+    valid = ~np.isnan(r)
+    n_valid = valid.sum(axis=0)
+    filled = np.where(valid, r, 0.0)
+
+    equity = np.cumprod(1 + filled, axis=0)
+    running_max = np.maximum.accumulate(equity, axis=0)
+    max_dd = (equity / running_max - 1).min(axis=0)
+
+    cagr = equity[-1] ** (1 / (n_periods / trading_days)) - 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_return = filled.sum(axis=0) / n_valid
+        deviations = np.where(valid, r - mean_return, 0.0)
+        std_return = np.sqrt((deviations ** 2).sum(axis=0) / (n_valid - 1))
+        downside = np.sqrt((np.minimum(filled, 0) ** 2).sum(axis=0) / n_valid)
+        hit_rate = (filled > 0).sum(axis=0) / n_valid
+
+        metrics = {
+            "cagr": cagr,
+            "vol": std_return * annualize,
+            "sharpe": mean_return / std_return * annualize,
+            "max_dd": max_dd,
+            "calmar": cagr / np.abs(max_dd),
+            "sortino": mean_return / downside * annualize,
+            "hit_rate": hit_rate
+        }
+
+    if exposure is not None:
+        e = np.asarray(exposure, dtype=float).reshape(r.shape)
+        turnover = np.nansum(np.abs(np.diff(e, axis=0)), axis=0) / n_periods
+        metrics["turnover"] = turnover * trading_days
+
+    if single:
+        metrics = {name: float(value[0]) for name, value in metrics.items()}
+
+    return metrics
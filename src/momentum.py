@@ -3,17 +3,20 @@ import pandas as pd
 
 def compute_momentum_signal(
     price_series: pd.Series,
-    lookback: int = 252
+    lookback: int = 252,
+    dtype=int
 ) -> pd.Series:
     """
     Long/Flat time-series momentum signal.
 
     Signal = 1 if price > price_{t-lookback}
     Signal = 0 otherwise
+
+    ``dtype=np.int8`` (or bool) stores the signal in one byte per date.
     """
 
     past_price = price_series.shift(lookback)
-    signal = (price_series > past_price).astype(int)
+    signal = (price_series > past_price).astype(dtype)
     signal.name = "momentum_signal"
 
     return signal
@@ -0,0 +1,242 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.profiling import instrument
+
+
+@dataclass
+class Panel:
+    """
+    Dense (dates x assets) matrix on a shared calendar.
+
+    ``mask`` marks the dates on which each asset has an entry. It defaults
+    to the non-NaN cells, but can also flag entries whose value is NaN
+    (e.g. the warm-up rows of a strategy return series).
+    """
+
+    values: np.ndarray
+    index: pd.DatetimeIndex
+    columns: list
+    mask: np.ndarray | None = None
+
+    def __post_init__(self):
+        if self.mask is None:
+            self.mask = ~np.isnan(self.values)
+
+    @classmethod
+    @instrument(name="align")
+    def from_dict(cls, series_dict: dict, index=None) -> "Panel":
+        """
+        Build a panel from ``{asset: pd.Series}`` on the union calendar.
+        """
+        from src.alignment import align_series
+
+        if index is None:
+            return align_series(series_dict)
+
+        return align_series(series_dict, policy="trading", trading_calendar=index)
+
+    def reindex(self, index) -> "Panel":
+        """
+        Move the panel onto another calendar (NaN / unmasked where missing).
+        """
+        positions = self.index.get_indexer(index)
+        found = positions >= 0
+
+        values = np.full((len(index), len(self.columns)), np.nan)
+        values[found] = self.values[positions[found]]
+
+        mask = np.zeros(values.shape, dtype=bool)
+        mask[found] = self.mask[positions[found]]
+
+        return Panel(values, pd.DatetimeIndex(index), self.columns, mask)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.index, columns=self.columns)
+
+    def to_dict(self) -> dict:
+        """
+        Split back into ``{asset: pd.Series}`` holding the masked entries.
+        """
+        return {
+            asset: pd.Series(self.values[self.mask[:, j], j],
+                             index=self.index[self.mask[:, j]])
+            for j, asset in enumerate(self.columns)
+        }
+
+
+def pack(values: np.ndarray, mask: np.ndarray):
+    """
+    Move each column's observations to the top, keeping date order.
+
+    Row k of the packed array is every asset's k-th own observation, so
+    shifts and rolling windows on it follow each asset's own calendar
+    (e.g. 24/7 BTC next to weekday SPY) while running as matrix ops.
+
+    Returns
+    -------
+    packed : np.ndarray
+        Packed values, NaN below each column's observation count
+    order : np.ndarray
+        Calendar row of every packed cell (a permutation per column)
+    counts : np.ndarray
+        Number of observations per column
+    """
+    order = np.argsort(~mask, axis=0, kind="stable")
+    counts = mask.sum(axis=0)
+
+    packed = np.take_along_axis(values, order, axis=0)
+    packed[~_observed(counts, len(values))] = np.nan
+
+    return packed, order, counts
+
+
+def unpack(packed: np.ndarray, order: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Scatter packed rows back onto the calendar (inverse of ``pack``).
+    """
+    packed = np.where(_observed(counts, len(packed)), packed, np.nan)
+
+    values = np.empty_like(packed)
+    np.put_along_axis(values, order, packed, axis=0)
+
+    return values
+
+
+def shift_rows(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """
+    Shift rows down by ``periods``, filling with NaN.
+    """
+    shifted = np.full_like(values, np.nan)
+
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+
+    return shifted
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Column-wise rolling sample std (same numerics as pandas ``rolling``).
+    """
+    return pd.DataFrame(values).rolling(window=window).std().to_numpy()
+
+
+def vol_target_exposure(
+    realized_vol: np.ndarray,
+    target_vol: float = 0.5,
+    min_exposure: float = 0.0,
+    max_exposure: float = 2.0
+) -> np.ndarray:
+    """
+    Array version of ``compute_vol_target_exposure``.
+    """
+    with np.errstate(divide="ignore"):
+        exposure = target_vol / realized_vol
+
+    return np.clip(exposure, min_exposure, max_exposure)
+
+
+def equal_weight_returns(values: np.ndarray):
+    """
+    Row mean over the dates on which every asset has a value.
+
+    Returns
+    -------
+    portfolio : np.ndarray
+        Equal-weight returns on the complete rows
+    complete : np.ndarray
+        Boolean row mask of the calendar dates kept
+    """
+    complete = ~np.isnan(values).any(axis=1)
+
+    # Column-major sums add assets in the same order as DataFrame.mean
+    portfolio = np.asfortranarray(values[complete]).mean(axis=1)
+
+    return portfolio, complete
+
+
+def vol_target_returns(returns: Panel, vol_window: int, target_vol: float, trading_days: int = 252):
+    """
+    Vol-targeted strategy returns for every asset of a return panel.
+
+    exposure_t = clip(target_vol / vol_{t-1}), with the rolling vol taken
+    over each asset's own last ``vol_window`` returns.
+
+    Returns
+    -------
+    Panel
+        Strategy returns, masked where both return and exposure exist
+    """
+    packed, order, counts = pack(returns.values, returns.mask)
+
+    vol = rolling_std(packed, vol_window) * np.sqrt(trading_days)
+    exposure = shift_rows(vol_target_exposure(vol, target_vol=target_vol))
+    exposure = unpack(exposure, order, counts)
+
+    strategy = returns.values * exposure
+
+    return Panel(strategy, returns.index, returns.columns)
+
+
+def momentum_vol_target_returns(
+    prices: Panel,
+    returns: Panel,
+    vol_window: int = 30,
+    target_vol: float = 0.3,
+    lookback: int = 252,
+    trading_days: int = 252
+):
+    """
+    Momentum x vol-target strategy for every asset of a price panel.
+
+    Both panels must share one calendar. Cells of the combined exposure are
+    NaN where only one of signal and vol-target exposure is available.
+
+    Returns
+    -------
+    strategy_returns : Panel
+        Per-asset strategy returns, masked on each asset's return dates
+        where an exposure is defined
+    exposures : Panel
+        Combined (signal x vol target) exposure
+    """
+    price_packed, price_order, price_counts = pack(prices.values, prices.mask)
+
+    past_price = shift_rows(price_packed, lookback)
+    signal = (price_packed > past_price).astype(float)
+    signal = unpack(shift_rows(signal), price_order, price_counts)
+    signal_defined = _defined(price_counts, price_order, offset=1)
+
+    ret_packed, ret_order, ret_counts = pack(returns.values, returns.mask)
+
+    vol = rolling_std(ret_packed, vol_window) * np.sqrt(trading_days)
+    exposure = shift_rows(vol_target_exposure(vol, target_vol=target_vol))
+    exposure = unpack(exposure, ret_order, ret_counts)
+    exposure_defined = _defined(ret_counts, ret_order, offset=vol_window)
+
+    combined = signal * exposure
+    combined_defined = signal_defined | exposure_defined
+
+    strategy = returns.values * combined
+    strategy_defined = returns.mask & combined_defined
+
+    return (
+        Panel(strategy, returns.index, returns.columns, strategy_defined),
+        Panel(combined, returns.index, returns.columns, combined_defined)
+    )
+
+
+def _observed(counts: np.ndarray, n_rows: int) -> np.ndarray:
+    return np.arange(n_rows)[:, None] < counts
+
+
+def _defined(counts: np.ndarray, order: np.ndarray, offset: int) -> np.ndarray:
+    # Calendar mask of each column's observations from the offset-th on
+    packed = _observed(counts, len(order)) & (np.arange(len(order))[:, None] >= offset)
+    defined = np.empty_like(packed)
+    np.put_along_axis(defined, order, packed, axis=0)
+
+    return defined
@@ -0,0 +1,135 @@
+# src/panel_store.py
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.panel import Panel
+
+
+DEFAULT_BLOCK_SIZE = 512
+
+
+def create_panel(path, index, columns, dtype="float64") -> Panel:
+    """
+    Create an empty on-disk panel (all NaN, nothing masked) for writing.
+
+    A panel directory holds ``values.npy`` and ``mask.npy`` (column-major,
+    so every asset is one contiguous run on disk), ``index.npy`` (dates)
+    and ``columns.json`` (asset names).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    index = pd.DatetimeIndex(index)
+    columns = list(columns)
+    shape = (len(index), len(columns))
+
+    np.save(path / "index.npy", index.values.astype("datetime64[ns]"))
+    with open(path / "columns.json", "w", encoding="utf-8") as f:
+        json.dump(columns, f)
+
+    values = np.lib.format.open_memmap(
+        path / "values.npy", mode="w+", dtype=dtype, shape=shape, fortran_order=True
+    )
+    mask = np.lib.format.open_memmap(
+        path / "mask.npy", mode="w+", dtype=bool, shape=shape, fortran_order=True
+    )
+
+    # Fill block by block so creating a huge panel stays within memory
+    for start in range(0, shape[1], DEFAULT_BLOCK_SIZE):
+        values[:, start:start + DEFAULT_BLOCK_SIZE] = np.nan
+
+    return Panel(values, index, columns, mask)
+
+
+def open_panel(path, mode: str = "r") -> Panel:
+    """
+    Open an on-disk panel without reading it: values and mask are
+    memory-mapped, so only the pages actually used are loaded.
+    """
+    path = Path(path)
+
+    with open(path / "columns.json", encoding="utf-8") as f:
+        columns = json.load(f)
+
+    return Panel(
+        np.load(path / "values.npy", mmap_mode=mode),
+        pd.DatetimeIndex(np.load(path / "index.npy")),
+        columns,
+        np.load(path / "mask.npy", mmap_mode=mode)
+    )
+
+
+def iter_blocks(panel: Panel, block_size: int = DEFAULT_BLOCK_SIZE):
+    """
+    Yield ``(columns slice, Panel)`` over blocks of assets.
+
+    Blocks of a memory-mapped panel are views, so at most one block of
+    assets is paged in at a time.
+    """
+    for start in range(0, len(panel.columns), block_size):
+        block = slice(start, start + block_size)
+
+        yield block, Panel(
+            panel.values[:, block],
+            panel.index,
+            panel.columns[block],
+            panel.mask[:, block]
+        )
+
+
+def map_blocks(
+    func,
+    panel: Panel,
+    path=None,
+    dtype=None,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Panel:
+    """
+    Apply a per-asset transform block by block.
+
+    ``func(block) -> (values, mask)`` must treat every asset on its own.
+    With ``path`` the result is written to an on-disk panel (reopened
+    read-only), so peak memory is one block of input and output.
+    """
+    if dtype is None:
+        dtype = panel.values.dtype
+
+    if path is None:
+        shape = (len(panel.index), len(panel.columns))
+        result = Panel(
+            np.empty(shape, dtype=dtype),
+            panel.index,
+            panel.columns,
+            np.empty(shape, dtype=bool)
+        )
+    else:
+        result = create_panel(path, panel.index, panel.columns, dtype=dtype)
+
+    for block, inputs in iter_blocks(panel, block_size):
+        result.values[:, block], result.mask[:, block] = func(inputs)
+
+    if path is None:
+        return result
+
+    result.values.flush()
+    result.mask.flush()
+    del result
+
+    return open_panel(path)
+
+
+def save_panel(path, panel: Panel, dtype=None, block_size: int = DEFAULT_BLOCK_SIZE) -> Panel:
+    """
+    Write a panel to disk (optionally as float32) and reopen it memory-mapped.
+    """
+    return map_blocks(
+        lambda block: (block.values, block.mask),
+        panel,
+        path=path,
+        dtype=dtype,
+        block_size=block_size
+    )
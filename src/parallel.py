@@ -0,0 +1,71 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+
+_shared_arrays = {}
+
+
+def imap_shared(func, tasks, arrays: dict, workers: int | None = 1):
+    """
+    Yield ``func(arrays, task)`` for every task, in task order.
+
+    With ``workers > 1`` the tasks run on a process pool. The arrays are
+    written once to memory-mapped ``.npy`` files that every worker maps
+    read-only, so no task pickles the data. Results are yielded as soon
+    as the next one in task order is done.
+
+    ``workers=1`` runs everything in-process with the same function and
+    inputs, so serial and parallel output are bit-identical.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function ``func(arrays, task)`` (must be picklable)
+    tasks : iterable
+        Task descriptions (small, picklable)
+    arrays : dict
+        ``{name: np.ndarray}`` shared by all tasks
+    workers : int, optional
+        Number of processes (default 1, ``None`` uses every core)
+    """
+    tasks = list(tasks)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(arrays, task)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="vol_regime_") as tmp:
+
+        paths = {}
+        for name, array in arrays.items():
+            paths[name] = str(Path(tmp) / f"{name}.npy")
+            np.save(paths[name], np.ascontiguousarray(array))
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_map_arrays,
+            initargs=(paths,)
+        ) as pool:
+            futures = [pool.submit(_run_task, func, task) for task in tasks]
+
+            for future in futures:
+                yield future.result()
+
+
+def _map_arrays(paths: dict) -> None:
+    _shared_arrays.clear()
+
+    for name, path in paths.items():
+        _shared_arrays[name] = np.load(path, mmap_mode="r")
+
+
+def _run_task(func, task):
+    return func(_shared_arrays, task)
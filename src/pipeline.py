@@ -0,0 +1,366 @@
+from dataclasses import dataclass
+
+import pandas as pd
+
+from src.data_loader import load_data, load_many
+from src.alignment import lag, multiply
+from src.returns import compute_log_returns
+from src.volatility import rolling_annualized_vol
+from src.ewma import compute_ewma_vol
+from src.regime import compute_z_score, classify_regime
+from src.strategy import map_exposure
+from src.vol_targeting import compute_vol_target_exposure
+from src.momentum import compute_momentum_signal
+from src.portfolio_momentum import run_portfolio_momentum
+from src.grid import run_vol_grid
+from src.metrics import compute_all_metrics
+from src.turnover import CostModel, apply_costs
+from src.bootstrap import bootstrap_metrics, confidence_intervals
+from src.result_store import ResultStore
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of a strategy pipeline: an operation, its inputs and params.
+
+    Stages are hashable values, so two strategies that build the same
+    stage (e.g. the 30-day rolling vol of the same returns) share it and
+    the executor computes it once.
+    """
+
+    op: str
+    inputs: tuple = ()
+    params: tuple = ()
+
+
+def stage(op: str, *inputs: Stage, **params) -> Stage:
+    return Stage(op, tuple(inputs), tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in params.items()
+    )))
+
+
+def _lag(series):
+    return lag(series)
+
+
+def _product(left, right):
+    return multiply(left, right, dropna=True)
+
+
+def _apply_exposure(returns, exposure):
+    return multiply(returns, exposure)
+
+
+def _portfolio_momentum(*series, names, vol_window, target_vol, lookback, results_dir=None):
+    prices, returns = series[:len(names)], series[len(names):]
+    params = {"vol_window": vol_window, "target_vol": target_vol, "lookback": lookback}
+
+    if results_dir is not None:
+        # Stored portfolio returns and equity only (no per-asset series)
+        return ResultStore(results_dir).portfolio_momentum(
+            dict(zip(names, prices)),
+            dict(zip(names, returns)),
+            **params
+        )
+
+    return run_portfolio_momentum(
+        dict(zip(names, prices)),
+        dict(zip(names, returns)),
+        **params
+    )
+
+
+def _vol_grid(*returns, names, vol_windows, target_vols, dtype=None, results_dir=None):
+    if results_dir is not None:
+        return ResultStore(results_dir).vol_grid(
+            dict(zip(names, returns)),
+            vol_windows=list(vol_windows),
+            target_vols=list(target_vols),
+            dtype=dtype
+        )
+
+    return run_vol_grid(
+        returns_dict=dict(zip(names, returns)),
+        vol_windows=list(vol_windows),
+        target_vols=list(target_vols),
+        dtype=dtype
+    )
+
+
+def _item(result, index):
+    return result[index]
+
+
+OPS = {
+    "prices": load_data,
+    "log_returns": compute_log_returns,
+    "rolling_vol": rolling_annualized_vol,
+    "ewma_vol": compute_ewma_vol,
+    "z_score": compute_z_score,
+    "regime": classify_regime,
+    "regime_exposure": map_exposure,
+    "vol_target": compute_vol_target_exposure,
+    "momentum": compute_momentum_signal,
+    "lag": _lag,
+    "product": _product,
+    "apply_exposure": _apply_exposure,
+    "portfolio_momentum": _portfolio_momentum,
+    "vol_grid": _vol_grid,
+    "item": _item,
+}
+
+
+class Executor:
+    """
+    Evaluate stages depth-first, computing every distinct stage once.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.computed = 0
+        self.reused = 0
+
+    def run(self, node: Stage):
+        if node in self.results:
+            self.reused += 1
+            return self.results[node]
+
+        args = [self.run(upstream) for upstream in node.inputs]
+        result = OPS[node.op](*args, **dict(node.params))
+
+        self.results[node] = result
+        self.computed += 1
+
+        return result
+
+
+# =========================
+# Strategy builders
+# =========================
+
+def buy_hold(prices):
+    return stage("log_returns", prices)
+
+
+def regime_strategy(prices, window=30, threshold=0.5, z_mode="full", z_window=None):
+    returns = stage("log_returns", prices)
+    vol = stage("rolling_vol", returns, window=window)
+    z = stage("z_score", vol, mode=z_mode, window=z_window)
+    regime = stage("regime", z, threshold=threshold)
+    exposure = stage("lag", stage("regime_exposure", regime))
+
+    return stage("apply_exposure", returns, exposure)
+
+
+def vol_target_strategy(prices, window=30, target_vol=0.5):
+    returns = stage("log_returns", prices)
+    vol = stage("rolling_vol", returns, window=window)
+    exposure = stage("lag", stage("vol_target", vol, target_vol=target_vol))
+
+    return stage("apply_exposure", returns, exposure)
+
+
+def ewma_vol_target_strategy(prices, lambda_=0.94, target_vol=0.5):
+    returns = stage("log_returns", prices)
+    vol = stage("ewma_vol", returns, lambda_=lambda_)
+    exposure = stage("lag", stage("vol_target", vol, target_vol=target_vol))
+
+    return stage("apply_exposure", returns, exposure)
+
+
+def momentum_strategy(prices, lookback=252):
+    returns = stage("log_returns", prices)
+    signal = stage("lag", stage("momentum", prices, lookback=lookback))
+
+    return stage("apply_exposure", returns, signal)
+
+
+def momentum_vol_target_strategy(prices, lookback=252, window=30, target_vol=0.5):
+    returns = stage("log_returns", prices)
+    signal = stage("lag", stage("momentum", prices, lookback=lookback))
+    vol = stage("rolling_vol", returns, window=window)
+    exposure = stage("lag", stage("vol_target", vol, target_vol=target_vol))
+
+    return stage("apply_exposure", returns, stage("product", signal, exposure))
+
+
+STRATEGIES = {
+    "buy_hold": buy_hold,
+    "regime": regime_strategy,
+    "vol_target": vol_target_strategy,
+    "vol_target_ewma": ewma_vol_target_strategy,
+    "momentum": momentum_strategy,
+    "momentum_vol_target": momentum_vol_target_strategy,
+}
+
+
+def portfolio_momentum(price_stages: dict, vol_window=30, target_vol=0.3, lookback=252, results_dir=None):
+    """
+    Stage returning the ``run_portfolio_momentum`` result tuple.
+
+    With ``results_dir`` the result is served by
+    ``ResultStore.portfolio_momentum``: (returns, equity) only.
+    """
+    names = list(price_stages)
+    returns = [stage("log_returns", price_stages[name]) for name in names]
+
+    return stage(
+        "portfolio_momentum",
+        *price_stages.values(),
+        *returns,
+        names=names,
+        vol_window=vol_window,
+        target_vol=target_vol,
+        lookback=lookback,
+        results_dir=results_dir
+    )
+
+
+def vol_grid(price_stages: dict, vol_windows, target_vols, dtype=None, results_dir=None):
+    names = list(price_stages)
+    returns = [stage("log_returns", price_stages[name]) for name in names]
+
+    return stage(
+        "vol_grid",
+        *returns,
+        names=names,
+        vol_windows=vol_windows,
+        target_vols=target_vols,
+        dtype=dtype,
+        results_dir=results_dir
+    )
+
+
+# =========================
+# Config runner
+# =========================
+
+def run_config(config: dict, executor: Executor | None = None) -> list:
+    """
+    Run every strategy and grid of a pipeline config.
+
+    Config keys: ``start``/``end`` (defaults for every entry), ``assets``
+    (``{name: ticker}``), ``strategies`` and ``grids`` (lists of entries,
+    each with a ``name``, a ``type`` and its parameters). An entry may
+    override ``start``/``end``. A strategy's ``bootstrap`` (``{}`` or
+    ``bootstrap_metrics`` options plus ``level``) adds confidence
+    intervals of its metrics. With ``results_dir``, grid results and
+    portfolio momentum results (entries without ``cost_bps``, which needs
+    the per-asset exposures) are stored there and only topped up with new
+    days on later runs.
+
+    Returns
+    -------
+    list of dict
+        One report per entry, in config order (strategies, then grids)
+    """
+    if executor is None:
+        executor = Executor()
+
+    assets = config["assets"]
+    _prefetch(config)
+
+    def price_stage(entry, name):
+        return stage(
+            "prices",
+            ticker=assets[name],
+            start=entry.get("start", config["start"]),
+            end=entry.get("end", config["end"])
+        )
+
+    reports = []
+
+    for entry in config.get("strategies", []):
+        params = {
+            key: value for key, value in entry.items()
+            if key not in ("name", "type", "asset", "assets", "start", "end", "cost_bps", "bootstrap")
+        }
+
+        if entry["type"] == "portfolio_momentum":
+            price_stages = {name: price_stage(entry, name) for name in entry["assets"]}
+            costs = "cost_bps" in entry
+            result = portfolio_momentum(
+                price_stages,
+                results_dir=None if costs else config.get("results_dir"),
+                **params
+            )
+            returns = executor.run(stage("item", result, index=0))
+            exposures = executor.run(stage("item", result, index=3)) if costs else None
+        else:
+            builder = STRATEGIES[entry["type"]]
+            returns = executor.run(builder(price_stage(entry, entry["asset"]), **params))
+            exposures = None
+
+        report = {
+            "name": entry["name"],
+            "kind": "strategy",
+            "returns": returns,
+            "metrics": compute_all_metrics(returns)
+        }
+
+        if exposures is not None and "cost_bps" in entry:
+            report.update(_cost_report(returns, exposures, entry["cost_bps"]))
+
+        if "bootstrap" in entry:
+            report["bootstrap"] = _bootstrap_report(returns, report["metrics"], entry["bootstrap"])
+
+        reports.append(report)
+
+    for entry in config.get("grids", []):
+        price_stages = {name: price_stage(entry, name) for name in entry["assets"]}
+        grid = executor.run(vol_grid(
+            price_stages,
+            vol_windows=entry["vol_windows"],
+            target_vols=entry["target_vols"],
+            dtype=entry.get("dtype"),
+            results_dir=config.get("results_dir")
+        ))
+
+        reports.append({"name": entry["name"], "kind": "grid", "results": grid})
+
+    return reports
+
+
+def _prefetch(config: dict) -> None:
+    # Download every ticker of the config concurrently into the price
+    # store, so the per-stage load_data calls only read from disk
+    ranges = {}
+
+    for entry in [*config.get("strategies", []), *config.get("grids", [])]:
+        if "assets" in entry:
+            names = entry["assets"]
+        elif "asset" in entry:
+            names = [entry["asset"]]
+        else:
+            raise ValueError(f"Config entry {entry.get('name', entry)!r} needs 'asset' or 'assets'.")
+
+        key = (entry.get("start", config["start"]), entry.get("end", config["end"]))
+        ranges.setdefault(key, []).extend(config["assets"][name] for name in names)
+
+    for (start, end), tickers in ranges.items():
+        load_many(tickers, start, end)
+
+
+def _cost_report(portfolio_returns, exposures: dict, cost_bps: float) -> dict:
+    costs = apply_costs(
+        portfolio_returns,
+        exposures,
+        [CostModel(fixed_bps=cost_bps)]
+    )
+
+    return {
+        "cost_bps": cost_bps,
+        "avg_turnover": costs["turnover"].mean(),
+        "net_metrics": costs["metrics"].iloc[0].to_dict()
+    }
+
+
+def _bootstrap_report(returns, metrics: dict, options: dict) -> pd.DataFrame:
+    options = dict(options)
+    level = options.pop("level", 0.9)
+
+    samples = bootstrap_metrics(returns, **options)
+
+    return confidence_intervals(samples[["cagr", "sharpe", "max_dd"]], point=metrics, level=level)
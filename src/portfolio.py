@@ -1,14 +1,21 @@
 import pandas as pd
 
+from src.alignment import align_series
+from src.panel import equal_weight_returns
+
 
 def equal_weight_portfolio(returns_dict: dict) -> pd.Series:
     """
     Combine asset return series via equal weighting.
     """
 
-    aligned = pd.concat(returns_dict.values(), axis=1).dropna()
-    portfolio_returns = aligned.mean(axis=1)
+    aligned = align_series(returns_dict, policy="intersection")
+    portfolio_values, complete = equal_weight_returns(aligned.values)
 
-    portfolio_returns.name = "equal_weight_portfolio"
+    portfolio_returns = pd.Series(
+        portfolio_values,
+        index=aligned.index[complete],
+        name="equal_weight_portfolio"
+    )
 
     return portfolio_returns
@@ -1,43 +1,131 @@
+import numpy as np
 import pandas as pd
 
-from src.momentum import compute_momentum_signal
-from src.volatility import rolling_annualized_vol
-from src.vol_targeting import compute_vol_target_exposure
-from src.portfolio import equal_weight_portfolio
+from src.alignment import align_series
+from src.panel import Panel, equal_weight_returns, momentum_vol_target_returns
+from src.panel_store import DEFAULT_BLOCK_SIZE, iter_blocks
+from src.profiling import instrument
 
 
-def run_portfolio_momentum(
-    price_dict,
-    returns_dict,
+@instrument
+def run_panel_momentum(
+    prices: Panel,
+    returns: Panel,
     vol_window=30,
     target_vol=0.3,
-    lookback=252
+    lookback=252,
+    trading_days=252
 ):
-    strategy_exposures = {}
-    strategy_returns = {}
+    """
+    Equal-weight momentum x vol-target portfolio on (dates x assets) panels.
 
-    for asset in price_dict.keys():
+    Both panels must share one calendar. Per-asset results stay panels,
+    so large universes never pay for one Series per asset.
+    """
+    strategy_panel, exposure_panel = momentum_vol_target_returns(
+        prices,
+        returns,
+        vol_window=vol_window,
+        target_vol=target_vol,
+        lookback=lookback,
+        trading_days=trading_days
+    )
 
-        prices = price_dict[asset]
-        returns = returns_dict[asset]
+    portfolio_values, complete = equal_weight_returns(strategy_panel.values)
+    portfolio_returns = pd.Series(
+        portfolio_values,
+        index=strategy_panel.index[complete],
+        name="equal_weight_portfolio"
+    )
+    portfolio_equity = (1 + portfolio_returns).cumprod()
 
-        # Momentum signal
-        signal = compute_momentum_signal(prices, lookback=lookback)
-        signal = signal.shift(1).dropna()
+    return portfolio_returns, portfolio_equity, strategy_panel, exposure_panel
 
-        # Vol Target
-        vol = rolling_annualized_vol(returns, window=vol_window)
-        exposure = compute_vol_target_exposure(vol, target_vol=target_vol)
-        exposure = exposure.shift(1).dropna()
 
-        combined_exposure = signal * exposure
-        aligned_returns = returns.align(combined_exposure, join="inner")[0]
+def run_blocked_momentum(
+    prices: Panel,
+    returns: Panel,
+    vol_window=30,
+    target_vol=0.3,
+    lookback=252,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    trading_days=252
+):
+    """
+    ``run_panel_momentum`` for universes larger than memory.
+
+    Assets are processed one block at a time (e.g. straight from
+    memory-mapped panels) and only the running portfolio sum is kept, so
+    peak memory scales with the block, not the universe. Returns the same
+    portfolio returns and equity as ``run_panel_momentum``.
+    """
+    total = np.zeros(len(returns.index))
+
+    for block, block_returns in iter_blocks(returns, block_size):
+        block_prices = Panel(
+            prices.values[:, block],
+            prices.index,
+            prices.columns[block],
+            prices.mask[:, block]
+        )
+        strategy_panel, _ = momentum_vol_target_returns(
+            block_prices,
+            block_returns,
+            vol_window=vol_window,
+            target_vol=target_vol,
+            lookback=lookback,
+            trading_days=trading_days
+        )
 
-        strategy_returns[asset] = aligned_returns * combined_exposure
-        strategy_exposures[asset] = combined_exposure
+        # Add assets one by one, in the order equal_weight_returns does
+        for column in strategy_panel.values.T:
+            total += column
 
+    complete = ~np.isnan(total)
 
-    portfolio_returns = equal_weight_portfolio(strategy_returns)
+    portfolio_returns = pd.Series(
+        total[complete] / len(returns.columns),
+        index=returns.index[complete],
+        name="equal_weight_portfolio"
+    )
     portfolio_equity = (1 + portfolio_returns).cumprod()
 
+    return portfolio_returns, portfolio_equity
+
+
+@instrument
+def run_portfolio_momentum(
+    price_dict,
+    returns_dict,
+    vol_window=30,
+    target_vol=0.3,
+    lookback=252,
+    trading_days=252
+):
+    assets = list(price_dict.keys())
+
+    # One shared calendar for all assets, computed once. NaN prices stay on
+    # their asset's calendar: they give a 0 signal and count towards the
+    # momentum lookback, like ``price_series.shift(lookback)``
+    prices = align_series({asset: price_dict[asset] for asset in assets}, keep_nan=True)
+    returns = Panel.from_dict({asset: returns_dict[asset] for asset in assets})
+
+    calendar = prices.index.union(returns.index)
+    prices = prices.reindex(calendar)
+    returns = returns.reindex(calendar)
+
+    portfolio_returns, portfolio_equity, strategy_panel, exposure_panel = (
+        run_panel_momentum(
+            prices,
+            returns,
+            vol_window=vol_window,
+            target_vol=target_vol,
+            lookback=lookback,
+            trading_days=trading_days
+        )
+    )
+
+    strategy_returns = strategy_panel.to_dict()
+    strategy_exposures = exposure_panel.to_dict()
+
     return portfolio_returns, portfolio_equity, strategy_returns, strategy_exposures
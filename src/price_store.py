@@ -0,0 +1,269 @@
+# src/price_store.py
+
+import io
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+
+COVERAGE_KEY = b"vol_regime.coverage"
+
+# An empty answer for a range shorter than this (a weekend or holiday
+# top-up) means nothing traded and is marked covered; every range
+# without business days is shorter
+SHORT_RANGE = pd.Timedelta(days=7)
+
+
+class LocalFileProvider:
+    """
+    Serve close prices from local CSV/Parquet fixtures (offline mode).
+
+    Each ticker lives in ``<root>/<ticker>.parquet`` or ``<root>/<ticker>.csv``
+    with a date column/index and a ``Close`` (or single value) column.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def fetch(self, ticker: str, start: str, end: str) -> pd.Series:
+        close = read_price_file(self.root, ticker)
+        close = close.loc[(close.index >= start) & (close.index < end)]
+
+        return close
+
+
+class HTTPProvider:
+    """
+    Fetch close prices as CSV from an HTTP endpoint.
+
+    Requests ``GET <base_url>/<ticker>.csv?start=...&end=...`` and parses
+    the same layout as the local fixtures, so any static file server (or a
+    local stand-in for a data vendor) can back the store. Each thread
+    keeps one ``requests.Session``, reusing its connections.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self):
+        if not hasattr(self._local, "session"):
+            import requests
+
+            self._local.session = requests.Session()
+
+        return self._local.session
+
+    def fetch(self, ticker: str, start: str, end: str) -> pd.Series:
+        response = self._session().get(
+            f"{self.base_url}/{ticker}.csv",
+            params={"start": start, "end": end},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        data = pd.read_csv(io.StringIO(response.text), index_col=0, parse_dates=True)
+        close = _to_close(data, ticker)
+
+        return close.loc[(close.index >= start) & (close.index < end)]
+
+
+class PriceStore:
+    """
+    Persistent Parquet price store with incremental refresh.
+
+    One file per ticker holds the close prices together with the
+    [start, end) date range already served by the provider, so any later
+    query only fetches the part of the range not covered yet. A range of
+    a week or more that the provider returns empty is never marked
+    covered.
+
+    Parameters
+    ----------
+    root : str or Path
+        Directory holding the Parquet files
+    provider : object
+        Anything with ``fetch(ticker, start, end) -> pd.Series``
+        (e.g. ``YFinanceProvider`` or ``LocalFileProvider``); ``None``
+        instead of a series marks a failed download
+    """
+
+    def __init__(self, root, provider):
+        self.root = Path(root)
+        self.provider = provider
+
+    def missing_ranges(self, ticker: str, start: str, end: str) -> list:
+        """
+        ``[(start, end), ...]`` date ranges a ``get`` would have to fetch.
+        """
+        _, coverage = self._read(ticker)
+        missing = _missing_ranges(coverage, pd.Timestamp(start), _effective_end(end))
+
+        return [(_fmt(lo), _fmt(hi)) for lo, hi in missing]
+
+    def get(self, ticker: str, start: str, end: str, provider=None) -> pd.Series:
+        """
+        Return close prices for ``[start, end)``, fetching missing ranges
+        (from ``provider`` if given, else the store's own provider).
+        """
+        if provider is None:
+            provider = self.provider
+
+        start = pd.Timestamp(start)
+        end = pd.Timestamp(end)
+        effective_end = _effective_end(end)
+
+        close, coverage = self._read(ticker)
+        missing = _missing_ranges(coverage, start, effective_end)
+
+        if missing:
+            fetched = [
+                provider.fetch(ticker, _fmt(lo), _fmt(hi))
+                for lo, hi in missing
+            ]
+
+            # Providers such as yfinance return an empty frame instead of
+            # raising on a failed download: only ranges that came back with
+            # data (or are too short to hold any, see SHORT_RANGE) are
+            # marked covered, the others are fetched again next time
+            answered = [
+                (lo, hi) for (lo, hi), part in zip(missing, fetched)
+                if part is not None and (len(part) or hi - lo < SHORT_RANGE)
+            ]
+
+            if answered:
+                close = _merge([close, *(part for part in fetched if part is not None)])
+                self._write(ticker, close, _extend_coverage(coverage, answered))
+
+        close = close.loc[(close.index >= start) & (close.index < end)]
+        close.name = ticker
+
+        return close
+
+    def _path(self, ticker: str) -> Path:
+        return self.root / f"{ticker.replace(os.sep, '_')}.parquet"
+
+    def _read(self, ticker: str):
+        path = self._path(ticker)
+
+        if not path.exists():
+            return _empty_close(), None
+
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        coverage = json.loads(table.schema.metadata[COVERAGE_KEY])
+        close = table.to_pandas()["close"]
+
+        return close, (pd.Timestamp(coverage["start"]), pd.Timestamp(coverage["end"]))
+
+    def _write(self, ticker: str, close: pd.Series, coverage) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        table = pa.Table.from_pandas(close.rename("close").to_frame())
+        metadata = dict(table.schema.metadata or {})
+        metadata[COVERAGE_KEY] = json.dumps(
+            {"start": _fmt(coverage[0]), "end": _fmt(coverage[1])}
+        ).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write-then-rename so a crashed run never leaves a torn file behind
+        path = self._path(ticker)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def read_price_file(root, ticker: str) -> pd.Series:
+    """
+    Read a close price fixture from ``<root>/<ticker>.parquet`` or ``.csv``.
+    """
+    root = Path(root)
+    parquet_path = root / f"{ticker}.parquet"
+    csv_path = root / f"{ticker}.csv"
+
+    if parquet_path.exists():
+        data = pd.read_parquet(parquet_path)
+    elif csv_path.exists():
+        data = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+    else:
+        raise FileNotFoundError(f"No price fixture for {ticker} in {root}")
+
+    return _to_close(data, ticker)
+
+
+def _to_close(data, ticker: str) -> pd.Series:
+    if isinstance(data, pd.DataFrame):
+        data = data["Close"] if "Close" in data.columns else data.iloc[:, 0]
+
+    close = data.astype(float).dropna().sort_index()
+    close.index = pd.DatetimeIndex(close.index, name="Date")
+    close.name = ticker
+
+    return close
+
+
+def _effective_end(end) -> pd.Timestamp:
+    # Bars from today onwards may still change, never mark them covered
+    return min(pd.Timestamp(end), pd.Timestamp.today().normalize())
+
+
+def _missing_ranges(coverage, start, end):
+    if start >= end:
+        return []
+
+    if coverage is None:
+        return [(start, end)]
+
+    covered_start, covered_end = coverage
+    missing = []
+
+    # Extending to the covered edge keeps the coverage one contiguous range
+    if start < covered_start:
+        missing.append((start, covered_start))
+
+    if end > covered_end:
+        missing.append((covered_end, end))
+
+    return missing
+
+
+def _extend_coverage(coverage, ranges):
+    # ``ranges`` come from ``_missing_ranges`` and touch the covered range,
+    # so the union stays one contiguous range
+    starts = [lo for lo, _ in ranges]
+    ends = [hi for _, hi in ranges]
+
+    if coverage is not None:
+        starts.append(coverage[0])
+        ends.append(coverage[1])
+
+    return min(starts), max(ends)
+
+
+def _merge(series_list) -> pd.Series:
+    series_list = [s for s in series_list if len(s)]
+
+    if not series_list:
+        return _empty_close()
+
+    close = pd.concat(series_list).astype(float)
+    close = close[~close.index.duplicated(keep="last")].sort_index()
+    close.index = pd.DatetimeIndex(close.index, name="Date")
+
+    return close
+
+
+def _empty_close() -> pd.Series:
+    return pd.Series(dtype=float, index=pd.DatetimeIndex([], name="Date"))
+
+
+def _fmt(timestamp) -> str:
+    return pd.Timestamp(timestamp).strftime("%Y-%m-%d")
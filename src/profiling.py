@@ -0,0 +1,269 @@
+# src/profiling.py
+
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+_active = None
+
+
+class _Frame:
+    __slots__ = ("name", "rows", "child_time", "memory", "start_memory", "peak")
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+        self.child_time = 0.0
+        self.memory = False
+        self.start_memory = 0
+        self.peak = 0
+
+
+class Profiler:
+    """
+    Per-stage wall time, call counts, rows and peak allocation.
+
+    Stages nest: each record is keyed by its call path (e.g.
+    ``run_vol_grid;run_sweep``), with inclusive and self time. Peak
+    allocation (via ``tracemalloc``) is only tracked with ``memory=True``.
+
+    ``tracemalloc`` has one process-wide peak, so it is measured in one
+    thread at a time: the first thread to enter a stage owns it until its
+    outermost stage exits. Stages on other threads meanwhile record no
+    peak, and the owner's peaks include what those threads allocate.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stats = {}
+        self._started_tracing = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memory_thread = None
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        return self._local.stack
+
+    def _claim_memory(self, stack) -> bool:
+        # Outermost stages claim the tracemalloc peak for their thread
+        thread = threading.get_ident()
+
+        with self._lock:
+            if self._memory_thread is None and not stack:
+                self._memory_thread = thread
+
+            return self._memory_thread == thread
+
+    def _release_memory(self) -> None:
+        with self._lock:
+            self._memory_thread = None
+
+    @contextmanager
+    def section(self, name: str, rows: int | None = None):
+        stack = self._stack()
+        frame = _Frame(name, rows)
+        frame.memory = self.memory and self._claim_memory(stack)
+
+        if frame.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            frame.start_memory = frame.peak = current
+
+        stack.append(frame)
+        start = time.perf_counter()
+
+        try:
+            yield frame
+        finally:
+            wall = time.perf_counter() - start
+            stack.pop()
+
+            peak_bytes = None
+            if frame.memory:
+                peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = peak - frame.start_memory
+                if stack:
+                    stack[-1].peak = max(stack[-1].peak, peak)
+                else:
+                    self._release_memory()
+
+            if stack:
+                stack[-1].child_time += wall
+
+            path = ";".join([f.name for f in stack] + [name])
+            self._record(path, wall, wall - frame.child_time, frame.rows, peak_bytes)
+
+    def _record(self, path, wall, self_time, rows, peak_bytes):
+        with self._lock:
+            stat = self.stats.setdefault(path, {
+                "calls": 0, "wall_s": 0.0, "self_s": 0.0, "rows": 0, "peak_bytes": None
+            })
+            stat["calls"] += 1
+            stat["wall_s"] += wall
+            stat["self_s"] += self_time
+            stat["rows"] += rows or 0
+            if peak_bytes is not None:
+                stat["peak_bytes"] = max(stat["peak_bytes"] or 0, peak_bytes)
+
+    def to_dict(self) -> dict:
+        return {
+            "memory": self.memory,
+            "stages": [
+                {"path": path, "stage": path.rsplit(";", 1)[-1], **stat}
+                for path, stat in self.stats.items()
+            ]
+        }
+
+    def write_json(self, path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_folded(self, path) -> None:
+        """
+        Collapsed-stack lines (``a;b <self microseconds>``) for
+        flamegraph.pl, speedscope or inferno.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack_path, stat in self.stats.items():
+                f.write(f"{stack_path} {round(stat['self_s'] * 1e6)}\n")
+
+    def summary(self):
+        """
+        One row per stage (all call paths combined), slowest first.
+        """
+        import pandas as pd
+
+        stages = pd.DataFrame(self.to_dict()["stages"])
+        if stages.empty:
+            return stages
+
+        summary = stages.groupby("stage").agg(
+            calls=("calls", "sum"),
+            wall_s=("wall_s", "sum"),
+            self_s=("self_s", "sum"),
+            rows=("rows", "sum"),
+            peak_mb=("peak_bytes", "max")
+        )
+        summary["peak_mb"] = summary["peak_mb"] / 2 ** 20
+
+        return summary.sort_values("wall_s", ascending=False)
+
+
+def enable(memory: bool = True) -> Profiler:
+    """
+    Start recording instrumented stages into a new ``Profiler``.
+    """
+    global _active
+
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    _active = Profiler(memory=memory)
+    _active._started_tracing = started_tracing
+
+    return _active
+
+
+def disable() -> Profiler | None:
+    """
+    Stop recording and return the profiler that was active.
+    """
+    global _active
+
+    profiler, _active = _active, None
+
+    if profiler is not None and profiler._started_tracing:
+        tracemalloc.stop()
+
+    return profiler
+
+
+@contextmanager
+def profile(memory: bool = True):
+    """
+    Record instrumented stages inside the block::
+
+        with profile() as profiler:
+            run_config(config)
+        print(profiler.summary())
+    """
+    profiler = enable(memory=memory)
+
+    try:
+        yield profiler
+    finally:
+        disable()
+
+
+@contextmanager
+def section(name: str, rows: int | None = None):
+    """
+    Time an arbitrary block as a stage (no-op while profiling is off).
+    """
+    if _active is None:
+        yield None
+        return
+
+    with _active.section(name, rows) as frame:
+        yield frame
+
+
+def _count_rows(value):
+    # Rows of one input: pandas objects and panels by their index, arrays
+    # by their first axis, dicts (e.g. ``{asset: pd.Series}``) summed
+    if isinstance(value, dict):
+        counts = [rows for rows in map(_count_rows, value.values()) if rows is not None]
+        return sum(counts) if counts else None
+
+    index = getattr(value, "index", None)
+    if index is not None and not callable(index):
+        return len(index)
+
+    shape = getattr(value, "shape", None)
+    if shape:
+        return shape[0]
+
+    return None
+
+
+def _input_rows(args, kwargs):
+    # Rows of the first argument that has any (skips self, tickers, ...)
+    for value in (*args, *kwargs.values()):
+        rows = _count_rows(value)
+        if rows is not None:
+            return rows
+
+    return None
+
+
+def instrument(func=None, *, name: str | None = None):
+    """
+    Record calls of ``func`` as a stage while profiling is enabled.
+
+    Disabled, the wrapper costs one global lookup per call.
+    """
+    if func is None:
+        return functools.partial(instrument, name=name)
+
+    label = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active
+        if profiler is None:
+            return func(*args, **kwargs)
+
+        with profiler.section(label, rows=_input_rows(args, kwargs)):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -1,20 +1,93 @@
+import numpy as np
 import pandas as pd
 
+from src.rolling import rolling_stats
 
-def compute_z_score(vol_series: pd.Series) -> pd.Series:
+
+REGIME_LABELS = ["low_vol", "neutral", "high_vol"]
+
+
+def compute_z_score(
+    vol_series: pd.Series,
+    mode: str = "full",
+    window: int | None = None,
+    min_periods: int | None = None
+) -> pd.Series:
     """
     Compute z-score of volatility series.
+
+    Modes:
+    full      → full-sample mean / std (uses future data)
+    expanding → mean / std of all values up to and including t
+    rolling   → mean / std of the last ``window`` values
+
+    The expanding and rolling modes only look backwards, so the score at t
+    never changes as history grows. Both run in one vectorized pass over
+    blocked prefix sums (``src.rolling``). Works column-wise on
+    DataFrames (dates x assets).
+    """
+    if mode == "full":
+        mean_vol = vol_series.mean()
+        std_vol = vol_series.std()
+
+        z = (vol_series - mean_vol) / std_vol
+        z.name = "vol_z_score"
+
+        return z
+
+    if mode == "rolling" and window is None:
+        raise ValueError("Rolling z-score needs a window.")
+
+    if mode not in ("expanding", "rolling"):
+        raise ValueError("mode must be 'full', 'expanding' or 'rolling'.")
+
+    if min_periods is None:
+        min_periods = 2 if mode == "expanding" else window
+
+    values = vol_series.to_numpy(dtype=float)
+    z = _causal_z_score(values, None if mode == "expanding" else window, min_periods)
+
+    if isinstance(vol_series, pd.DataFrame):
+        return pd.DataFrame(z, index=vol_series.index, columns=vol_series.columns)
+
+    return pd.Series(z, index=vol_series.index, name="vol_z_score")
+
+
+def _causal_z_score(values: np.ndarray, window: int | None, min_periods: int) -> np.ndarray:
+    # Blocked prefix sums keep long histories accurate (see src.rolling)
+    stats = rolling_stats(values, [window], min_periods=max(min_periods, 2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (values - stats["mean"][0]) / stats["std"][0]
+
+
+def regime_codes(z, thresholds) -> np.ndarray:
     """
-    mean_vol = vol_series.mean()
-    std_vol = vol_series.std()
+    Integer regime code of every z-score (any shape, e.g. T x N assets).
 
-    z = (vol_series - mean_vol) / std_vol
-    z.name = "vol_z_score"
+    With sorted thresholds b_1 < ... < b_k the codes run 0..k, one per
+    band. A value equal to a threshold falls in the band nearer zero,
+    so with (-t, t) the neutral band is closed on both sides. NaN gets -1.
+    """
+    z = np.asarray(z, dtype=float)
+    bounds = np.sort(np.asarray(thresholds, dtype=float))
 
-    return z
+    lower = bounds[bounds <= 0]
+    upper = bounds[bounds > 0]
 
+    codes = np.digitize(z, lower) + np.digitize(z, upper, right=True)
+    codes = codes.astype(np.int8)
+    codes[np.isnan(z)] = -1
 
-def classify_regime(z_series: pd.Series, threshold: float = 0.5) -> pd.Series:
+    return codes
+
+
+def classify_regime(
+    z_series: pd.Series,
+    threshold: float = 0.5,
+    thresholds=None,
+    labels=None
+):
     """
     Classify volatility regimes based on z-score threshold.
     
@@ -22,13 +95,38 @@ def classify_regime(z_series: pd.Series, threshold: float = 0.5) -> pd.Series:
     z < -threshold  → low_vol
     |z| <= threshold → neutral
     z > threshold   → high_vol
+
+    Passing ``thresholds`` (k sorted cut points) gives k + 1 regimes named
+    by ``labels``. The result is categorical; a DataFrame of z-scores
+    (dates x assets) returns a DataFrame of categorical columns.
     """
-    regime = pd.Series(index=z_series.index, dtype="object")
+    if thresholds is None:
+        thresholds = (-threshold, threshold)
+
+    if labels is None:
+        if len(thresholds) == 2:
+            labels = REGIME_LABELS
+        else:
+            labels = [f"regime_{i}" for i in range(len(thresholds) + 1)]
+
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError("Need exactly one label per regime (len(thresholds) + 1).")
+
+    codes = regime_codes(z_series, thresholds)
 
-    regime[z_series < -threshold] = "low_vol"
-    regime[(z_series >= -threshold) & (z_series <= threshold)] = "neutral"
-    regime[z_series > threshold] = "high_vol"
+    if isinstance(z_series, pd.DataFrame):
+        return pd.DataFrame(
+            {
+                column: pd.Categorical.from_codes(codes[:, j], categories=labels)
+                for j, column in enumerate(z_series.columns)
+            },
+            index=z_series.index
+        )
 
+    regime = pd.Series(
+        pd.Categorical.from_codes(codes, categories=labels),
+        index=z_series.index
+    )
     regime.name = "regime"
 
     return regime
@@ -0,0 +1,378 @@
+# src/result_store.py
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.frequency import annualization
+from src.panel import Panel
+from src.portfolio_momentum import run_portfolio_momentum
+from src.profiling import instrument
+from src.sweep import iter_window_paths
+
+
+META_KEY = b"vol_regime.results"
+
+GRID_KEYS = ["window", "target_vol"]
+GRID_METRICS = ["cagr", "sharpe", "max_dd"]
+
+# Running state of a grid point's portfolio path, enough to extend its
+# metrics with new days: live dates, final and peak equity, mean and
+# sum of squared deviations of the daily returns
+STATE = ["n", "total", "peak", "mean", "m2"]
+
+
+def fingerprint(series_dict: dict, end=None) -> str:
+    """
+    Content hash of ``{asset: pd.Series}`` up to ``end`` (inclusive).
+
+    Covers asset names, dates and values, so any revised, added or removed
+    observation changes it.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    for asset in sorted(series_dict):
+        series = series_dict[asset]
+        if end is not None:
+            series = series.loc[series.index <= pd.Timestamp(end)]
+
+        digest.update(str(asset).encode())
+        digest.update(pd.DatetimeIndex(series.index).as_unit("ns").asi8.tobytes())
+        digest.update(series.to_numpy(dtype=float).tobytes())
+
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """
+    Persistent, incrementally updated results of grids and portfolios.
+
+    Every stored result remembers the last date of its input data and a
+    fingerprint of the inputs up to that date. On the next call:
+
+    - same data → the stored result is returned as is
+    - data only grew (same fingerprint up to the stored end) → only the
+      new days are computed, from a short warm-up tail of the inputs, and
+      appended to the stored state
+    - revised history → the result is recomputed from scratch
+
+    Grid points not stored yet are computed, the others skipped. Results
+    live in one Parquet file per universe and parameter set under
+    ``root``.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    # -------------------------
+    # Vol-target grid
+    # -------------------------
+
+    @instrument(name="stored_vol_grid")
+    def vol_grid(self, returns_dict: dict, vol_windows, target_vols, trading_days: int = 252, dtype=None):
+        """
+        ``run_vol_grid`` with stored results.
+
+        Returns
+        -------
+        pd.DataFrame
+            window, target_vol, cagr, sharpe, max_dd in ``run_vol_grid``
+            row order
+        """
+        returns = Panel.from_dict(returns_dict)
+        trading_days = annualization(trading_days, returns.index)
+
+        path = self._path("grids", sorted(returns_dict), trading_days, str(np.dtype(dtype or float)))
+        stored = self._read(path)
+
+        end = _fmt(returns.index[-1]) if len(returns.index) else None
+
+        requested = pd.DataFrame(
+            [(window, float(target)) for window in vol_windows for target in target_vols],
+            columns=GRID_KEYS
+        )
+        if stored.empty:
+            stored = pd.DataFrame(columns=[*GRID_KEYS, *GRID_METRICS, "end", "fingerprint", *STATE])
+        rows = requested.merge(stored, on=GRID_KEYS, how="left")
+
+        fingerprints = {}
+
+        def unchanged(row_end, row_fingerprint):
+            # Stored inputs still the start of today's inputs
+            if not isinstance(row_end, str):
+                return False
+            if row_end not in fingerprints:
+                fingerprints[row_end] = fingerprint(returns_dict, end=row_end)
+            return fingerprints[row_end] == row_fingerprint
+
+        current = rows["end"] == end
+        valid = np.array([
+            unchanged(row_end, row_fingerprint)
+            for row_end, row_fingerprint in zip(rows["end"], rows["fingerprint"])
+        ], dtype=bool)
+
+        grow = valid & ~current.to_numpy()
+        fresh = ~valid
+
+        kwargs = {"trading_days": trading_days, "dtype": dtype}
+
+        # New grid points and invalidated ones: full history
+        for window, points in rows[fresh].groupby("window"):
+            targets = sorted(points["target_vol"].unique())
+            states = _grid_states(returns, [window], targets, None, **kwargs)
+            rows = _update(rows, states)
+
+        # Grown data: only the days after each stored end
+        for (window, row_end), points in rows[grow].groupby(["window", "end"]):
+            targets = sorted(points["target_vol"].unique())
+            tail = _tail(returns, row_end, warm_up=window + 2)
+            states = _grid_states(tail, [window], targets, row_end, previous=points, **kwargs)
+            rows = _update(rows, states)
+
+        if fresh.any() or grow.any():
+            rows["end"] = rows["end"].where(~(fresh | grow), end)
+            rows["fingerprint"] = rows["fingerprint"].where(
+                ~(fresh | grow), fingerprint(returns_dict, end=end) if end else None
+            )
+            rows = _grid_metrics(rows, trading_days)
+            self._write(path, _upsert(stored, rows, GRID_KEYS))
+
+        return rows[[*GRID_KEYS, *GRID_METRICS]].reset_index(drop=True)
+
+    # -------------------------
+    # Portfolio momentum
+    # -------------------------
+
+    @instrument(name="stored_portfolio_momentum")
+    def portfolio_momentum(self, price_dict: dict, returns_dict: dict, vol_window=30, target_vol=0.3, lookback=252):
+        """
+        Portfolio returns and equity of ``run_portfolio_momentum``, stored
+        with the result and topped up with new days.
+
+        Returns
+        -------
+        portfolio_returns, portfolio_equity : pd.Series
+        """
+        path = self._path("portfolio_momentum", sorted(price_dict), vol_window, target_vol, lookback)
+        stored = self._read(path, index_col="date")
+
+        inputs = {**{("price", a): s for a, s in price_dict.items()},
+                  **{("returns", a): s for a, s in returns_dict.items()}}
+        inputs = {f"{kind}:{asset}": series for (kind, asset), series in inputs.items()}
+
+        end = max(series.index[-1] for series in price_dict.values() if len(series))
+        end = _fmt(end)
+
+        meta = stored.attrs.get("meta", {})
+        params = {"vol_window": vol_window, "target_vol": target_vol, "lookback": lookback}
+
+        if meta.get("end") == end and meta.get("fingerprint") == fingerprint(inputs, end=end):
+            return _portfolio_series(stored)
+
+        if meta.get("end") and meta.get("fingerprint") == fingerprint(inputs, end=meta["end"]):
+            # Momentum and rolling vol only look back lookback + vol_window
+            # observations, so a tail of that length reproduces new days
+            warm_up = lookback + vol_window + 2
+            start = _tail_start(price_dict, meta["end"], warm_up)
+            tail_returns = run_portfolio_momentum(
+                {a: s.loc[s.index >= start] for a, s in price_dict.items()},
+                {a: s.loc[s.index >= start] for a, s in returns_dict.items()},
+                **params
+            )[0]
+            new = tail_returns.loc[tail_returns.index > pd.Timestamp(meta["end"])]
+
+            old_returns, old_equity = _portfolio_series(stored)
+            last = old_equity.iloc[-1] if len(old_equity) else 1.0
+
+            returns = pd.concat([old_returns, new])
+            equity = pd.concat([old_equity, last * (1 + new).cumprod()])
+        else:
+            returns, equity = run_portfolio_momentum(price_dict, returns_dict, **params)[:2]
+
+        frame = pd.DataFrame({"returns": returns, "equity": equity})
+        frame.index.name = "date"
+        frame.attrs["meta"] = {"end": end, "fingerprint": fingerprint(inputs, end=end)}
+        self._write(path, frame, index=True)
+
+        return _portfolio_series(frame)
+
+    # -------------------------
+    # Files
+    # -------------------------
+
+    def _path(self, kind: str, *key) -> Path:
+        name = hashlib.blake2b(json.dumps(key, default=str).encode(), digest_size=8).hexdigest()
+        return self.root / kind / f"{name}.parquet"
+
+    def _read(self, path: Path, index_col=None) -> pd.DataFrame:
+        if not path.exists():
+            return pd.DataFrame()
+
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        frame = table.to_pandas()
+        if index_col is not None and index_col in frame.columns:
+            frame = frame.set_index(index_col)
+        frame.attrs["meta"] = json.loads(table.schema.metadata.get(META_KEY, b"{}"))
+
+        return frame
+
+    def _write(self, path: Path, frame: pd.DataFrame, index: bool = False) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = frame.attrs.get("meta", {})
+        table = pa.Table.from_pandas(frame.reset_index() if index else frame, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[META_KEY] = json.dumps(meta).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write-then-rename, like the price store
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _grid_states(returns: Panel, vol_windows, target_vols, after, previous=None, trading_days=252, dtype=None):
+    # Running states of every (window, target) point, extended with the
+    # portfolio returns dated after ``after`` (all of them if None)
+    states = []
+
+    for params, dates, paths in iter_window_paths(
+        returns, vol_windows, target_vols, trading_days=trading_days, dtype=dtype
+    ):
+        if after is not None:
+            paths = paths[:, dates > pd.Timestamp(after)]
+
+        points = params[GRID_KEYS].copy()
+        start = _initial_state(len(points))
+        if previous is not None:
+            start = points.merge(previous, on=GRID_KEYS, how="left")[STATE + ["max_dd"]]
+
+        states.append(pd.concat([points, _extend(start, paths)], axis=1))
+
+    return pd.concat(states, ignore_index=True)
+
+
+def _initial_state(n_points: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "n": np.zeros(n_points),
+        "total": np.ones(n_points),
+        "peak": np.full(n_points, -np.inf),
+        "mean": np.zeros(n_points),
+        "m2": np.zeros(n_points),
+        "max_dd": np.zeros(n_points)
+    })
+
+
+def _extend(state: pd.DataFrame, paths: np.ndarray) -> pd.DataFrame:
+    # Append (points x new dates) returns to the running states
+    paths = paths.astype(float, copy=False)
+    n_new = paths.shape[1]
+    n_old = state["n"].to_numpy(dtype=float)
+
+    if n_new == 0:
+        return state.reset_index(drop=True)
+
+    equity = state["total"].to_numpy(dtype=float)[:, None] * np.cumprod(1 + paths, axis=1)
+    peaks = np.maximum(state["peak"].to_numpy(dtype=float)[:, None],
+                       np.maximum.accumulate(equity, axis=1))
+    # fmin: points without any date yet have no drawdown (NaN)
+    max_dd = np.fmin(state["max_dd"].to_numpy(dtype=float), (equity / peaks - 1).min(axis=1))
+
+    # Chan et al. pairwise update of the mean and squared deviations
+    new_mean = paths.mean(axis=1)
+    new_m2 = ((paths - new_mean[:, None]) ** 2).sum(axis=1)
+    n = n_old + n_new
+    delta = new_mean - state["mean"].to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        "n": n,
+        "total": equity[:, -1],
+        "peak": peaks[:, -1],
+        "mean": state["mean"].to_numpy(dtype=float) + delta * n_new / n,
+        "m2": state["m2"].to_numpy(dtype=float) + new_m2 + delta ** 2 * n_old * n_new / n,
+        "max_dd": max_dd
+    })
+
+
+def _grid_metrics(rows: pd.DataFrame, trading_days: int) -> pd.DataFrame:
+    rows = rows.copy()
+    rows[STATE + ["max_dd"]] = rows[STATE + ["max_dd"]].astype(float)
+    years = rows["n"] / trading_days
+
+    rows["cagr"] = np.power(rows["total"], 1 / years) - 1
+    rows["sharpe"] = rows["mean"] / np.sqrt(rows["m2"] / (rows["n"] - 1)) * np.sqrt(trading_days)
+
+    # No date scored yet: NaN like run_sweep / compute_all_metrics
+    rows.loc[rows["n"] == 0, GRID_METRICS] = np.nan
+
+    return rows
+
+
+def _update(rows: pd.DataFrame, states: pd.DataFrame) -> pd.DataFrame:
+    # Overwrite the state columns of the recomputed points
+    rows = rows.set_index(GRID_KEYS)
+    states = states.set_index(GRID_KEYS)
+
+    for column in states.columns:
+        if column not in rows.columns:
+            rows[column] = np.nan
+        rows.loc[states.index, column] = states[column]
+
+    return rows.reset_index()
+
+
+def _upsert(stored: pd.DataFrame, rows: pd.DataFrame, keys) -> pd.DataFrame:
+    merged = pd.concat([stored, rows], ignore_index=True) if len(stored) else rows
+    merged = merged.drop_duplicates(subset=keys, keep="last").reset_index(drop=True)
+    merged.attrs["meta"] = {}
+
+    return merged
+
+
+def _tail(returns: Panel, end, warm_up: int) -> Panel:
+    # Rows from where every asset still has ``warm_up`` observations up to
+    # ``end``: enough history to reproduce every row after it
+    before = returns.index <= pd.Timestamp(end)
+    start = len(returns.index)
+
+    for j in range(returns.mask.shape[1]):
+        rows = np.flatnonzero(returns.mask[before, j])
+        if len(rows):
+            start = min(start, rows[max(len(rows) - warm_up, 0)])
+
+    start = min(start, int(before.sum()))
+
+    return Panel(returns.values[start:], returns.index[start:], returns.columns, returns.mask[start:])
+
+
+def _tail_start(series_dict: dict, end, warm_up: int) -> pd.Timestamp:
+    starts = []
+
+    for series in series_dict.values():
+        dates = series.index[series.index <= pd.Timestamp(end)]
+        if len(dates):
+            starts.append(dates[max(len(dates) - warm_up, 0)])
+
+    return min(starts) if starts else pd.Timestamp(end)
+
+
+def _portfolio_series(frame: pd.DataFrame):
+    index = pd.DatetimeIndex(frame.index)
+
+    returns = pd.Series(frame["returns"].to_numpy(), index=index, name="equal_weight_portfolio")
+    equity = pd.Series(frame["equity"].to_numpy(), index=index, name="equal_weight_portfolio")
+
+    return returns, equity
+
+
+def _fmt(timestamp) -> str:
+    return pd.Timestamp(timestamp).isoformat()
@@ -1,15 +1,47 @@
 import numpy as np
 import pandas as pd
 
+from src.panel import Panel, pack, unpack, shift_rows
+from src.panel_store import DEFAULT_BLOCK_SIZE, map_blocks
+from src.profiling import instrument
 
-def compute_log_returns(price_series: pd.Series) -> pd.Series:
+
+@instrument
+def compute_log_returns(
+    price_series: pd.Series,
+    path=None,
+    dtype=None,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> pd.Series:
     """
     Compute log returns from price series.
     
     r_t = ln(P_t / P_{t-1})
+
+    A price ``Panel`` gives a return panel, each asset on its own
+    calendar. With ``path`` it is written once to an on-disk panel
+    (``dtype`` e.g. float32) block by block and returned memory-mapped.
     """
+    if isinstance(price_series, Panel):
+        return map_blocks(
+            _panel_log_returns,
+            price_series,
+            path=path,
+            dtype=dtype,
+            block_size=block_size
+        )
+
     returns = np.log(price_series / price_series.shift(1))
     returns = returns.dropna()
     returns.name = "log_returns"
 
-    return returns
\ No newline at end of file
+    return returns
+
+
+def _panel_log_returns(prices: Panel):
+    packed, order, counts = pack(np.asarray(prices.values, dtype=float), prices.mask)
+
+    returns = unpack(np.log(packed / shift_rows(packed)), order, counts)
+    mask = prices.mask & ~np.isnan(returns)
+
+    return returns, mask
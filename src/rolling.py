@@ -0,0 +1,276 @@
+# src/rolling.py
+
+import numpy as np
+
+
+# Windows whose sum of squared deviations falls below this fraction of
+# their sum of squares have lost most digits to cancellation (flat or
+# near-flat windows) and are recomputed directly
+CANCELLATION_TOL = 1e-8
+
+MIN_BLOCK = 1024
+
+
+def prefix_sums(values: np.ndarray, block: int = MIN_BLOCK, extra: dict | None = None) -> dict:
+    """
+    Blocked cumulative count, sum and sum of squares of a (T,) or (T x N)
+    array, from which any window's moments follow in O(1).
+
+    Sums restart every ``block`` rows, so a window difference never
+    subtracts running totals of the whole history and rounding stays
+    bounded by one block. Values are also shifted by each column's first
+    valid value. NaNs are skipped (counted as missing). ``extra`` maps
+    names to more arrays of the same shape to sum the same way (NaN-free,
+    e.g. log growth).
+
+    Returns
+    -------
+    dict
+        values (T x N), shift (N,), block, complete (no NaNs), and for
+        count / sum / sum_sq (and the ``extra`` names) a
+        pair of (T+1 x N) in-block prefixes and (blocks x N) block totals
+    """
+    x = np.asarray(values, dtype=float)
+    x = x.reshape(len(x), -1 if x.size else 1)
+    valid = ~np.isnan(x)
+
+    shift = np.zeros(x.shape[1])
+    has_value = valid.any(axis=0)
+    if has_value.any():
+        first = x[valid.argmax(axis=0), np.arange(x.shape[1])]
+        shift = np.where(has_value, first, 0.0)
+
+    filled = np.where(valid, x - shift, 0.0)
+
+    prefix = {
+        "values": x,
+        "shift": shift,
+        "block": block,
+        "complete": bool(valid.all()),
+        "count": _block_prefix(valid.astype(float), block),
+        "sum": _block_prefix(filled, block),
+        "sum_sq": _block_prefix(filled ** 2, block)
+    }
+
+    for name, a in (extra or {}).items():
+        prefix[name] = _block_prefix(np.asarray(a, dtype=float).reshape(x.shape), block)
+
+    return prefix
+
+
+def _block_prefix(a: np.ndarray, block: int):
+    n_rows, n_cols = a.shape
+    n_blocks = n_rows // block + 1
+
+    padded = np.zeros((n_blocks * block, n_cols))
+    padded[:n_rows] = a
+    running = padded.reshape(n_blocks, block, n_cols).cumsum(axis=1)
+
+    # local[p] = sum of rows [p // block * block, p)
+    local = np.concatenate(
+        [np.zeros((n_blocks, 1, n_cols)), running[:, :-1]], axis=1
+    ).reshape(n_blocks * block, n_cols)
+
+    return local[:n_rows + 1], running[:, -1]
+
+
+def _window_sum(prefix, window: int | None, block: int) -> np.ndarray:
+    # Sum over rows [max(t + 1 - window, 0), t + 1) for every row t
+    local, totals = prefix
+    n_rows = len(local) - 1
+
+    if window is None or window >= n_rows:
+        # Expanding: whole blocks before the end plus the partial one
+        done = np.vstack([np.zeros((1, totals.shape[1])), np.cumsum(totals, axis=0)])
+        return done[np.arange(1, n_rows + 1) // block] + local[1:]
+
+    if window > block:
+        raise ValueError("Window longer than the prefix block.")
+
+    sums = np.empty((n_rows, local.shape[1]))
+    sums[:window] = local[1:window + 1] - local[0]
+    sums[window:] = local[window + 1:] - local[1:n_rows - window + 1]
+
+    # Windows ending in the first ``window`` rows of block k start in
+    # block k - 1 and also need that block's tail
+    rows, blocks = _crossing_rows(n_rows, window, block)
+    sums[rows] += totals[blocks]
+
+    return sums
+
+
+def range_sums(prefix: dict, name: str, starts, ends, columns=None) -> np.ndarray:
+    """
+    Sums of ``prefix[name]`` over the row ranges ``[starts[k], ends[k])``.
+
+    Ranges inside one block are one in-block difference; longer ones add
+    the tail of their first block, the totals of the whole blocks between
+    and the head of their last block. Without ``columns`` every column is
+    summed, giving (ranges x N); with ``columns`` (one per range) each
+    range sums one column.
+    """
+    local, totals = prefix[name]
+    block = prefix["block"]
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+
+    done = np.vstack([np.zeros((1, totals.shape[1])), np.cumsum(totals, axis=0)])
+    first, last = starts // block, ends // block
+
+    if columns is None:
+        def at(a, rows):
+            return a[rows]
+    else:
+        def at(a, rows):
+            return a[rows, columns]
+
+    inside = at(local, ends) - at(local, starts)
+    spanning = (
+        at(totals, first) - at(local, starts)
+        + (at(done, last) - at(done, np.minimum(first + 1, last)))
+        + at(local, ends)
+    )
+    same = first == last
+
+    return np.where(same if columns is not None else same[:, None], inside, spanning)
+
+
+def _crossing_rows(n_rows: int, window: int, block: int):
+    starts = np.arange(block, n_rows + 1, block)
+    ends = (starts[:, None] + np.arange(window)).ravel()
+    blocks = np.repeat(np.arange(len(starts)), window)
+
+    inside = ends <= n_rows
+
+    return ends[inside] - 1, blocks[inside]
+
+
+def window_moments(
+    prefix: dict,
+    window: int | None,
+    min_periods: int | None = None,
+    ddof: int = 1
+):
+    """
+    Rolling count, mean and variance for one window from ``prefix_sums``.
+
+    ``window=None`` gives expanding moments. Like pandas ``rolling``, a
+    window covers ``window`` rows (at most the prefix block) and NaNs
+    inside it are skipped; results are NaN where fewer than
+    ``min_periods`` values (default ``window``, or 1 for expanding) are
+    available.
+    """
+    n_rows = len(prefix["values"])
+
+    if min_periods is None:
+        min_periods = 1 if window is None else window
+
+    if prefix["complete"]:
+        # No NaNs: the count only depends on the row
+        n = np.arange(1.0, n_rows + 1)[:, None]
+        if window is not None:
+            n = np.minimum(n, window)
+    else:
+        n = _window_sum(prefix["count"], window, prefix["block"])
+
+    total = _window_sum(prefix["sum"], window, prefix["block"])
+    squares = _window_sum(prefix["sum_sq"], window, prefix["block"])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / n
+
+        # squares = sum_sq - sum * mean, reusing the buffers
+        centered = np.multiply(total, mean, out=total)
+        squares -= centered
+
+        # Stability guard, see CANCELLATION_TOL
+        suspect = squares <= CANCELLATION_TOL * centered
+        suspect &= n > ddof
+
+        var = np.maximum(squares, 0.0, out=squares)
+        var /= n - ddof
+
+    if window is not None and suspect.any():
+        var[suspect] = _direct_var(prefix["values"], window, suspect, ddof)
+
+    mean += prefix["shift"]
+
+    short = (n < max(min_periods, 1)) | (n <= ddof)
+    if short.any():
+        mean[np.broadcast_to(n < max(min_periods, 1), mean.shape)] = np.nan
+        var[np.broadcast_to(short, var.shape)] = np.nan
+
+    return np.broadcast_to(n, mean.shape), mean, var
+
+
+def _direct_var(values: np.ndarray, window: int, suspect: np.ndarray, ddof: int):
+    rows, cols = np.nonzero(suspect)
+
+    padded = np.vstack([np.full((window - 1, values.shape[1]), np.nan), values])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=0)[rows, cols]
+
+    var = np.nanvar(windows, axis=1, ddof=ddof)
+
+    # Constant windows are exactly flat, whatever the rounding of the mean
+    var[np.nanmax(windows, axis=1) == np.nanmin(windows, axis=1)] = 0.0
+
+    return var
+
+
+def rolling_stats(
+    values: np.ndarray,
+    windows,
+    min_periods: int | None = None,
+    ddof: int = 1
+) -> dict:
+    """
+    Rolling mean and std for many windows from one set of prefix sums.
+
+    The data is scanned once; each extra window costs a few array
+    differences instead of another pass.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (T,) series or (T x N) matrix, NaN for missing values
+    windows : list of int
+        Window lengths (``None`` for expanding)
+    min_periods : int, optional
+        Minimum values per window (default: the window length)
+    ddof : int
+        Delta degrees of freedom of the std (default 1, like pandas)
+
+    Returns
+    -------
+    dict
+        count, mean, std: arrays of shape (W, T) or (W, T, N)
+    """
+    values = np.asarray(values, dtype=float)
+    block = max([MIN_BLOCK] + [window for window in windows if window is not None])
+    prefix = prefix_sums(values, block=block)
+
+    shape = (len(windows),) + values.shape
+    stats = {name: np.empty(shape) for name in ("count", "mean", "std")}
+
+    for k, window in enumerate(windows):
+        n, mean, var = window_moments(prefix, window, min_periods=min_periods, ddof=ddof)
+        stats["count"][k] = n.reshape(values.shape)
+        stats["mean"][k] = mean.reshape(values.shape)
+        stats["std"][k] = np.sqrt(var).reshape(values.shape)
+
+    return stats
+
+
+def rolling_sharpe(
+    values: np.ndarray,
+    windows,
+    min_periods: int | None = None,
+    trading_days: int = 252
+) -> np.ndarray:
+    """
+    Annualized rolling Sharpe ratio for many windows, shape (W, T[, N]).
+    """
+    stats = rolling_stats(values, windows, min_periods=min_periods)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return stats["mean"] / stats["std"] * np.sqrt(trading_days)
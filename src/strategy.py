@@ -1,12 +1,17 @@
+import numpy as np
 import pandas as pd
 
 
 def map_exposure(
     regime_series: pd.Series,
     exposure_map: dict | None = None
-) -> pd.Series:
+):
     """
     Map regime labels to exposure levels.
+
+    Regime codes index straight into an exposure lookup array, so no
+    per-row dict lookups happen. Accepts categorical or plain label
+    Series, and DataFrames (dates x assets) of regimes.
     """
 
     if exposure_map is None:
@@ -16,7 +21,43 @@ def map_exposure(
             "high_vol": 0.3
         }
 
-    exposure = regime_series.map(exposure_map)
+    if isinstance(regime_series, pd.DataFrame):
+        codes, categories = _frame_codes(regime_series)
+        lookup = _lookup(categories, exposure_map)
+
+        return pd.DataFrame(
+            np.take(lookup, codes),
+            index=regime_series.index,
+            columns=regime_series.columns
+        )
+
+    regime = regime_series.astype("category").cat
+
+    exposure = pd.Series(
+        np.take(_lookup(regime.categories, exposure_map), regime.codes.to_numpy()),
+        index=regime_series.index
+    )
     exposure.name = "exposure"
 
     return exposure
+
+
+def _lookup(categories, exposure_map: dict) -> np.ndarray:
+    # Trailing NaN slot: code -1 (missing regime) gathers NaN
+    return np.array(
+        [exposure_map.get(label, np.nan) for label in categories] + [np.nan],
+        dtype=float
+    )
+
+
+def _frame_codes(regimes: pd.DataFrame):
+    # (T x N) codes into one shared category list
+    dtypes = set(regimes.dtypes)
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), pd.CategoricalDtype):
+        # e.g. classify_regime output: every column has the same categories
+        codes = np.column_stack([regimes[column].cat.codes.to_numpy() for column in regimes])
+        return codes.reshape(regimes.shape), next(iter(dtypes)).categories
+
+    codes, categories = pd.factorize(regimes.to_numpy().ravel())
+
+    return codes.reshape(regimes.shape), categories
@@ -0,0 +1,318 @@
+import math
+from collections import deque
+
+import numpy as np
+
+
+class RollingVol:
+    """
+    Incremental rolling annualized volatility (ring buffer + Welford).
+
+    Each ``update`` is O(1). The running moments are rebuilt from the
+    buffer once per ``window`` updates so rounding drift cannot build up.
+    NaN returns are kept out of the moments: the value is NaN while one
+    is inside the window and recovers once it leaves, so replaying a
+    return series reproduces ``rolling_annualized_vol`` to floating-point
+    precision (NaN until the window is full).
+    """
+
+    def __init__(self, window: int = 30, trading_days: int = 252):
+        self.window = window
+        self.scale = math.sqrt(trading_days)
+        self.buffer = deque(maxlen=window)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.updates = 0
+
+    def update(self, ret: float) -> float:
+        old = self.buffer[0] if len(self.buffer) == self.window else math.nan
+        self.buffer.append(ret)
+
+        if math.isnan(old):
+            self._add(ret)
+        elif math.isnan(ret):
+            self._remove(old)
+        else:
+            new_mean = self.mean + (ret - old) / self.count
+            self.m2 += (ret - old) * (ret - new_mean + old - self.mean)
+            self.mean = new_mean
+
+        self.updates += 1
+        if self.updates % self.window == 0:
+            values = np.fromiter(self.buffer, dtype=float)
+            values = values[~np.isnan(values)]
+            self.count = len(values)
+            self.mean = values.mean() if self.count else 0.0
+            self.m2 = ((values - self.mean) ** 2).sum()
+
+        return self.value
+
+    def _add(self, value: float) -> None:
+        if math.isnan(value):
+            return
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        if self.count == 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+
+        new_mean = (self.count * self.mean - value) / (self.count - 1)
+        self.m2 -= (value - self.mean) * (value - new_mean)
+        self.mean = new_mean
+        self.count -= 1
+
+    @property
+    def value(self) -> float:
+        if self.count < self.window:
+            return math.nan
+
+        return math.sqrt(max(self.m2, 0.0) / (self.window - 1)) * self.scale
+
+
+class EWMAVol:
+    """
+    Incremental RiskMetrics EWMA annualized volatility.
+
+    Applies the ``compute_ewma_vol`` recursion one return at a time,
+    seeded with the first non-NaN squared return. As in the batch
+    version, a NaN after the seed makes every later value NaN.
+    """
+
+    def __init__(self, lambda_: float = 0.94, trading_days: int = 252):
+        self.lambda_ = lambda_
+        self.scale = math.sqrt(trading_days)
+        self.var = math.nan
+        self.seeded = False
+
+    def update(self, ret: float) -> float:
+        if not self.seeded:
+            if not math.isnan(ret):
+                self.var = ret ** 2
+                self.seeded = True
+        else:
+            self.var = self.lambda_ * self.var + (1 - self.lambda_) * ret ** 2
+
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return math.sqrt(self.var) * self.scale
+
+
+class MomentumSignal:
+    """
+    Incremental long/flat momentum signal (lookback ring buffer).
+
+    Signal = 1 if price > price_{t-lookback}, 0 otherwise (including
+    while fewer than ``lookback`` past prices are known).
+    """
+
+    def __init__(self, lookback: int = 252):
+        self.lookback = lookback
+        self.buffer = deque(maxlen=lookback + 1)
+
+    def update(self, price: float) -> int:
+        self.buffer.append(price)
+        return self.value
+
+    @property
+    def value(self) -> int:
+        if len(self.buffer) <= self.lookback:
+            return 0
+
+        return int(self.buffer[-1] > self.buffer[0])
+
+
+class RunningZScore:
+    """
+    Incremental expanding z-score (Welford running mean / std).
+
+    Each value is scored against the mean and sample std of every value
+    seen so far, itself included, so no future data leaks in. After the
+    last update the running moments equal the full-sample ones used by
+    ``compute_z_score``.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.last = math.nan
+
+    def update(self, value: float) -> float:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.last = value
+
+        return self.value
+
+    @property
+    def std(self) -> float:
+        if self.count < 2:
+            return math.nan
+
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    @property
+    def value(self) -> float:
+        return (self.last - self.mean) / self.std
+
+
+class RollingZScore:
+    """
+    Incremental rolling z-score over the last ``window`` values.
+
+    Reuses the ``RollingVol`` ring buffer for the moments, so each update
+    is O(1). Replaying a series reproduces
+    ``compute_z_score(mode="rolling", window=window)``.
+    """
+
+    def __init__(self, window: int = 252):
+        self.moments = RollingVol(window=window, trading_days=1)
+        self.last = math.nan
+
+    def update(self, value: float) -> float:
+        self.moments.update(value)
+        self.last = value
+
+        return self.value
+
+    @property
+    def value(self) -> float:
+        std = self.moments.value
+
+        if math.isnan(std) or std == 0:
+            return math.nan
+
+        return (self.last - self.moments.mean) / std
+
+
+class LiveMomentumVolTarget:
+    """
+    Incremental momentum x vol-target exposure from one close per update.
+
+    ``update(price)`` returns signal_t x clip(target_vol / vol_t), the
+    exposure to hold over the next bar. Replaying a price history gives
+    the unshifted exposure of ``run_portfolio_momentum`` for that asset.
+    As in ``compute_log_returns``, a NaN price and the bar after it have
+    no return: they give NaN and leave the rolling vol untouched.
+    """
+
+    def __init__(
+        self,
+        vol_window: int = 30,
+        target_vol: float = 0.3,
+        lookback: int = 252,
+        min_exposure: float = 0.0,
+        max_exposure: float = 2.0,
+        trading_days: int = 252
+    ):
+        self.target_vol = target_vol
+        self.min_exposure = min_exposure
+        self.max_exposure = max_exposure
+        self.vol = RollingVol(window=vol_window, trading_days=trading_days)
+        self.signal = MomentumSignal(lookback=lookback)
+        self.last_price = math.nan
+
+    def update(self, price: float) -> float:
+        signal = self.signal.update(price)
+        ret = math.log(price / self.last_price)
+        self.last_price = price
+
+        # No return (first bar, NaN price or the bar after): vol unchanged
+        if math.isnan(ret):
+            return math.nan
+
+        vol = self.vol.update(ret)
+
+        return signal * vol_target_exposure(
+            vol,
+            target_vol=self.target_vol,
+            min_exposure=self.min_exposure,
+            max_exposure=self.max_exposure
+        )
+
+
+class LiveRegimeVolTarget:
+    """
+    Incremental regime strategy exposure from one close per update.
+
+    ``update(price)`` runs rolling vol → rolling z-score of the vol →
+    regime → exposure and returns the exposure to hold over the next bar.
+    Replaying a price history gives the unshifted exposure of
+    ``map_exposure(classify_regime(compute_z_score(vol, mode="rolling",
+    window=z_window), threshold))`` on the ``rolling_annualized_vol`` dates.
+    NaN prices are handled like ``LiveMomentumVolTarget``.
+    """
+
+    def __init__(
+        self,
+        window: int = 30,
+        z_window: int = 252,
+        threshold: float = 0.5,
+        exposure_map: dict | None = None,
+        trading_days: int = 252
+    ):
+        self.threshold = threshold
+        self.exposure_map = exposure_map or {"low_vol": 1.5, "neutral": 1.0, "high_vol": 0.3}
+        self.vol = RollingVol(window=window, trading_days=trading_days)
+        self.z_score = RollingZScore(window=z_window)
+        self.last_price = math.nan
+
+    def update(self, price: float) -> float:
+        ret = math.log(price / self.last_price)
+        self.last_price = price
+
+        # No return (first bar, NaN price or the bar after): vol unchanged
+        if math.isnan(ret):
+            return math.nan
+
+        vol = self.vol.update(ret)
+
+        # The batch z-score starts at the first defined vol
+        if math.isnan(vol):
+            return math.nan
+
+        return self.exposure_map.get(regime_label(self.z_score.update(vol), self.threshold), math.nan)
+
+
+def regime_label(z: float, threshold: float = 0.5) -> str | None:
+    """
+    Scalar version of ``classify_regime`` (None for a NaN z-score).
+    """
+    if math.isnan(z):
+        return None
+
+    if z < -threshold:
+        return "low_vol"
+
+    if z > threshold:
+        return "high_vol"
+
+    return "neutral"
+
+
+def vol_target_exposure(
+    realized_vol: float,
+    target_vol: float = 0.5,
+    min_exposure: float = 0.0,
+    max_exposure: float = 2.0
+) -> float:
+    """
+    Scalar version of ``compute_vol_target_exposure``.
+    """
+    if math.isnan(realized_vol):
+        return math.nan
+
+    if realized_vol == 0:
+        return max_exposure
+
+    return min(max(target_vol / realized_vol, min_exposure), max_exposure)
@@ -0,0 +1,448 @@
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.frequency import annualization
+from src.panel import Panel, pack, unpack, shift_rows, rolling_std
+from src.parallel import imap_shared
+from src.profiling import instrument
+
+
+@instrument
+def run_sweep(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    lookbacks=None,
+    prices: Panel | None = None,
+    max_exposures=(2.0,),
+    min_exposure: float = 0.0,
+    trading_days: int = 252,
+    max_cells: int = 20_000_000,
+    workers: int | None = 1,
+    dtype=None
+) -> pd.DataFrame:
+    """
+    Score a whole vol-target (x momentum) parameter grid in one pass.
+
+    Each rolling vol is computed once per window and each momentum signal
+    once per lookback. Target vols, exposure caps and lookbacks are then
+    broadcast as an extra parameter axis, and CAGR / Sharpe / MaxDD of the
+    equal-weight portfolio come out of one vectorized pass per window.
+
+    Parameters
+    ----------
+    returns : Panel
+        Log returns (dates x assets). The sweep is not out-of-core: a
+        memory-mapped panel (see ``src.panel_store``) is copied into
+        memory several times over (packed returns, rolling vol, the
+        rows of each window), so it must fit in RAM. For larger universes score grid points one at a time
+        with ``run_blocked_momentum``
+    vol_windows, target_vols : sequence
+        Rolling vol windows and target vols
+    lookbacks : sequence, optional
+        Momentum lookbacks; requires ``prices`` on the same calendar.
+        Without lookbacks the strategy is pure vol targeting.
+    prices : Panel, optional
+        Close prices (dates x assets)
+    max_exposures : sequence
+        Exposure caps
+    min_exposure : float
+        Exposure floor
+    trading_days : int, optional
+        Annualization factor (default 252, ``None`` infers it from the
+        bar frequency, see ``src.frequency``)
+    max_cells : int
+        Upper bound on (parameter sets x dates x assets) cells held at once
+    workers : int, optional
+        Processes to spread the windows and blocks of grid points over
+        (default 1, ``None`` uses every core). Output is identical for
+        any worker count.
+    dtype : optional
+        Float type of the returns, vols and exposures (default float64).
+        ``np.float32`` halves the memory of the grid blocks; metrics are
+        still accumulated in float64 (see ``src.compact``).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per grid point, ordered like ``itertools.product`` over
+        (window, target_vol, lookback, max_exposure)
+    """
+    results = pd.concat(
+        iter_sweep(
+            returns,
+            vol_windows,
+            target_vols,
+            lookbacks=lookbacks,
+            prices=prices,
+            max_exposures=max_exposures,
+            min_exposure=min_exposure,
+            trading_days=trading_days,
+            max_cells=max_cells,
+            workers=workers,
+            dtype=dtype
+        ),
+        ignore_index=True
+    )
+
+    if lookbacks is None:
+        results = results.drop(columns="lookback")
+
+    return results
+
+
+def iter_sweep(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    lookbacks=None,
+    prices: Panel | None = None,
+    max_exposures=(2.0,),
+    min_exposure: float = 0.0,
+    trading_days: int = 252,
+    max_cells: int = 20_000_000,
+    workers: int | None = 1,
+    dtype=None
+):
+    """
+    Stream ``run_sweep`` results in order, one DataFrame per task.
+
+    A task is one vol window, or with ``workers > 1`` one block of its
+    (target_vol x lookback x max_exposure) grid points, so a grid with
+    fewer windows than workers still keeps every worker busy. Each task
+    recomputes its window's rolling vol.
+    """
+    trading_days = annualization(trading_days, returns.index)
+    arrays, lookback_axis = _sweep_arrays(returns, lookbacks, prices, dtype)
+
+    targets = np.asarray(target_vols, dtype=float)
+    caps = np.asarray(max_exposures, dtype=float)
+    param_index = _param_index(len(targets), len(lookback_axis), len(caps))
+    vol_windows = list(vol_windows)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # About two tasks per worker over the whole grid, for load balance
+    blocks = 1
+    if workers > 1 and len(vol_windows):
+        blocks = min(len(param_index), -(-2 * workers // len(vol_windows)))
+
+    tasks = [
+        {
+            "window": window,
+            "targets": targets,
+            "lookbacks": lookback_axis,
+            "caps": caps,
+            "params": params,
+            "min_exposure": min_exposure,
+            "trading_days": trading_days,
+            "max_cells": max_cells
+        }
+        for window in vol_windows
+        for params in np.array_split(param_index, blocks)
+    ]
+
+    yield from imap_shared(_sweep_window, tasks, arrays, workers=workers)
+
+
+def sweep_portfolio_returns(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    lookbacks=None,
+    prices: Panel | None = None,
+    max_exposures=(2.0,),
+    min_exposure: float = 0.0,
+    trading_days: int = 252,
+    max_cells: int = 20_000_000,
+    dtype=None
+) -> pd.DataFrame:
+    """
+    Equal-weight portfolio return path of every grid point.
+
+    Same strategies as ``run_sweep``, but returns the daily returns
+    instead of summary metrics, on the dates where every grid point is
+    live (i.e. after the longest vol window has warmed up).
+
+    Returns
+    -------
+    pd.DataFrame
+        (dates x grid points), columns indexed by (window, target_vol,
+        lookback, max_exposure) in ``run_sweep`` row order
+    """
+    trading_days = annualization(trading_days, returns.index)
+    arrays, lookback_axis = _sweep_arrays(returns, lookbacks, prices, dtype)
+    targets = np.asarray(target_vols, dtype=float)
+    caps = np.asarray(max_exposures, dtype=float)
+    param_index = _param_index(len(targets), len(lookback_axis), len(caps))
+
+    # Longer windows warm up later, so the longest one bounds the common rows
+    rows = _window_inputs(arrays, max(vol_windows), trading_days)[0]
+
+    paths = []
+    columns = []
+
+    for window in vol_windows:
+        _, window_returns, window_vol, window_signals = _window_inputs(
+            arrays, window, trading_days, rows=rows
+        )
+        block = max(1, int(max_cells // max(window_returns.size, 1)))
+
+        for chunk in np.array_split(param_index, -(-len(param_index) // block)):
+            paths.append(_portfolio_block(
+                window_returns,
+                window_vol,
+                window_signals,
+                targets[chunk[:, 0]],
+                None if window_signals is None else chunk[:, 1],
+                caps[chunk[:, 2]],
+                min_exposure
+            ))
+
+        columns.extend(
+            (window, targets[t], lookback_axis[l], caps[c])
+            for t, l, c in param_index
+        )
+
+    columns = pd.MultiIndex.from_tuples(
+        columns,
+        names=["window", "target_vol", "lookback", "max_exposure"]
+    )
+
+    paths = pd.DataFrame(np.concatenate(paths).T, index=returns.index[rows], columns=columns)
+
+    if lookbacks is None:
+        paths.columns = paths.columns.droplevel("lookback")
+
+    return paths
+
+
+def iter_window_paths(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    lookbacks=None,
+    prices: Panel | None = None,
+    max_exposures=(2.0,),
+    min_exposure: float = 0.0,
+    trading_days: int = 252,
+    max_cells: int = 20_000_000,
+    dtype=None
+):
+    """
+    Daily portfolio returns of every grid point, one vol window at a time.
+
+    Unlike ``sweep_portfolio_returns``, each window keeps its own live
+    dates: the rows ``run_sweep`` scores for it.
+
+    Yields
+    ------
+    params : pd.DataFrame
+        window, target_vol, lookback, max_exposure of each path
+    dates : pd.DatetimeIndex
+    paths : np.ndarray
+        (grid points x dates) portfolio returns
+    """
+    trading_days = annualization(trading_days, returns.index)
+    arrays, lookback_axis = _sweep_arrays(returns, lookbacks, prices, dtype)
+    targets = np.asarray(target_vols, dtype=float)
+    caps = np.asarray(max_exposures, dtype=float)
+    param_index = _param_index(len(targets), len(lookback_axis), len(caps))
+
+    for window in vol_windows:
+        complete, window_returns, window_vol, window_signals = _window_inputs(
+            arrays, window, trading_days
+        )
+        block = max(1, int(max_cells // max(window_returns.size, 1)))
+
+        paths = np.concatenate([
+            _portfolio_block(
+                window_returns,
+                window_vol,
+                window_signals,
+                targets[chunk[:, 0]],
+                None if window_signals is None else chunk[:, 1],
+                caps[chunk[:, 2]],
+                min_exposure
+            )
+            for chunk in np.array_split(param_index, -(-len(param_index) // block))
+        ])
+
+        params = pd.DataFrame({
+            "window": window,
+            "target_vol": targets[param_index[:, 0]],
+            "lookback": [lookback_axis[l] for l in param_index[:, 1]],
+            "max_exposure": caps[param_index[:, 2]]
+        })
+
+        yield params, returns.index[complete], paths
+
+
+def _sweep_window(arrays: dict, task: dict) -> pd.DataFrame:
+    window = task["window"]
+    targets = task["targets"]
+    caps = task["caps"]
+    lookback_axis = task["lookbacks"]
+    trading_days = task["trading_days"]
+
+    param_index = task["params"]
+
+    complete, window_returns, window_vol, window_signals = _window_inputs(
+        arrays, window, trading_days
+    )
+
+    n_dates = int(complete.sum())
+    block = max(1, int(task["max_cells"] // max(window_returns.size, 1)))
+
+    metrics = [
+        _score_block(
+            _portfolio_block(
+                window_returns,
+                window_vol,
+                window_signals,
+                targets[chunk[:, 0]],
+                None if window_signals is None else chunk[:, 1],
+                caps[chunk[:, 2]],
+                task["min_exposure"]
+            ),
+            n_dates,
+            trading_days
+        )
+        for chunk in np.array_split(param_index, -(-len(param_index) // block))
+    ]
+    cagr, sharpe, max_dd = (np.concatenate(m) for m in zip(*metrics))
+
+    return pd.DataFrame({
+        "window": window,
+        "target_vol": targets[param_index[:, 0]],
+        "lookback": [lookback_axis[l] for l in param_index[:, 1]],
+        "max_exposure": caps[param_index[:, 2]],
+        "cagr": cagr,
+        "sharpe": sharpe,
+        "max_dd": max_dd
+    })
+
+
+def _sweep_arrays(returns: Panel, lookbacks, prices: Panel | None, dtype=None):
+    # Inputs shared by every window: packed returns and momentum signals
+    dtype = np.dtype(float if dtype is None else dtype)
+    packed, order, counts = pack(returns.values, returns.mask)
+
+    arrays = {
+        "returns": returns.values.astype(dtype, copy=False),
+        "packed": packed.astype(dtype, copy=False),
+        "order": order,
+        "counts": counts
+    }
+
+    if lookbacks is None:
+        return arrays, [None]
+
+    if prices is None:
+        raise ValueError("Momentum lookbacks require a price panel.")
+
+    signals = _momentum_signals(prices, lookbacks)
+
+    # 0/1 signals as int8 (8x smaller than float); rows where any signal
+    # is still undefined are kept aside as a mask
+    arrays["signal_rows"] = ~np.isnan(signals).any(axis=(0, 2))
+    arrays["signals"] = np.nan_to_num(signals).astype(np.int8)
+
+    return arrays, list(lookbacks)
+
+
+def _param_index(n_targets: int, n_lookbacks: int, n_caps: int) -> np.ndarray:
+    # Parameter axis, flattened in (target, lookback, cap) order
+    return np.array(list(itertools.product(
+        range(n_targets), range(n_lookbacks), range(n_caps)
+    )))
+
+
+def _momentum_signals(prices: Panel, lookbacks) -> np.ndarray:
+    # (lookbacks x dates x assets), lagged one bar like the backtests
+    packed, order, counts = pack(prices.values, prices.mask)
+
+    return np.stack([
+        unpack(shift_rows((packed > shift_rows(packed, lookback)).astype(float)),
+               order, counts)
+        for lookback in lookbacks
+    ])
+
+
+def _window_inputs(arrays: dict, window: int, trading_days: int, rows=None):
+    # Lagged rolling vol of one window and the rows every asset can trade
+    returns = np.asarray(arrays["returns"])
+    signals = arrays.get("signals")
+
+    vol = rolling_std(np.asarray(arrays["packed"], dtype=float), window) * np.sqrt(trading_days)
+    vol = unpack(shift_rows(vol), np.asarray(arrays["order"]), arrays["counts"])
+    vol = vol.astype(returns.dtype, copy=False)
+
+    complete = ~np.isnan(returns * vol).any(axis=1)
+    if signals is not None:
+        signals = np.asarray(signals)
+        complete &= np.asarray(arrays["signal_rows"])
+
+    if rows is None:
+        rows = complete
+
+    window_signals = None
+    if signals is not None:
+        window_signals = signals[:, rows].transpose(0, 2, 1)
+
+    return complete, returns[rows].T, vol[rows].T, window_signals
+
+
+def _portfolio_block(
+    returns,
+    vol,
+    signals,
+    targets,
+    lookback_ids,
+    caps,
+    min_exposure
+):
+    # returns / vol: (assets x dates); parameter sets broadcast in front.
+    # One (parameter sets x assets x dates) buffer, updated in place
+    dtype = vol.dtype
+    with np.errstate(divide="ignore"):
+        exposure = targets.astype(dtype)[:, None, None] / vol[None]
+    np.clip(exposure, min_exposure, caps.astype(dtype)[:, None, None], out=exposure)
+
+    if signals is not None:
+        exposure *= signals[lookback_ids]
+
+    strategy = np.multiply(exposure, returns[None], out=exposure)
+
+    # Add assets one after another, same order as DataFrame.mean(axis=1)
+    portfolio = strategy[:, 0].copy()
+    for j in range(1, strategy.shape[1]):
+        portfolio += strategy[:, j]
+    portfolio /= strategy.shape[1]
+
+    return portfolio
+
+
+def _score_block(portfolio, n_dates, trading_days):
+    # portfolio: (parameter sets x dates), compounded in float64
+    portfolio = portfolio.astype(float, copy=False)
+
+    if n_dates == 0:
+        # No date on which every asset trades: nothing to score
+        empty = np.full(len(portfolio), np.nan)
+        return empty, empty.copy(), empty.copy()
+
+    equity = np.cumprod(1 + portfolio, axis=1)
+
+    years = n_dates / trading_days
+    cagr = np.power(equity[:, -1], 1 / years) - 1
+    sharpe = (
+        portfolio.mean(axis=1) / portfolio.std(axis=1, ddof=1)
+    ) * np.sqrt(trading_days)
+    max_dd = (equity / np.maximum.accumulate(equity, axis=1) - 1).min(axis=1)
+
+    return cagr, sharpe, max_dd
@@ -1,5 +1,10 @@
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
+from src.metrics import compute_all_metrics
+
 
 def compute_turnover(exposure_series: pd.Series) -> pd.Series:
     """
@@ -15,3 +20,160 @@ def annualized_turnover(turnover_series: pd.Series, trading_days: int = 252) ->
     Annualized turnover estimate.
     """
     return turnover_series.mean() * trading_days
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """
+    Cost per unit of exposure traded, for one cost scenario.
+
+    fixed_bps    : commission charged on every asset
+    asset_bps    : extra bps per asset, ``{asset: bps}`` or one value per
+                   exposure column
+    spread_bps   : quoted bid-ask spread; half of it is paid per trade
+    vol_slippage : fraction of the asset's one-period vol paid per trade
+    """
+
+    fixed_bps: float = 0.0
+    asset_bps: dict | tuple | None = None
+    spread_bps: float = 0.0
+    vol_slippage: float = 0.0
+    name: str | None = None
+
+
+def turnover_matrix(exposures: pd.DataFrame) -> pd.DataFrame:
+    """
+    Absolute exposure change per period for every asset (dates x assets).
+
+    Positions are held across the dates an asset is missing, so each change
+    lands on the asset's next observed date: the same turnover as
+    ``compute_turnover`` on every asset's own calendar.
+    """
+    return exposures.ffill().diff().abs().fillna(0)
+
+
+def _static_rates(models, columns) -> np.ndarray:
+    # (scenarios x assets) cost per unit traded, as a fraction
+    rates = np.empty((len(models), len(columns)))
+
+    for k, model in enumerate(models):
+        asset_bps = model.asset_bps
+        if asset_bps is None:
+            asset_bps = 0.0
+        elif isinstance(asset_bps, dict):
+            asset_bps = np.array([asset_bps.get(asset, 0.0) for asset in columns])
+
+        rates[k] = model.fixed_bps + np.asarray(asset_bps, dtype=float) + model.spread_bps / 2
+
+    return rates / 10_000
+
+
+def apply_costs(
+    portfolio_returns: pd.Series,
+    exposures: pd.DataFrame,
+    models,
+    vol: pd.DataFrame | None = None,
+    weights=None,
+    trading_days: int = 252
+) -> dict:
+    """
+    Net returns and metrics of a portfolio under many cost scenarios.
+
+    Every scenario's cost is linear in turnover, so all of them come out
+    of one (dates x assets) @ (assets x scenarios) product plus one shared
+    vol-slippage term: a curve over 100 cost levels costs about as much
+    as a single level.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Gross portfolio returns
+    exposures : pd.DataFrame or dict
+        Per-asset exposures (dates x assets), NaN where an asset has none,
+        or ``{asset: pd.Series}`` on each asset's own calendar
+    models : list of CostModel
+        Cost scenarios
+    vol : pd.DataFrame, optional
+        Annualized per-asset vol, required by models with ``vol_slippage``
+    weights : array-like, optional
+        Portfolio weight of each asset sleeve (default equal weight)
+    trading_days : int
+        Annualization factor (default 252)
+
+    Returns
+    -------
+    dict
+        turnover (annualized, per asset), costs and net_returns
+        (dates x scenarios) and metrics (one row per scenario)
+    """
+    if isinstance(exposures, dict):
+        # Turnover is averaged over each asset's own dates, like
+        # ``annualized_turnover(compute_turnover(series))``
+        periods = pd.Series({asset: len(series) for asset, series in exposures.items()})
+        exposures = pd.DataFrame(exposures)
+    else:
+        periods = len(exposures)
+
+    columns = exposures.columns
+    scenarios = pd.Index(
+        [model.name if model.name is not None else k for k, model in enumerate(models)],
+        name="scenario"
+    )
+
+    if weights is None:
+        weights = np.full(len(columns), 1 / len(columns))
+    weights = np.asarray(weights, dtype=float)
+
+    turnover = turnover_matrix(exposures)
+    annual_turnover = turnover.sum() / periods * trading_days
+
+    traded = turnover.reindex(portfolio_returns.index).fillna(0).to_numpy() * weights
+    costs = traded @ _static_rates(models, columns).T
+
+    slippage = np.array([model.vol_slippage for model in models], dtype=float)
+    if slippage.any():
+        if vol is None:
+            raise ValueError("Models with vol_slippage need a vol panel.")
+
+        period_vol = vol.reindex(columns=columns).reindex(turnover.index).ffill()
+        period_vol = period_vol.reindex(portfolio_returns.index).fillna(0).to_numpy()
+        period_vol = period_vol / np.sqrt(trading_days)
+
+        costs += (traded * period_vol).sum(axis=1)[:, None] * slippage
+
+    net_returns = portfolio_returns.to_numpy()[:, None] - costs
+
+    return {
+        "turnover": annual_turnover,
+        "costs": pd.DataFrame(costs, index=portfolio_returns.index, columns=scenarios),
+        "net_returns": pd.DataFrame(net_returns, index=portfolio_returns.index, columns=scenarios),
+        "metrics": pd.DataFrame(
+            compute_all_metrics(net_returns, trading_days=trading_days),
+            index=scenarios
+        )
+    }
+
+
+def cost_sensitivity(
+    portfolio_returns: pd.Series,
+    exposures: pd.DataFrame,
+    bps_levels,
+    weights=None,
+    trading_days: int = 252
+) -> pd.DataFrame:
+    """
+    Net metrics for a range of flat cost levels (one row per bps level).
+    """
+    models = [CostModel(fixed_bps=bps, name=bps) for bps in bps_levels]
+    result = apply_costs(
+        portfolio_returns,
+        exposures,
+        models,
+        weights=weights,
+        trading_days=trading_days
+    )
+
+    metrics = result["metrics"]
+    metrics.index.name = "cost_bps"
+
+    return metrics
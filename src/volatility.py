@@ -1,11 +1,21 @@
 import numpy as np
 import pandas as pd
 
+from src.panel import Panel, pack, unpack
+from src.panel import rolling_std as rolling_std_rows
+from src.panel_store import DEFAULT_BLOCK_SIZE, map_blocks
+from src.frequency import annualization
+from src.profiling import instrument
+from src.rolling import rolling_stats
 
+
+@instrument
 def rolling_annualized_vol(
     returns: pd.Series,
     window: int = 30,
-    trading_days: int = 252
+    trading_days: int = 252,
+    path=None,
+    block_size: int = DEFAULT_BLOCK_SIZE
 ) -> pd.Series:
     """
     Compute rolling annualized realized volatility.
@@ -16,18 +26,70 @@ def rolling_annualized_vol(
         Log return series
     window : int
         Rolling window length
-    trading_days : int
-        Annualization factor (default 252)
+    trading_days : int, optional
+        Annualization factor (default 252, ``None`` infers it from the
+        bar frequency, see ``src.frequency``)
 
     Returns
     -------
     pd.Series
         Annualized rolling volatility
+
+    A return ``Panel`` gives a vol panel (each asset's own last ``window``
+    returns), computed block by block and optionally written to ``path``
+    like ``compute_log_returns``.
     """
+    trading_days = annualization(trading_days, returns.index)
+
+    if isinstance(returns, Panel):
+        def block_vol(block):
+            packed, order, counts = pack(np.asarray(block.values, dtype=float), block.mask)
+            vol = rolling_std_rows(packed, window) * np.sqrt(trading_days)
+            vol = unpack(vol, order, counts)
+            return vol, ~np.isnan(vol)
+
+        return map_blocks(block_vol, returns, path=path, block_size=block_size)
+
     rolling_std = returns.rolling(window=window).std()
     annualized_vol = rolling_std * np.sqrt(trading_days)
 
     annualized_vol = annualized_vol.dropna()
     annualized_vol.name = f"rolling_vol_{window}"
 
-    return annualized_vol
\ No newline at end of file
+    return annualized_vol
+
+
+@instrument
+def multi_window_vol(
+    returns: pd.Series,
+    windows,
+    trading_days: int = 252,
+    min_periods: int | None = None
+) -> pd.DataFrame:
+    """
+    Rolling annualized volatility for several windows in one pass.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Log return series
+    windows : list of int
+        Rolling window lengths
+    trading_days : int, optional
+        Annualization factor (default 252, ``None`` infers it)
+    min_periods : int, optional
+        Minimum returns per window (default: the window length)
+
+    Returns
+    -------
+    pd.DataFrame
+        One ``rolling_vol_<window>`` column per window, NaN during warm-up
+    """
+    trading_days = annualization(trading_days, returns.index)
+    stats = rolling_stats(returns.to_numpy(dtype=float), windows, min_periods=min_periods)
+
+    return pd.DataFrame(
+        stats["std"].T * np.sqrt(trading_days),
+        index=returns.index,
+        columns=[f"rolling_vol_{window}" for window in windows]
+    )
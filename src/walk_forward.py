@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+
+from src.panel import Panel
+from src.rolling import prefix_sums, range_sums
+from src.sweep import sweep_portfolio_returns
+
+
+def make_folds(
+    n_periods: int,
+    train_size: int,
+    test_size: int,
+    step: int | None = None,
+    anchored: bool = False
+) -> np.ndarray:
+    """
+    Rolling-origin fold boundaries.
+
+    Returns
+    -------
+    np.ndarray
+        (folds x 4) array of [train_start, train_end, test_start, test_end)
+        row positions. ``anchored=True`` keeps every train set starting at
+        row 0 (expanding window); otherwise it rolls with length
+        ``train_size``. Folds start every ``step`` rows (default
+        ``test_size``).
+    """
+    if step is None:
+        step = test_size
+
+    test_starts = np.arange(train_size, n_periods - test_size + 1, step)
+    train_starts = np.zeros_like(test_starts) if anchored else test_starts - train_size
+
+    return np.column_stack([
+        train_starts,
+        test_starts,
+        test_starts,
+        test_starts + test_size
+    ])
+
+
+def prefix_stats(paths: np.ndarray) -> dict:
+    """
+    Blocked prefix sums (see ``src.rolling.prefix_sums``) from which any
+    [a, b) range's metrics follow in O(1), plus the sums of log growth.
+    """
+    return prefix_sums(paths, extra={"log_growth": np.log1p(paths)})
+
+
+def range_metrics(prefix: dict, start, end, columns=None, trading_days: int = 252) -> dict:
+    """
+    Sharpe and CAGR of rows [start, end) from ``prefix_stats`` sums.
+
+    ``start``/``end`` are arrays of row positions (one per fold). Without
+    ``columns`` every column is scored, giving (folds x columns) arrays;
+    with ``columns`` (one per fold) each fold scores one column.
+    """
+    def window(name):
+        return range_sums(prefix, name, start, end, columns=columns)
+
+    shift = prefix["shift"] if columns is None else prefix["shift"][columns]
+
+    n = (np.asarray(end) - np.asarray(start)).astype(float)
+    if columns is None:
+        n = n[:, None]
+
+    total = window("sum")
+    var = (window("sum_sq") - total ** 2 / n) / (n - 1)
+    mean = shift + total / n
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = mean / np.sqrt(np.maximum(var, 0)) * np.sqrt(trading_days)
+
+    cagr = np.exp(window("log_growth") * trading_days / n) - 1
+
+    return {"sharpe": sharpe, "cagr": cagr}
+
+
+def walk_forward(
+    returns: Panel,
+    vol_windows,
+    target_vols,
+    lookbacks=None,
+    prices: Panel | None = None,
+    max_exposures=(2.0,),
+    train_size: int = 756,
+    test_size: int = 126,
+    step: int | None = None,
+    anchored: bool = False,
+    objective: str = "sharpe",
+    trading_days: int = 252
+):
+    """
+    Walk-forward optimization of the vol-target (x momentum) portfolio.
+
+    Every grid point's return path is computed once over the full sample.
+    Each fold then picks the grid point with the best in-sample
+    ``objective`` ("sharpe" or "cagr") and holds it over the following
+    test window. Fold metrics come from prefix sums, so scoring all
+    (fold, grid point) pairs is a handful of array differences.
+
+    Returns
+    -------
+    folds : pd.DataFrame
+        One row per fold: dates, chosen parameters, in-sample score and
+        out-of-sample Sharpe / CAGR / MaxDD
+    oos_returns : pd.Series
+        Stitched out-of-sample portfolio returns
+    """
+    if objective not in ("sharpe", "cagr"):
+        raise ValueError("objective must be 'sharpe' or 'cagr'.")
+
+    paths = sweep_portfolio_returns(
+        returns,
+        vol_windows,
+        target_vols,
+        lookbacks=lookbacks,
+        prices=prices,
+        max_exposures=max_exposures,
+        trading_days=trading_days
+    )
+    values = paths.to_numpy()
+    dates = paths.index
+
+    folds = make_folds(len(values), train_size, test_size, step=step, anchored=anchored)
+    if len(folds) == 0:
+        raise ValueError("Not enough history for a single train/test fold.")
+
+    prefix = prefix_stats(values)
+
+    train = range_metrics(prefix, folds[:, 0], folds[:, 1], trading_days=trading_days)
+    scores = np.where(np.isnan(train[objective]), -np.inf, train[objective])
+    best = scores.argmax(axis=1)
+
+    test = range_metrics(
+        prefix, folds[:, 2], folds[:, 3], columns=best, trading_days=trading_days
+    )
+
+    # Overlapping test windows hand over to the next fold at its start
+    segment_ends = np.append(np.minimum(folds[:-1, 3], folds[1:, 2]), folds[-1, 3])
+
+    rows = []
+    segments = []
+
+    for k, (train_start, train_end, test_start, test_end) in enumerate(folds):
+        fold_returns = values[test_start:test_end, best[k]]
+        equity = np.cumprod(1 + fold_returns)
+        max_dd = (equity / np.maximum.accumulate(equity) - 1).min()
+
+        segments.append(pd.Series(
+            values[test_start:segment_ends[k], best[k]],
+            index=dates[test_start:segment_ends[k]]
+        ))
+
+        row = {
+            "train_start": dates[train_start],
+            "train_end": dates[train_end - 1],
+            "test_start": dates[test_start],
+            "test_end": dates[test_end - 1],
+        }
+        row.update(dict(zip(paths.columns.names, paths.columns[best[k]])))
+        row.update({
+            f"train_{objective}": train[objective][k, best[k]],
+            "test_sharpe": test["sharpe"][k],
+            "test_cagr": test["cagr"][k],
+            "test_max_dd": max_dd
+        })
+        rows.append(row)
+
+    oos_returns = pd.concat(segments)
+    oos_returns.name = "walk_forward_oos"
+
+    return pd.DataFrame(rows), oos_returns
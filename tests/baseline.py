@@ -0,0 +1,151 @@
+"""
+Pandas implementations of the baseline commit, the reference the
+optimized engines must reproduce.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+
+def compute_log_returns(price_series):
+    returns = np.log(price_series / price_series.shift(1))
+    returns = returns.dropna()
+    returns.name = "log_returns"
+
+    return returns
+
+
+def rolling_annualized_vol(returns, window=30, trading_days=252):
+    rolling_std = returns.rolling(window=window).std()
+    annualized_vol = rolling_std * np.sqrt(trading_days)
+
+    annualized_vol = annualized_vol.dropna()
+    annualized_vol.name = f"rolling_vol_{window}"
+
+    return annualized_vol
+
+
+def compute_vol_target_exposure(realized_vol, target_vol=0.5, min_exposure=0.0, max_exposure=2.0):
+    exposure = (target_vol / realized_vol).astype(float)
+    exposure = pd.Series(exposure, index=realized_vol.index)
+
+    exposure = exposure.clip(min_exposure, max_exposure)
+    exposure.name = "vol_target_exposure"
+
+    return exposure
+
+
+def compute_momentum_signal(price_series, lookback=252):
+    past_price = price_series.shift(lookback)
+    signal = (price_series > past_price).astype(int)
+    signal.name = "momentum_signal"
+
+    return signal
+
+
+def equal_weight_portfolio(returns_dict):
+    aligned = pd.concat(returns_dict.values(), axis=1).dropna()
+    portfolio_returns = aligned.mean(axis=1)
+
+    portfolio_returns.name = "equal_weight_portfolio"
+
+    return portfolio_returns
+
+
+def run_portfolio_momentum(price_dict, returns_dict, vol_window=30, target_vol=0.3, lookback=252):
+    strategy_exposures = {}
+    strategy_returns = {}
+
+    for asset in price_dict.keys():
+        prices = price_dict[asset]
+        returns = returns_dict[asset]
+
+        signal = compute_momentum_signal(prices, lookback=lookback)
+        signal = signal.shift(1).dropna()
+
+        vol = rolling_annualized_vol(returns, window=vol_window)
+        exposure = compute_vol_target_exposure(vol, target_vol=target_vol)
+        exposure = exposure.shift(1).dropna()
+
+        combined_exposure = signal * exposure
+        aligned_returns = returns.align(combined_exposure, join="inner")[0]
+
+        strategy_returns[asset] = aligned_returns * combined_exposure
+        strategy_exposures[asset] = combined_exposure
+
+    portfolio_returns = equal_weight_portfolio(strategy_returns)
+    portfolio_equity = (1 + portfolio_returns).cumprod()
+
+    return portfolio_returns, portfolio_equity, strategy_returns, strategy_exposures
+
+
+def compute_ewma_vol(returns, lambda_=0.94, trading_days=252):
+    var = pd.Series(index=returns.index, dtype=float)
+    var.iloc[0] = returns.iloc[0] ** 2
+
+    for t in range(1, len(returns)):
+        var.iloc[t] = (
+            lambda_ * var.iloc[t-1]
+            + (1 - lambda_) * returns.iloc[t] ** 2
+        )
+
+    vol = np.sqrt(var) * np.sqrt(trading_days)
+    vol.name = "ewma_vol"
+
+    return vol
+
+
+def compute_cagr(equity, trading_days=252):
+    total_return = equity.iloc[-1]
+    n_periods = len(equity)
+    years = n_periods / trading_days
+
+    return total_return ** (1 / years) - 1
+
+
+def compute_sharpe(returns, trading_days=252):
+    mean_return = returns.mean()
+    std_return = returns.std()
+
+    return (mean_return / std_return) * np.sqrt(trading_days)
+
+
+def compute_max_drawdown(equity):
+    running_max = equity.cummax()
+    drawdown = equity / running_max - 1
+
+    return drawdown.min()
+
+
+def vol_target_returns(returns_dict, window, target):
+    strategy_returns = {}
+
+    for asset, returns in returns_dict.items():
+        vol = rolling_annualized_vol(returns, window=window)
+        exposure = compute_vol_target_exposure(vol, target_vol=target)
+        exposure = exposure.shift(1).dropna()
+
+        aligned_returns = returns.align(exposure, join="inner")[0]
+        strategy_returns[asset] = aligned_returns * exposure
+
+    return equal_weight_portfolio(strategy_returns)
+
+
+def run_vol_grid(returns_dict, vol_windows, target_vols):
+    results = []
+
+    for window, target in itertools.product(vol_windows, target_vols):
+        portfolio_returns = vol_target_returns(returns_dict, window, target)
+        portfolio_equity = (1 + portfolio_returns).cumprod()
+
+        results.append({
+            "window": window,
+            "target_vol": target,
+            "cagr": compute_cagr(portfolio_equity),
+            "sharpe": compute_sharpe(portfolio_returns),
+            "max_dd": compute_max_drawdown(portfolio_equity)
+        })
+
+    return pd.DataFrame(results)
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_universe
+from src.alignment import align_series, inner_join, lag, multiply
+
+
+def _series():
+    prices, _ = synthetic_universe(400, 4, seed=6)
+    prices["A1"] = prices["A1"].copy()
+    prices["A1"].iloc[[50, 51, 200]] = np.nan
+
+    return prices
+
+
+@pytest.mark.parametrize("policy", ["union", "intersection"])
+def test_align_series_matches_concat(policy):
+    prices = _series()
+
+    expected = pd.concat(prices, axis=1)
+    if policy == "intersection":
+        common = expected.index
+        for series in prices.values():
+            common = common.intersection(series.index)
+        expected = expected.loc[common]
+
+    result = align_series(prices, policy=policy, keep_nan=True).to_frame()
+
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, check_names=False)
+
+
+def test_inner_join_and_multiply_match_align():
+    prices = _series()
+    left, right = prices["A0"], prices["A1"]
+    expected_left, expected_right = left.align(right, join="inner")
+
+    left_values, right_values, index = inner_join(left, right)
+
+    pd.testing.assert_index_equal(index, expected_left.index)
+    np.testing.assert_array_equal(left_values, expected_left.to_numpy())
+    np.testing.assert_array_equal(right_values, expected_right.to_numpy())
+
+    product = expected_left * expected_right
+    pd.testing.assert_series_equal(multiply(left, right), product, check_names=False)
+    pd.testing.assert_series_equal(multiply(left, right, dropna=True), product.dropna(), check_names=False)
+
+
+@pytest.mark.parametrize("periods", [1, 5])
+def test_lag_matches_shift(periods):
+    series = _series()["A1"]
+    signal = (series > series.shift(20)).astype(int)
+
+    pd.testing.assert_series_equal(lag(series, periods), series.shift(periods).dropna())
+    pd.testing.assert_series_equal(lag(signal, periods), signal.shift(periods).dropna())
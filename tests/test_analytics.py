@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+import baseline
+from benchmarks.synthetic import synthetic_returns
+from src.analytics import rolling_performance, subperiod_metrics
+
+
+def test_subperiods_match_pandas():
+    returns = synthetic_returns(1_500, seed=12)
+    returns.iloc[[40, 41, 900]] = np.nan
+
+    metrics = subperiod_metrics(returns, "Y").set_index("period")
+
+    for year, period in returns.groupby(returns.index.year):
+        row = metrics.loc[str(year)]
+        equity = (1 + period.fillna(0.0)).cumprod()
+        np.testing.assert_allclose(row["sharpe"], baseline.compute_sharpe(period), rtol=1e-10)
+        np.testing.assert_allclose(row["total_return"], equity.iloc[-1] - 1, rtol=1e-10)
+        np.testing.assert_allclose(row["max_dd"], baseline.compute_max_drawdown(equity), rtol=1e-10)
+
+
+def test_rolling_stays_exact_on_long_series():
+    rng = np.random.default_rng(2)
+    index = pd.date_range("1990-01-01", periods=300_000, freq="h")
+    returns = pd.Series(0.0004 + 0.01 * rng.standard_normal(len(index)), index=index)
+    returns.iloc[:150_000] += 0.003
+    returns.iloc[rng.integers(0, len(index), 500)] = np.nan
+
+    metrics = rolling_performance(returns, 252, min_periods=200)
+
+    for t in range(280_000, 300_000, 1_001):
+        window = returns.iloc[t - 251:t + 1].dropna()
+        row = metrics.iloc[t]
+        np.testing.assert_allclose(row["sharpe"], baseline.compute_sharpe(window), rtol=1e-11)
+        np.testing.assert_allclose(row["cagr"], np.prod(1 + window) - 1, rtol=1e-11)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.bars import resample_bars
+
+
+def _ticks(tz=None, n=3000):
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq="min", tz=tz)
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 1e-3, n)))
+
+    return pd.DataFrame({"close": close}, index=index)
+
+
+@pytest.mark.parametrize("tz", [None, "America/New_York"])
+@pytest.mark.parametrize("rule", ["1h", "1D"])
+def test_matches_pandas_resample(tz, rule):
+    ticks = _ticks(tz)
+
+    bars = resample_bars(ticks, rule, chunk_rows=700)
+    expected = ticks["close"].resample(rule).ohlc().dropna()
+
+    assert bars.index.equals(expected.index)
+    np.testing.assert_array_equal(bars[["open", "high", "low", "close"]].to_numpy(), expected.to_numpy())
+    assert bars["count"].sum() == len(ticks)
+
+
+def test_unsorted_input_raises():
+    ticks = _ticks()
+
+    with pytest.raises(ValueError, match="sorted"):
+        resample_bars(ticks.iloc[::-1], "1h")
+
+    with pytest.raises(ValueError, match="sorted"):
+        resample_bars([ticks.iloc[100:200], ticks.iloc[:100]], "1h")
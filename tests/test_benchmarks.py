@@ -0,0 +1,46 @@
+from benchmarks.run_benchmarks import baseline_timings
+
+
+ANCESTORS = ["c" * 40, "b" * 40, "a" * 40]
+
+
+def _record(commit, case, seconds, machine="box"):
+    return {"commit": commit, "case": case, "seconds": seconds, "machine": machine}
+
+
+def test_nearest_ancestor_wins():
+    history = [
+        _record("ccccccc", "grid", 1.0),
+        _record("aaaaaaa", "grid", 3.0),
+        _record("aaaaaaa", "ewma", 4.0),
+        _record("bbbbbbb", "grid", 2.0),
+        _record("ccccccc", "grid", 1.5),
+        _record("ccccccc", "grid", 9.0, machine="other"),
+    ]
+
+    timings = baseline_timings(history, "ddddddd", "box", ancestors=ANCESTORS)
+
+    assert timings == {"grid": 1.5, "ewma": 4.0}
+
+
+def test_later_and_unrelated_commits_are_ignored():
+    history = [
+        _record("bbbbbbb", "grid", 2.0),
+        _record("eeeeeee", "grid", 0.5),
+        _record("ddddddd", "grid", 0.7),
+    ]
+
+    timings = baseline_timings(history, "ddddddd", "box", ancestors=ANCESTORS)
+
+    assert timings == {"grid": 2.0}
+
+
+def test_explicit_baseline():
+    history = [
+        _record("aaaaaaa", "grid", 3.0),
+        _record("eeeeeee", "grid", 0.5),
+        _record("ccccccc", "grid", 1.0),
+    ]
+
+    assert baseline_timings(history, "ddddddd", "box", baseline="eee", ancestors=ANCESTORS) == {"grid": 0.5}
+    assert baseline_timings(history, "ddddddd", "box", baseline="aaa", ancestors=ANCESTORS) == {"grid": 3.0}
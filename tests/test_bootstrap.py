@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_returns
+from src.bootstrap import bootstrap_indices, bootstrap_metrics, confidence_intervals
+
+
+def test_same_seed_same_draws():
+    returns = synthetic_returns(500, seed=13)
+
+    first = bootstrap_metrics(returns, n_paths=300, chunk_size=100, seed=7)
+    again = bootstrap_metrics(returns, n_paths=300, chunk_size=100, seed=7)
+    parallel = bootstrap_metrics(returns, n_paths=300, chunk_size=100, seed=7, workers=2)
+    other = bootstrap_metrics(returns, n_paths=300, chunk_size=100, seed=8)
+
+    pd.testing.assert_frame_equal(again, first)
+    pd.testing.assert_frame_equal(parallel, first)
+    assert not np.allclose(other.to_numpy(), first.to_numpy())
+
+
+def _runs(rows, n_rows):
+    # Lengths of the runs of consecutive rows (wrapping around the end)
+    breaks = np.flatnonzero((rows[1:] - rows[:-1]) % n_rows != 1) + 1
+    return np.diff(np.concatenate([[0], breaks, [len(rows)]]))
+
+
+def test_block_lengths():
+    block = bootstrap_indices(1_000, 50, method="block", block_size=25, rng=1)
+    # Adjacent blocks can continue each other, so runs are multiples of 25
+    for rows in block:
+        assert (_runs(rows, 1_000) % 25 == 0).all()
+
+    stationary = bootstrap_indices(1_000, 200, method="stationary", block_size=25, rng=1)
+    starts = (np.diff(stationary, axis=1) % 1_000 != 1).sum() + len(stationary)
+    assert stationary.size / starts == pytest.approx(25, rel=0.1)
+
+
+@pytest.mark.parametrize("method", ["block", "stationary"])
+def test_block_size_below_one_raises(method):
+    with pytest.raises(ValueError, match="block_size"):
+        bootstrap_indices(100, 10, method=method, block_size=0.5)
+
+
+def test_interval_coverage_on_a_known_distribution():
+    rng = np.random.default_rng(3)
+    samples = pd.DataFrame({"x": rng.standard_normal(200_000)})
+
+    intervals = confidence_intervals(samples, point={"x": 0.0}, level=0.9)
+
+    assert intervals.loc["x", "point"] == 0.0
+    assert intervals.loc["x", "lower"] == pytest.approx(-1.6449, abs=0.02)
+    assert intervals.loc["x", "upper"] == pytest.approx(1.6449, abs=0.02)
+    assert intervals.loc["x", "std"] == pytest.approx(1.0, abs=0.01)
+
+    # iid draws around a known vol: the bootstrap interval covers it
+    returns = pd.Series(rng.standard_normal(2_000) * 0.2 / np.sqrt(252))
+    vol = confidence_intervals(bootstrap_metrics(returns, n_paths=500, method="iid", seed=0)).loc["vol"]
+    assert vol["lower"] < 0.2 < vol["upper"]
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_universe
+from src import cache
+from src.data_loader import load_data, set_default_store
+from src.grid import run_vol_grid
+from src.momentum import compute_momentum_signal
+from src.portfolio_momentum import run_portfolio_momentum
+from src.price_store import LocalFileProvider, PriceStore
+from src.returns import compute_log_returns
+from src.volatility import rolling_annualized_vol
+
+
+START, END = "1990-01-01", "1992-01-01"
+ASSETS = (("A", "A0"), ("B", "A1"))
+
+
+@pytest.fixture
+def offline_store(tmp_path):
+    prices, _ = synthetic_universe(700, 2, seed=15)
+    for asset, close in prices.items():
+        close.rename("Close").rename_axis("Date").to_csv(tmp_path / f"{asset}.csv")
+
+    set_default_store(PriceStore(tmp_path / "prices", LocalFileProvider(tmp_path)))
+    cache.clear_cache()
+    yield
+    cache.clear_cache()
+    set_default_store(None)
+
+
+def test_cached_builders_match_uncached(offline_store):
+    prices = {name: load_data(ticker, START, END) for name, ticker in ASSETS}
+    returns = {name: compute_log_returns(close) for name, close in prices.items()}
+
+    pd.testing.assert_series_equal(cache.cached_returns("A0", START, END), returns["A"])
+    pd.testing.assert_series_equal(
+        cache.cached_vol("A0", START, END, 20), rolling_annualized_vol(returns["A"], window=20)
+    )
+    pd.testing.assert_series_equal(
+        cache.cached_signal("A0", START, END, 60), compute_momentum_signal(prices["A"], lookback=60)
+    )
+
+    portfolio = cache.cached_portfolio_momentum(ASSETS, START, END, 20, 0.3, 60)
+    expected = run_portfolio_momentum(prices, returns, vol_window=20, target_vol=0.3, lookback=60)
+    pd.testing.assert_series_equal(portfolio[0], expected[0])
+    pd.testing.assert_series_equal(portfolio[1], expected[1])
+
+    grid = cache.cached_vol_grid(ASSETS, START, END, (20, 40), (0.2, 0.5))
+    pd.testing.assert_frame_equal(grid, run_vol_grid(returns, [20, 40], [0.2, 0.5]))
+
+
+def test_repeated_calls_share_one_object(offline_store):
+    assert cache.cached_returns("A0", START, END) is cache.cached_returns("A0", START, END)
+    assert cache.cached_vol_grid(ASSETS, START, END, (20,), (0.3,)) is \
+        cache.cached_vol_grid(ASSETS, START, END, (20,), (0.3,))
+
+    first = cache.cached_returns("A0", START, END)
+    cache.clear_cache()
+    assert cache.cached_returns("A0", START, END) is not first
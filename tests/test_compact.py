@@ -0,0 +1,35 @@
+import numpy as np
+
+from benchmarks.synthetic import synthetic_universe
+from src.compact import sweep_tolerance
+from src.grid import run_vol_grid
+from src.panel import Panel
+from src.sweep import sweep_portfolio_returns
+
+
+def test_float32_grid_within_tolerance():
+    _, returns = synthetic_universe(1_500, 12, seed=3)
+    windows, targets = [20, 60], [0.2, 0.5]
+
+    exact = run_vol_grid(returns, windows, targets)
+    compact = run_vol_grid(returns, windows, targets, dtype=np.float32)
+
+    for metric in ("cagr", "sharpe", "max_dd"):
+        # Compact mode really ran, within the documented 1e-6 relative
+        assert not np.array_equal(compact[metric], exact[metric])
+        np.testing.assert_allclose(compact[metric], exact[metric], rtol=1e-6)
+
+    tolerance = sweep_tolerance(Panel.from_dict(returns), windows, targets)
+    assert (tolerance["max_rel_error"] < 1e-6).all()
+
+
+def test_float32_paths_stay_float32():
+    _, returns = synthetic_universe(600, 4, seed=5)
+    returns = Panel.from_dict(returns)
+
+    paths = sweep_portfolio_returns(returns, [20, 30], [0.3], dtype=np.float32)
+    exact = sweep_portfolio_returns(returns, [20, 30], [0.3])
+
+    assert (paths.dtypes == np.float32).all()
+    assert (exact.dtypes == np.float64).all()
+    np.testing.assert_allclose(paths, exact, rtol=1e-5, atol=1e-8)
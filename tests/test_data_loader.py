@@ -0,0 +1,127 @@
+import sys
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.data_loader import YFinanceProvider, load_many
+from src.price_store import LocalFileProvider, PriceStore
+
+
+class BatchProvider:
+    """Drops ``flaky`` from the first ``failures`` batches, like yfinance."""
+
+    def __init__(self, prices, flaky, failures):
+        self.prices = prices
+        self.flaky = flaky
+        self.failures = failures
+        self.requests = []
+
+    def fetch(self, ticker, start, end):
+        raise AssertionError("load_many should batch")
+
+    def fetch_many(self, tickers, start, end):
+        self.requests.append(list(tickers))
+        served = {
+            ticker: close.loc[(close.index >= start) & (close.index < end)]
+            for ticker, close in self.prices.items() if ticker in tickers
+        }
+        if len(self.requests) <= self.failures:
+            served.pop(self.flaky, None)
+
+        return served
+
+
+def _prices():
+    index = pd.bdate_range("2020-01-01", "2020-06-30", name="Date")
+    return {
+        ticker: pd.Series(range(1, len(index) + 1), index=index, dtype=float, name=ticker)
+        for ticker in ("A", "B")
+    }
+
+
+def test_missing_ticker_is_retried(tmp_path):
+    provider = BatchProvider(_prices(), flaky="B", failures=2)
+    store = PriceStore(tmp_path, provider)
+
+    panel = load_many(["A", "B"], "2020-01-01", "2020-07-01", store=store, backoff=0.0)
+
+    assert provider.requests == [["A", "B"], ["B"], ["B"]]
+    assert panel.to_frame()["B"].notna().all()
+
+
+def test_exhausted_retries_are_not_covered(tmp_path):
+    provider = BatchProvider(_prices(), flaky="B", failures=10)
+    store = PriceStore(tmp_path, provider)
+
+    with pytest.raises(ValueError, match="B"):
+        load_many(["A", "B"], "2020-01-01", "2020-07-01", store=store, retries=1, backoff=0.0)
+
+    assert store.missing_ranges("A", "2020-01-01", "2020-07-01") == []
+    assert store.missing_ranges("B", "2020-01-01", "2020-07-01") == [("2020-01-01", "2020-07-01")]
+
+
+class FakeYFinance:
+    """Resets and reads module globals on every download, like yf.download."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.shared = SimpleNamespace(_DFS={}, _ERRORS={})
+
+    def download(self, tickers, start, end, progress=True, threads=True):
+        self.shared._DFS = {}
+        self.shared._ERRORS = {}
+
+        for ticker in [tickers] if isinstance(tickers, str) else tickers:
+            close = self.prices[ticker]
+            self.shared._DFS[ticker] = close.loc[(close.index >= start) & (close.index < end)]
+            time.sleep(0.002)
+
+        if not self.shared._DFS:
+            return pd.DataFrame()
+
+        return pd.concat(
+            {("Close", ticker): close for ticker, close in self.shared._DFS.items()}, axis=1
+        )
+
+
+def test_concurrent_yfinance_batches_do_not_mix(tmp_path, monkeypatch):
+    index = pd.bdate_range("2020-01-01", "2020-06-30", name="Date")
+    prices = {
+        f"T{k}": pd.Series(range(len(index)), index=index, dtype=float, name=f"T{k}") + 1000 * k
+        for k in range(8)
+    }
+    monkeypatch.setitem(sys.modules, "yfinance", FakeYFinance(prices))
+    store = PriceStore(tmp_path, YFinanceProvider())
+
+    panel = load_many(list(prices), "2020-01-01", "2020-07-01", store=store, batch_size=2, max_workers=4, retries=0)
+
+    pd.testing.assert_frame_equal(
+        panel.to_frame(), pd.DataFrame(prices), check_freq=False, check_names=False
+    )
+
+
+class CountingFileProvider(LocalFileProvider):
+    def __init__(self, root):
+        super().__init__(root)
+        self.calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((start, end))
+        return super().fetch(ticker, start, end)
+
+
+def test_empty_answer_is_not_retried(tmp_path):
+    _prices()["A"].to_csv(tmp_path / "A.csv")
+    provider = CountingFileProvider(tmp_path)
+    store = PriceStore(tmp_path / "store", provider)
+    store.get("A", "2020-01-01", "2020-06-27")
+
+    # Saturday to Monday: an empty but successful answer
+    started = time.monotonic()
+    load_many(["A"], "2020-01-01", "2020-06-29", store=store, backoff=5.0)
+
+    assert time.monotonic() - started < 1.0
+    assert provider.calls[1:] == [("2020-06-27", "2020-06-29")]
+    assert store.missing_ranges("A", "2020-01-01", "2020-06-29") == []
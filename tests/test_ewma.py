@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+import baseline
+from benchmarks.synthetic import synthetic_returns
+from src.ewma import compute_ewma_vol
+
+
+def test_series_matches_baseline():
+    returns = synthetic_returns(3_000, seed=2)
+
+    pd.testing.assert_series_equal(
+        compute_ewma_vol(returns, 0.94), baseline.compute_ewma_vol(returns, 0.94), rtol=1e-12
+    )
+
+
+def test_frame_and_lambdas_match_baseline():
+    returns = synthetic_returns(1_000, 3, seed=5)
+    lambdas = [0.9, 0.94, 0.97]
+
+    vol = compute_ewma_vol(returns, lambdas)
+
+    assert vol.shape == (len(returns), len(lambdas) * returns.shape[1])
+    for lambda_ in lambdas:
+        frame = compute_ewma_vol(returns, lambda_)
+        for asset in returns.columns:
+            expected = baseline.compute_ewma_vol(returns[asset], lambda_)
+            np.testing.assert_allclose(vol[(lambda_, asset)], expected, rtol=1e-12)
+            np.testing.assert_allclose(frame[asset], expected, rtol=1e-12)
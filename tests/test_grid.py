@@ -0,0 +1,17 @@
+import numpy as np
+
+import baseline
+from benchmarks.synthetic import synthetic_universe
+from src.grid import run_vol_grid
+
+
+def test_matches_baseline():
+    _, returns = synthetic_universe(800, 4, seed=7)
+    windows, targets = [20, 30, 60], [0.2, 0.5]
+
+    result = run_vol_grid(returns, windows, targets)
+    expected = baseline.run_vol_grid(returns, windows, targets)
+
+    assert result[["window", "target_vol"]].values.tolist() == expected[["window", "target_vol"]].values.tolist()
+    for name in ("cagr", "sharpe", "max_dd"):
+        np.testing.assert_allclose(result[name], expected[name], rtol=1e-9)
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import src
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _imported_after(code):
+    script = f"import sys\n{code}\nprint(sorted(m for m in ('yfinance', 'pyarrow') if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_defers_heavy_dependencies():
+    assert _imported_after("import src") == "[]"
+    # pandas loads pyarrow itself when installed, yfinance waits for a download
+    assert "yfinance" not in _imported_after("from src import load_data, load_many, run_vol_grid")
+
+
+def test_every_export_resolves():
+    for name in src.__all__:
+        assert getattr(src, name).__name__ == name
+
+    assert set(src.__all__) <= set(dir(src))
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.metrics import (
+    compute_all_metrics,
+    compute_annualized_vol,
+    compute_cagr,
+    compute_max_drawdown,
+    compute_sharpe
+)
+
+
+def _returns(seed=0, n=500):
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.normal(0.0003, 0.01, n), index=pd.bdate_range("2020-01-01", periods=n))
+
+
+def _reference(returns):
+    equity = (1 + returns).cumprod()
+    return {
+        "cagr": compute_cagr(equity),
+        "vol": compute_annualized_vol(returns),
+        "sharpe": compute_sharpe(returns),
+        "max_dd": compute_max_drawdown(equity)
+    }
+
+
+@pytest.mark.parametrize("nan_rows", [[], [250], [0, 17, 18, 300]])
+def test_matches_pandas_metrics(nan_rows):
+    returns = _returns()
+    returns.iloc[nan_rows] = np.nan
+
+    metrics = compute_all_metrics(returns)
+
+    for name, expected in _reference(returns).items():
+        assert metrics[name] == pytest.approx(expected, rel=1e-12), name
+
+
+def test_columns_skip_their_own_nans():
+    frame = pd.DataFrame({"a": _returns(1), "b": _returns(2)})
+    frame.iloc[10, 0] = np.nan
+
+    metrics = compute_all_metrics(frame.to_numpy())
+
+    for k, column in enumerate(frame):
+        for name, expected in _reference(frame[column]).items():
+            assert metrics[name][k] == pytest.approx(expected, rel=1e-12)
+
+
+def test_inferred_annualization():
+    returns = _returns()
+    crypto = returns.set_axis(pd.date_range("2020-01-01", periods=len(returns), freq="D"))
+
+    assert compute_all_metrics(returns, trading_days=None) == compute_all_metrics(returns)
+    assert compute_all_metrics(crypto, trading_days=None) == compute_all_metrics(crypto, trading_days=365)
+    assert compute_sharpe(crypto, trading_days=None) == compute_sharpe(crypto, trading_days=365)
+
+    with pytest.raises(ValueError):
+        compute_all_metrics(returns.to_numpy(), trading_days=None)
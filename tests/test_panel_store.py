@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_universe
+from src.panel import Panel
+from src.panel_store import create_panel, iter_blocks, map_blocks, open_panel, save_panel
+from src.portfolio_momentum import run_blocked_momentum, run_panel_momentum
+from src.returns import compute_log_returns
+
+
+def _prices():
+    prices, _ = synthetic_universe(600, 7, seed=11)
+    return Panel.from_dict(prices)
+
+
+def test_create_and_open(tmp_path):
+    index = pd.bdate_range("2020-01-01", periods=10)
+    panel = create_panel(tmp_path / "p", index, ["a", "b", "c"], dtype="float32")
+    panel.values[:, 1] = np.arange(10)
+    panel.mask[:, 1] = True
+    panel.values.flush()
+    panel.mask.flush()
+
+    opened = open_panel(tmp_path / "p")
+
+    assert isinstance(opened.values, np.memmap)
+    assert opened.values.dtype == np.float32
+    assert list(opened.columns) == ["a", "b", "c"]
+    pd.testing.assert_index_equal(opened.index, index)
+    np.testing.assert_array_equal(opened.values[:, 1], np.arange(10))
+    assert np.isnan(opened.values[:, [0, 2]]).all()
+    assert opened.mask[:, 1].all() and not opened.mask[:, [0, 2]].any()
+
+
+def test_map_blocks_on_disk_matches_in_memory(tmp_path):
+    prices = _prices()
+
+    def double(block):
+        return block.values * 2, block.mask
+
+    in_memory = map_blocks(double, prices, block_size=3)
+    on_disk = map_blocks(double, prices, path=tmp_path / "double", block_size=3)
+
+    assert len(list(iter_blocks(prices, 3))) == 3
+    np.testing.assert_array_equal(on_disk.values, in_memory.values)
+    np.testing.assert_array_equal(on_disk.mask, prices.mask)
+    np.testing.assert_array_equal(in_memory.values, prices.values * 2)
+
+
+def test_blocked_momentum_matches_in_memory(tmp_path):
+    prices = _prices()
+    returns = compute_log_returns(prices)
+
+    stored_prices = save_panel(tmp_path / "prices", prices)
+    stored_returns = compute_log_returns(stored_prices, path=tmp_path / "returns", block_size=2)
+    np.testing.assert_array_equal(stored_returns.values, returns.values)
+
+    params = {"vol_window": 20, "target_vol": 0.3, "lookback": 60}
+    expected = run_panel_momentum(prices, returns, **params)
+    result = run_blocked_momentum(stored_prices, stored_returns, block_size=3, **params)
+
+    pd.testing.assert_series_equal(result[0], expected[0], check_freq=False)
+    pd.testing.assert_series_equal(result[1], expected[1], check_freq=False)
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_universe
+from src.data_loader import set_default_store
+from src.price_store import LocalFileProvider, PriceStore
+from src.pipeline import run_config
+
+
+@pytest.fixture
+def offline_store(tmp_path):
+    prices, _ = synthetic_universe(700, 3, seed=1)
+    fixtures = tmp_path / "fixtures"
+    fixtures.mkdir()
+    for asset, close in prices.items():
+        close.rename("Close").rename_axis("Date").to_csv(fixtures / f"{asset}.csv")
+
+    set_default_store(PriceStore(tmp_path / "prices", LocalFileProvider(fixtures)))
+    yield
+    set_default_store(None)
+
+
+def _config(**entry):
+    return {
+        "start": "1990-01-01",
+        "end": "1992-01-01",
+        "assets": {"A": "A0", "B": "A1", "C": "A2"},
+        "strategies": [{
+            "name": "Portfolio", "type": "portfolio_momentum", "assets": ["A", "B", "C"],
+            "vol_window": 20, "target_vol": 0.3, "lookback": 60, **entry
+        }]
+    }
+
+
+def test_portfolio_momentum_uses_result_store(offline_store, tmp_path):
+    expected = run_config(_config())[0]["returns"]
+
+    config = {**_config(), "results_dir": str(tmp_path / "results")}
+    first = run_config(config)[0]["returns"]
+    second = run_config(config)[0]["returns"]
+
+    assert list((tmp_path / "results" / "portfolio_momentum").iterdir())
+    pd.testing.assert_series_equal(first, expected, check_freq=False, check_names=False)
+    pd.testing.assert_series_equal(second, expected, check_freq=False, check_names=False)
+
+
+def test_cost_report_bypasses_result_store(offline_store, tmp_path):
+    config = {**_config(cost_bps=10), "results_dir": str(tmp_path / "results")}
+
+    report = run_config(config)[0]
+
+    assert "net_metrics" in report
+    assert not (tmp_path / "results").exists()
+
+
+def test_entry_without_assets_is_rejected(offline_store):
+    config = _config()
+    del config["strategies"][0]["assets"]
+
+    with pytest.raises(ValueError, match="'Portfolio' needs 'asset' or 'assets'"):
+        run_config(config)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from benchmarks.synthetic import synthetic_universe
+from src.portfolio_momentum import run_portfolio_momentum
+
+
+def _universe(nan_prices=0, seed=0):
+    prices, _ = synthetic_universe(900, 4, seed=seed)
+
+    rng = np.random.default_rng(seed)
+    for asset in list(prices)[:2]:
+        rows = rng.choice(np.arange(300, len(prices[asset])), nan_prices, replace=False)
+        prices[asset] = prices[asset].copy()
+        prices[asset].iloc[rows] = np.nan
+
+    returns = {asset: baseline.compute_log_returns(price) for asset, price in prices.items()}
+
+    return prices, returns
+
+
+@pytest.mark.parametrize("nan_prices", [0, 5])
+def test_matches_baseline(nan_prices):
+    prices, returns = _universe(nan_prices)
+    params = {"vol_window": 30, "target_vol": 0.3, "lookback": 120}
+
+    expected = baseline.run_portfolio_momentum(prices, returns, **params)
+    result = run_portfolio_momentum(prices, returns, **params)
+
+    pd.testing.assert_series_equal(result[0], expected[0], check_freq=False, check_names=False)
+    pd.testing.assert_series_equal(result[1], expected[1], check_freq=False, check_names=False)
+
+    for asset in prices:
+        for got, want in ((result[2], expected[2]), (result[3], expected[3])):
+            pd.testing.assert_series_equal(
+                got[asset].dropna(), want[asset].dropna(),
+                check_freq=False, check_names=False, check_index_type=False
+            )
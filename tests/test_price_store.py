@@ -0,0 +1,70 @@
+import pandas as pd
+
+from src.price_store import PriceStore
+
+
+class FlakyProvider:
+    """Returns nothing on the first ``failures`` calls, like a failed yfinance download."""
+
+    def __init__(self, close, failures=1):
+        self.close = close
+        self.failures = failures
+        self.calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((start, end))
+        if len(self.calls) <= self.failures:
+            return pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+
+        return self.close.loc[(self.close.index >= start) & (self.close.index < end)]
+
+
+def _close():
+    index = pd.bdate_range("2020-01-01", "2020-12-31", name="Date")
+    return pd.Series(range(1, len(index) + 1), index=index, dtype=float)
+
+
+def test_empty_fetch_is_not_marked_covered(tmp_path):
+    close = _close()
+    provider = FlakyProvider(close)
+    store = PriceStore(tmp_path, provider)
+
+    assert store.get("X", "2020-01-01", "2021-01-01").empty
+    assert store.missing_ranges("X", "2020-01-01", "2021-01-01") == [("2020-01-01", "2021-01-01")]
+
+    prices = store.get("X", "2020-01-01", "2021-01-01")
+    pd.testing.assert_series_equal(prices, close.rename("X"), check_freq=False)
+    assert store.missing_ranges("X", "2020-01-01", "2021-01-01") == []
+    assert len(provider.calls) == 2
+
+
+def test_empty_extension_keeps_old_coverage(tmp_path):
+    close = _close()
+    provider = FlakyProvider(close, failures=0)
+    store = PriceStore(tmp_path, provider)
+    store.get("X", "2020-03-01", "2020-06-01")
+
+    provider.failures = len(provider.calls) + 1
+    prices = store.get("X", "2020-01-01", "2020-06-01")
+
+    assert prices.index[0] == pd.Timestamp("2020-03-02")
+    assert store.missing_ranges("X", "2020-01-01", "2020-06-01") == [("2020-01-01", "2020-03-01")]
+
+    prices = store.get("X", "2020-01-01", "2020-06-01")
+    assert prices.index[0] == pd.Timestamp("2020-01-01")
+    assert store.missing_ranges("X", "2020-01-01", "2020-06-01") == []
+
+
+def test_weekend_top_up_is_covered(tmp_path):
+    close = _close()
+    provider = FlakyProvider(close, failures=0)
+    store = PriceStore(tmp_path, provider)
+    store.get("X", "2020-10-01", "2020-10-17")
+
+    # Saturday to Monday: nothing traded, one request and no retry later
+    prices = store.get("X", "2020-10-01", "2020-10-19")
+    assert prices.index[-1] == pd.Timestamp("2020-10-16")
+    assert store.missing_ranges("X", "2020-10-01", "2020-10-19") == []
+
+    store.get("X", "2020-10-01", "2020-10-19")
+    assert provider.calls[1:] == [("2020-10-17", "2020-10-19")]
@@ -0,0 +1,51 @@
+import threading
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_universe
+from src.grid import run_vol_grid
+from src.metrics import compute_all_metrics
+from src.profiling import profile
+
+
+def _stage(profiler, name):
+    return next(stat for stat in profiler.to_dict()["stages"] if stat["stage"] == name)
+
+
+def test_rows_count_inputs():
+    _, returns = synthetic_universe(400, 3)
+
+    with profile(memory=False) as profiler:
+        run_vol_grid(returns, [20], [0.3])
+        compute_all_metrics(np.zeros((250, 4)))
+
+    assert _stage(profiler, "run_vol_grid")["rows"] == sum(len(r) for r in returns.values())
+    assert _stage(profiler, "compute_all_metrics")["rows"] == 250
+
+
+def test_peak_tracked_on_one_thread():
+    inside = threading.Event()
+    done = threading.Event()
+
+    with profile() as profiler:
+        def other():
+            inside.wait()
+            with profiler.section("other"):
+                np.ones(1000)
+            done.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+
+        with profiler.section("owner"):
+            inside.set()
+            done.wait()
+
+        thread.join()
+
+        with profiler.section("after"):
+            np.ones(1000)
+
+    assert _stage(profiler, "owner")["peak_bytes"] is not None
+    assert _stage(profiler, "other")["peak_bytes"] is None
+    assert _stage(profiler, "after")["peak_bytes"] is not None
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from src.regime import compute_z_score
+
+
+def _long_vol(n=300_000):
+    rng = np.random.default_rng(0)
+    return pd.Series(1e4 + np.cumsum(rng.normal(0, 1, n)) * 0.01 + rng.normal(0, 1e-3, n))
+
+
+def test_rolling_z_score_stays_accurate_on_long_series():
+    vol = _long_vol()
+    window = 30
+
+    windows = np.lib.stride_tricks.sliding_window_view(vol.to_numpy(), window)
+    expected = np.full(len(vol), np.nan)
+    expected[window - 1:] = (
+        (vol.to_numpy()[window - 1:] - windows.mean(axis=1)) / windows.std(axis=1, ddof=1)
+    )
+
+    z = compute_z_score(vol, mode="rolling", window=window)
+
+    np.testing.assert_allclose(z.to_numpy(), expected, rtol=0, atol=1e-8)
+
+
+def test_causal_modes_match_pandas():
+    vol = _long_vol(5_000)
+    vol.iloc[[3, 400, 401]] = np.nan
+
+    for mode, window, moments in [
+        ("expanding", None, vol.expanding(min_periods=2)),
+        ("rolling", 60, vol.rolling(60))
+    ]:
+        z = compute_z_score(vol, mode=mode, window=window)
+        expected = (vol - moments.mean()) / moments.std()
+
+        np.testing.assert_allclose(z.to_numpy(), expected.to_numpy(), rtol=1e-6, atol=1e-9)
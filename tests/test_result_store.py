@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+import src.result_store as result_store
+from benchmarks.synthetic import synthetic_universe
+from src.grid import run_vol_grid
+from src.result_store import ResultStore
+
+
+WINDOWS, TARGETS = [20, 40], [0.2, 0.5]
+
+
+def _head(returns, rows):
+    end = sorted(set().union(*(series.index for series in returns.values())))[rows]
+    return {asset: series[series.index < end] for asset, series in returns.items()}
+
+
+def _spy(monkeypatch):
+    calls = []
+    grid_states = result_store._grid_states
+
+    def spy(returns, vol_windows, target_vols, after, **kwargs):
+        calls.append(after)
+        return grid_states(returns, vol_windows, target_vols, after, **kwargs)
+
+    monkeypatch.setattr(result_store, "_grid_states", spy)
+    return calls
+
+
+def _assert_matches(result, expected):
+    pd.testing.assert_frame_equal(
+        result[["window", "target_vol"]], expected[["window", "target_vol"]], check_dtype=False
+    )
+    for metric in ("cagr", "sharpe", "max_dd"):
+        np.testing.assert_allclose(result[metric], expected[metric], rtol=1e-10)
+
+
+def test_grown_grid_matches_full_recompute(tmp_path, monkeypatch):
+    _, returns = synthetic_universe(800, 3, seed=14)
+    store = ResultStore(tmp_path)
+    calls = _spy(monkeypatch)
+
+    store.vol_grid(_head(returns, 600), WINDOWS, TARGETS)
+    grown = store.vol_grid(returns, WINDOWS, TARGETS)
+    cached = store.vol_grid(returns, WINDOWS, TARGETS)
+
+    # One full pass per window, then one top-up per window, then nothing
+    assert calls[:2] == [None, None]
+    assert len(calls) == 4 and all(after is not None for after in calls[2:])
+    _assert_matches(grown, run_vol_grid(returns, WINDOWS, TARGETS))
+    pd.testing.assert_frame_equal(cached, grown)
+
+
+def test_changed_input_misses_the_cache(tmp_path, monkeypatch):
+    _, returns = synthetic_universe(800, 3, seed=14)
+    store = ResultStore(tmp_path)
+    store.vol_grid(returns, WINDOWS, TARGETS)
+
+    revised = dict(returns)
+    revised["A1"] = returns["A1"].copy()
+    revised["A1"].iloc[300] += 0.05
+
+    calls = _spy(monkeypatch)
+    result = store.vol_grid(revised, WINDOWS, TARGETS)
+
+    assert calls == [None, None]
+    _assert_matches(result, run_vol_grid(revised, WINDOWS, TARGETS))
+
+
+def test_no_common_dates_gives_nan(tmp_path):
+    index = pd.date_range("2020-01-01", periods=100)
+    returns = {
+        "a": pd.Series(0.001, index=index),
+        "b": pd.Series(0.001, index=index + pd.Timedelta(hours=12))
+    }
+
+    result = ResultStore(tmp_path).vol_grid(returns, WINDOWS, TARGETS)
+
+    assert result[["cagr", "sharpe", "max_dd"]].isna().all().all()
+    assert run_vol_grid(returns, WINDOWS, TARGETS)[["cagr", "sharpe", "max_dd"]].isna().all().all()
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import synthetic_returns
+from src.rolling import rolling_stats
+
+
+@pytest.mark.parametrize("min_periods", [None, 5])
+def test_matches_pandas_rolling(min_periods):
+    frame = synthetic_returns(2_000, 3, seed=8)
+    frame.iloc[100:130, 0] = np.nan
+    frame.iloc[::17, 2] = np.nan
+    # A flat stretch, recomputed directly
+    frame.iloc[500:600, 1] = 0.01
+
+    windows = [5, 20, 63, 252]
+    stats = rolling_stats(frame.to_numpy(), windows, min_periods=min_periods)
+
+    for k, window in enumerate(windows):
+        rolling = frame.rolling(window, min_periods=min_periods)
+        np.testing.assert_allclose(stats["mean"][k], rolling.mean(), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(stats["std"][k], rolling.std(), rtol=1e-9, atol=1e-12)
+
+
+def test_expanding_matches_pandas():
+    series = synthetic_returns(1_500, seed=9)
+    series.iloc[[10, 11, 400]] = np.nan
+
+    stats = rolling_stats(series.to_numpy(), [None], min_periods=2)
+    expanding = series.expanding(min_periods=2)
+
+    np.testing.assert_allclose(stats["mean"][0], expanding.mean(), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(stats["std"][0], expanding.std(), rtol=1e-9, atol=1e-12)
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from src.regime import classify_regime
+from src.strategy import map_exposure
+
+
+def _z_scores():
+    rng = np.random.default_rng(5)
+    z = pd.DataFrame(rng.normal(0, 1, (300, 4)), columns=list("abcd"))
+    z.iloc[:10, 1] = np.nan
+
+    return z
+
+
+def test_frame_matches_per_column():
+    regimes = classify_regime(_z_scores())
+
+    exposure = map_exposure(regimes)
+
+    for column in regimes:
+        pd.testing.assert_series_equal(exposure[column], map_exposure(regimes[column]), check_names=False)
+
+
+def test_plain_label_frame():
+    regimes = classify_regime(_z_scores()).astype(object)
+    regimes.iloc[0, 0] = "unknown"
+
+    exposure = map_exposure(regimes, {"low_vol": 2.0, "neutral": 1.0, "high_vol": 0.0})
+
+    assert np.isnan(exposure.iloc[0, 0])
+    assert exposure.iloc[:10, 1].isna().all()
+    assert set(np.unique(exposure.iloc[10:, 1:])) <= {0.0, 1.0, 2.0}
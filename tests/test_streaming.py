@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_universe
+from src.ewma import compute_ewma_vol
+from src.momentum import compute_momentum_signal
+from src.regime import classify_regime, compute_z_score
+from src.returns import compute_log_returns
+from src.strategy import map_exposure
+from src.streaming import EWMAVol, LiveMomentumVolTarget, LiveRegimeVolTarget, RollingVol
+from src.vol_targeting import compute_vol_target_exposure
+from src.volatility import rolling_annualized_vol
+
+
+def _prices():
+    prices, _ = synthetic_universe(1200, 1, seed=4)
+    return prices["A0"]
+
+
+def test_ewma_nan_matches_batch():
+    returns = compute_log_returns(_prices())
+    returns.iloc[[0, 1]] = np.nan
+    returns.iloc[500] = np.nan
+
+    state = EWMAVol()
+    replay = [state.update(r) for r in returns]
+
+    np.testing.assert_allclose(replay, compute_ewma_vol(returns).to_numpy(), rtol=1e-12)
+    assert np.isnan(replay[501:]).all()
+
+
+def test_live_regime_matches_batch():
+    prices = _prices()
+
+    vol = rolling_annualized_vol(compute_log_returns(prices), window=20)
+    z = compute_z_score(vol, mode="rolling", window=120)
+    expected = map_exposure(classify_regime(z, threshold=0.5))
+
+    live = LiveRegimeVolTarget(window=20, z_window=120, threshold=0.5)
+    replay = pd.Series([live.update(price) for price in prices], index=prices.index)
+
+    pd.testing.assert_series_equal(replay.loc[expected.index], expected, check_names=False, check_freq=False)
+    assert replay.drop(expected.index).isna().all()
+
+
+def _nan_prices():
+    prices = _prices().copy()
+    prices.iloc[[300, 301, 650]] = np.nan
+    return prices
+
+
+def test_rolling_vol_recovers_after_nan():
+    returns = compute_log_returns(_prices())
+    returns.iloc[[100, 400, 401]] = np.nan
+
+    state = RollingVol(window=20)
+    replay = pd.Series([state.update(r) for r in returns], index=returns.index)
+    expected = rolling_annualized_vol(returns, window=20)
+
+    np.testing.assert_allclose(replay.loc[expected.index], expected, rtol=1e-9)
+    assert replay.drop(expected.index).isna().all()
+    assert replay.iloc[121:400].notna().all()
+
+
+def test_live_momentum_skips_nan_prices():
+    prices = _nan_prices()
+
+    signal = compute_momentum_signal(prices, lookback=60)
+    vol = rolling_annualized_vol(compute_log_returns(prices), window=20)
+    expected = signal.loc[vol.index] * compute_vol_target_exposure(vol, target_vol=0.3)
+
+    live = LiveMomentumVolTarget(vol_window=20, target_vol=0.3, lookback=60)
+    replay = pd.Series([live.update(price) for price in prices], index=prices.index)
+
+    np.testing.assert_allclose(replay.loc[expected.index], expected, rtol=1e-9)
+    assert replay.drop(expected.index).isna().all()
+
+
+def test_live_regime_skips_nan_prices():
+    prices = _nan_prices()
+
+    vol = rolling_annualized_vol(compute_log_returns(prices), window=20)
+    z = compute_z_score(vol, mode="rolling", window=120)
+    expected = map_exposure(classify_regime(z, threshold=0.5))
+
+    live = LiveRegimeVolTarget(window=20, z_window=120, threshold=0.5)
+    replay = pd.Series([live.update(price) for price in prices], index=prices.index)
+
+    pd.testing.assert_series_equal(replay.loc[expected.index], expected, check_names=False, check_freq=False)
+    assert replay.drop(expected.index).isna().all()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_universe
+from src.panel import Panel
+from src.sweep import iter_sweep, run_sweep
+
+
+def _panels():
+    prices, returns = synthetic_universe(600, 4, seed=3)
+    prices = Panel.from_dict(prices)
+
+    return prices, Panel.from_dict(returns).reindex(prices.index)
+
+
+def test_parallel_blocks_match_serial():
+    prices, returns = _panels()
+    grid = {
+        "vol_windows": [30],
+        "target_vols": [0.2, 0.3, 0.5],
+        "lookbacks": [60, 120],
+        "prices": prices,
+        "max_exposures": [1.0, 2.0]
+    }
+
+    serial = run_sweep(returns, **grid)
+    parallel = run_sweep(returns, workers=2, **grid)
+
+    assert len(list(iter_sweep(returns, workers=2, **grid))) == 4
+    pd.testing.assert_frame_equal(parallel, serial, check_exact=True)
+
+
+def test_no_common_dates_gives_nan_rows():
+    index = pd.date_range("2020-01-01", periods=100)
+    returns = Panel.from_dict({
+        "a": pd.Series(0.001, index=index),
+        "b": pd.Series(0.001, index=index + pd.Timedelta(hours=12))
+    })
+
+    results = run_sweep(returns, [20, 30], [0.3, 0.5])
+
+    assert len(results) == 4
+    assert results[["cagr", "sharpe", "max_dd"]].isna().all().all()
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from benchmarks.synthetic import synthetic_universe
+from src.turnover import CostModel, annualized_turnover, apply_costs, compute_turnover
+
+
+def _portfolio():
+    prices, _ = synthetic_universe(900, 3, seed=2)
+    returns = {asset: baseline.compute_log_returns(price) for asset, price in prices.items()}
+
+    portfolio_returns, _, _, exposures = baseline.run_portfolio_momentum(
+        prices, returns, vol_window=30, target_vol=0.3, lookback=120
+    )
+
+    return portfolio_returns, exposures
+
+
+def test_turnover_matches_annualized_turnover():
+    portfolio_returns, exposures = _portfolio()
+
+    result = apply_costs(portfolio_returns, exposures, [CostModel(fixed_bps=10)])
+
+    for asset, exposure in exposures.items():
+        expected = annualized_turnover(compute_turnover(exposure))
+        assert result["turnover"][asset] == pytest.approx(expected, rel=1e-12)
+
+
+def test_net_returns_match_per_asset_costs():
+    portfolio_returns, exposures = _portfolio()
+
+    result = apply_costs(portfolio_returns, exposures, [CostModel(fixed_bps=10)])
+
+    costs = pd.Series(0.0, index=portfolio_returns.index)
+    for exposure in exposures.values():
+        costs += compute_turnover(exposure).reindex(portfolio_returns.index).fillna(0) * 0.001
+    expected = portfolio_returns - costs / len(exposures)
+
+    np.testing.assert_allclose(result["net_returns"][0].to_numpy(), expected.to_numpy(), rtol=0, atol=1e-15)
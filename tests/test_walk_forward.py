@@ -0,0 +1,68 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from benchmarks.synthetic import synthetic_universe
+from src.panel import Panel
+from src.walk_forward import prefix_stats, range_metrics, walk_forward
+
+
+@pytest.mark.parametrize("objective, anchored", [("sharpe", False), ("cagr", True)])
+def test_matches_brute_force(objective, anchored):
+    _, returns = synthetic_universe(900, 3, seed=4)
+    windows, targets = [20, 40], [0.2, 0.4]
+    train_size, test_size = 250, 100
+
+    folds, oos = walk_forward(
+        Panel.from_dict(returns), windows, targets,
+        train_size=train_size, test_size=test_size, anchored=anchored, objective=objective
+    )
+
+    grid = list(itertools.product(windows, targets))
+    paths = pd.concat(
+        [baseline.vol_target_returns(returns, *point) for point in grid],
+        axis=1, keys=range(len(grid))
+    ).dropna()
+
+    def score(path):
+        if objective == "sharpe":
+            return baseline.compute_sharpe(path)
+        return baseline.compute_cagr((1 + path).cumprod())
+
+    starts = range(train_size, len(paths) - test_size + 1, test_size)
+    assert len(folds) == len(starts)
+
+    for row, test_start in zip(folds.itertuples(), starts):
+        train = paths.iloc[0 if anchored else test_start - train_size:test_start]
+        best = int(np.argmax([score(train[k]) for k in range(len(grid))]))
+        test = paths[best].iloc[test_start:test_start + test_size]
+
+        assert (row.window, row.target_vol) == grid[best]
+        assert row.test_start == test.index[0]
+        assert getattr(row, f"train_{objective}") == pytest.approx(score(train[best]), rel=1e-9)
+        assert row.test_sharpe == pytest.approx(baseline.compute_sharpe(test), rel=1e-9)
+        assert row.test_cagr == pytest.approx(baseline.compute_cagr((1 + test).cumprod()), rel=1e-9)
+        assert row.test_max_dd == pytest.approx(baseline.compute_max_drawdown((1 + test).cumprod()), rel=1e-9)
+        np.testing.assert_allclose(oos.loc[test.index], test, rtol=1e-12)
+
+
+def test_range_metrics_stay_exact_on_long_paths():
+    rng = np.random.default_rng(1)
+    paths = 0.0004 + 0.01 * rng.standard_normal((300_000, 2))
+    paths[:150_000] += 0.003
+
+    starts = np.arange(295_000, 299_900, 997)
+    ends = starts + 60
+    metrics = range_metrics(prefix_stats(paths), starts, ends)
+
+    for k, (start, end) in enumerate(zip(starts, ends)):
+        window = pd.DataFrame(paths[start:end])
+        np.testing.assert_allclose(
+            metrics["sharpe"][k], baseline.compute_sharpe(window), rtol=1e-11
+        )
+        np.testing.assert_allclose(
+            metrics["cagr"][k], baseline.compute_cagr((1 + window).cumprod()), rtol=1e-11
+        )